@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from models.enums.ignore_category import IgnoreCategory
+from models.enums.ignore_type import IgnoreType
+
+
+@dataclass(frozen=True, slots=True)
+class CriteriaVerdict:
+  ignore_type: IgnoreType | None = None
+  ignore_category: IgnoreCategory | None = None
+  ignore_term: str | None = None
+
+  def passes(self) -> bool:
+    return (
+      self.ignore_type is None
+      and self.ignore_category is None
+      and self.ignore_term is None
+    )
+
+  def get_ignore_type(self) -> IgnoreType | None:
+    return self.ignore_type
+
+  def get_ignore_category(self) -> IgnoreCategory | None:
+    return self.ignore_category
+
+  def get_ignore_term(self) -> str | None:
+    return self.ignore_term
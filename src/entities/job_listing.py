@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from datetime import datetime
+import json
+import logging
+from models.enums.language import Language
+from models.enums.pay_period import PayPeriod
+
+
+# Plain parsed values only -- no WebElements -- so listings can be pickled and handed to other threads/processes
+@dataclass(frozen=True, slots=True)
+class JobListing:
+  title: str
+  company: str
+  location: str
+  url: str
+  language: Language
+  min_yoe: int | None = None
+  max_yoe: int | None = None
+  min_pay: float | None = None
+  max_pay: float | None = None
+  pay_period: PayPeriod | None = None
+  description: str | None = None
+  post_time: datetime | None = None
+  # The pay text exactly as the platform showed it, kept so the pay parser can be checked against real listings
+  raw_pay: str | None = None
+
+  def get_min_pay(self) -> float | None:
+    return self.min_pay
+
+  def get_max_pay(self) -> float | None:
+    return self.max_pay
+
+  def get_pay_period(self) -> PayPeriod | None:
+    return self.pay_period
+
+  def get_title(self) -> str:
+    return self.title
+
+  def get_company(self) -> str:
+    return self.company
+
+  def get_location(self) -> str:
+    return self.location
+
+  def get_url(self) -> str:
+    return self.url
+
+  def get_language(self) -> Language:
+    return self.language
+
+  def get_min_yoe(self) -> int | None:
+    return self.min_yoe
+
+  def get_max_yoe(self) -> int | None:
+    return self.max_yoe
+
+  def get_description(self) -> str | None:
+    return self.description
+
+  def get_post_time(self) -> datetime | None:
+    return self.post_time
+
+  def get_raw_pay(self) -> str | None:
+    return self.raw_pay
+
+  def print_all(self) -> None:
+    if self.get_description():
+      description_indentation="\n\n"
+    else:
+      description_indentation="\t"
+    logging.info(
+      "\nTitle:\t\t%s\nCompany:\t%s\nLocation:\t%s\nMin Pay:\t%s\nMax Pay:\t%s\nDescription:%s%s\n",
+      self.get_title(),
+      self.get_company(),
+      self.get_location(),
+      self.get_min_pay(),
+      self.get_max_pay(),
+      description_indentation,
+      self.get_description()
+    )
+
+  def print_most(self) -> None:
+    logging.info(
+      "\n\nPost Time:\t%s\nLanguage:\t%s\n\nTitle:\t\t%s\nCompany:\t%s\nLocation:\t%s\nMin Pay:\t%s\nMax Pay:\t%s\nMin YoE:\t%s\nMax YoE:\t%s\n",   # pylint: disable=line-too-long
+      self.get_post_time(),
+      self.get_language().value,
+      self.get_title(),
+      self.get_company(),
+      self.get_location(),
+      self.get_min_pay(),
+      self.get_max_pay(),
+      self.get_min_yoe(),
+      self.get_max_yoe(),
+    )
+
+  def to_minimal_dict(self) -> dict[str, str | float | None]:
+    return {
+      "title": self.get_title(),
+      "company": self.get_company(),
+      "location": self.get_location()
+    }
+
+  def to_dict(self) -> dict[str, str | float | None]:
+    return {
+      "title": self.get_title(),
+      "company": self.get_company(),
+      "location": self.get_location(),
+      "min_pay": self.get_min_pay(),
+      "max_pay": self.get_max_pay(),
+      "min_yoe": self.get_min_yoe(),
+      "max_yoe": self.get_max_yoe(),
+      "description": self.get_description()
+    }
+
+  def to_minimal_str(self) -> str:
+    return json.dumps(self.to_minimal_dict(), sort_keys=True)
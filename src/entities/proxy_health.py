@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class ProxyHealth:
+  host: str
+  port: int
+  healthy: bool
+  checked_at: datetime
+  connect_latency: float | None = None
+  throughput: float | None = None
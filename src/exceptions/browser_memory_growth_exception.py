@@ -0,0 +1,2 @@
+class BrowserMemoryGrowthException(Exception):
+  pass
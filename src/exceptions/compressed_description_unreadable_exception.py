@@ -0,0 +1,2 @@
+class CompressedDescriptionUnreadableException(Exception):
+  pass
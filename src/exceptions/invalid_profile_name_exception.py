@@ -0,0 +1,2 @@
+class InvalidProfileNameException(Exception):
+  pass
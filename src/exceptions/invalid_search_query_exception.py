@@ -0,0 +1,2 @@
+class InvalidSearchQueryException(Exception):
+  pass
@@ -1,2 +1,12 @@
+from models.enums.platform import Platform
+
+
 class MemoryOverloadException(Exception):
-  pass
+  __platform: Platform
+
+  def __init__(self, platform: Platform, message="Browser memory usage is too high."):
+    super().__init__(message)
+    self.__platform = platform
+
+  def get_platform(self) -> Platform:
+    return self.__platform
@@ -0,0 +1,2 @@
+class UnknownHtmlTextExtractorException(Exception):
+  pass
@@ -9,13 +9,21 @@ import time
 import traceback
 import yaml
 from dacite import from_dict
-from exceptions.memory_overload_exception import MemoryOverloadException
+from exceptions.invalid_search_query_exception import InvalidSearchQueryException
 from exceptions.rate_limited_exception import RateLimitedException
 from exceptions.unknown_platform_exception import UnknownPlatformException
 from models.configs.full_config import FullConfig
 from models.configs.quick_settings import MaxAge
+from models.enums.export_format import ExportFormat
 from models.enums.platform import Platform
 from services.misc.database_manager import DatabaseManager
+from services.misc.description_pipeline import DescriptionPipeline
+from services.misc.html_text_extractor_benchmark import HtmlTextExtractorBenchmark
+from services.misc.pay_parser_benchmark import PayParserBenchmark
+from services.misc.job_fingerprint_set import JobFingerprintSet
+from services.misc.job_listing_archiver import JobListingArchiver
+from services.misc.job_listing_exporter import JobListingExporter
+from services.misc.job_listing_reevaluator import JobListingReevaluator
 from services.misc.proxy_manager import ProxyManager
 from services.misc.selenium_helper import SeleniumHelper
 from services.misc.system_info_manager import SystemInfoManager
@@ -32,7 +40,12 @@ def start() -> None:
   config = from_dict(data_class=FullConfig, data=raw_config)
   parse_args(config)
   database_manager = DatabaseManager(config.system.database)
-  proxy_manager = ProxyManager(config.system.proxies, database_manager)
+  database_manager.index_missing_descriptions(chunk_size=1000)
+  JobListingArchiver(database_manager).run(
+    config.system.database.retention_days,
+    config.system.database.archive_directory
+  )
+  proxy_manager = ProxyManager(config.system.proxies, database_manager, config.system.proxy_health)
   selenium_helper = SeleniumHelper(
     config.system,
     config.quick_settings.bot_behavior.default_page_load_timeout,
@@ -40,6 +53,14 @@ def start() -> None:
   )
   driver = selenium_helper.get_driver()
   language_parser = LanguageParser()
+  current_session_jobs = JobFingerprintSet(config.quick_settings.bot_behavior.session_job_cache_size)
+  description_pipeline = DescriptionPipeline(
+    config.system.description_workers,
+    config.system.description_text_extractor,
+    config.quick_settings,
+    config.universal,
+    config.profiles
+  )
   indeed_orchestration_engine = IndeedOrchestrationEngine(
     driver,
     selenium_helper,
@@ -48,7 +69,10 @@ def start() -> None:
     config.indeed,
     database_manager,
     language_parser,
-    proxy_manager
+    proxy_manager,
+    current_session_jobs,
+    description_pipeline,
+    config.profiles
   )
   glassdoor_orchestration_engine = GlassdoorOrchestrationEngine(
     driver,
@@ -58,7 +82,10 @@ def start() -> None:
     proxy_manager,
     config.universal,
     config.quick_settings,
-    config.glassdoor
+    config.glassdoor,
+    current_session_jobs,
+    description_pipeline,
+    config.profiles
   )
   linkedin_orchestration_engine = LinkedinOrchestrationEngine(
     driver,
@@ -68,17 +95,23 @@ def start() -> None:
     config.universal,
     config.quick_settings,
     config.linkedin,
-    proxy_manager
+    proxy_manager,
+    current_session_jobs,
+    description_pipeline,
+    config.profiles
   )
-  while True:
-    scrape(
-      config,
-      glassdoor_orchestration_engine,
-      indeed_orchestration_engine,
-      linkedin_orchestration_engine,
-      database_manager,
-      proxy_manager
-    )
+  try:
+    while True:
+      scrape(
+        config,
+        glassdoor_orchestration_engine,
+        indeed_orchestration_engine,
+        linkedin_orchestration_engine,
+        database_manager
+      )
+  finally:
+    description_pipeline.shutdown()
+    selenium_helper.shutdown()
 
 def parse_args(config: FullConfig) -> None:
   parser = argparse.ArgumentParser()
@@ -93,6 +126,35 @@ def parse_args(config: FullConfig) -> None:
   linkedin_parser.set_defaults(func=partial(linkedin, config))
   all_parser = subparsers.add_parser("all")
   all_parser.set_defaults(func=partial(all_platforms, config))
+  benchmark_extractors_parser = subparsers.add_parser("benchmark-extractors")
+  benchmark_extractors_parser.add_argument("--limit", type=int, default=1000)
+  benchmark_extractors_parser.add_argument("--repeat", type=int, default=3)
+  benchmark_extractors_parser.set_defaults(func=partial(benchmark_extractors, config))
+  benchmark_pay_parser_parser = subparsers.add_parser("benchmark-pay-parser")
+  benchmark_pay_parser_parser.add_argument("--limit", type=int, default=10000)
+  benchmark_pay_parser_parser.add_argument("--repeat", type=int, default=10)
+  benchmark_pay_parser_parser.set_defaults(func=partial(benchmark_pay_parser, config))
+  reevaluate_parser = subparsers.add_parser("reevaluate")
+  reevaluate_parser.add_argument("--chunk-size", type=int, default=2000)
+  reevaluate_parser.set_defaults(func=partial(reevaluate, config))
+  archive_parser = subparsers.add_parser("archive")
+  archive_parser.add_argument("--days", type=int, default=config.system.database.retention_days)
+  archive_parser.set_defaults(func=partial(archive, config))
+  export_parser = subparsers.add_parser("export")
+  export_parser.add_argument("output")
+  export_parser.add_argument(
+    "--format",
+    choices=[export_format.value for export_format in ExportFormat],
+    default=ExportFormat.JSONL.value
+  )
+  export_parser.add_argument("--chunk-size", type=int, default=5000)
+  export_parser.add_argument("--since", type=datetime.fromisoformat, default=None)
+  export_parser.set_defaults(func=partial(export, config))
+  search_parser = subparsers.add_parser("search")
+  search_parser.add_argument("query", help="ex) 'kubernetes AND go NOT clearance', '\"machine learning\" OR -php'")
+  search_parser.add_argument("--page", type=int, default=1)
+  search_parser.add_argument("--page-size", type=int, default=20)
+  search_parser.set_defaults(func=partial(search, config))
   args = parser.parse_args()
   args.func(args)
 
@@ -101,8 +163,7 @@ def scrape(
   glassdoor_orchestration_engine: GlassdoorOrchestrationEngine,
   indeed_orchestration_engine: IndeedOrchestrationEngine,
   linkedin_orchestration_engine: LinkedinOrchestrationEngine,
-  database_manager: DatabaseManager,
-  proxy_manager: ProxyManager
+  database_manager: DatabaseManager
 ) -> None:
   IS_DYNAMIC_AGE = config.quick_settings.bot_behavior.job_listing_criteria.max_age.dynamic
   if IS_DYNAMIC_AGE:
@@ -139,10 +200,7 @@ def scrape(
         linkedin_orchestration_engine.scrape()
       else:
         raise UnknownPlatformException()
-    except MemoryOverloadException as e:
-      raise e
     except RateLimitedException as e:
-      proxy_manager.log_rate_limit_block(e.get_platform())
       raise e
     except Exception:
       traceback.print_exc()
@@ -166,6 +224,60 @@ def all_platforms(config: FullConfig, args: argparse.Namespace) -> None:    # py
     Platform.LINKEDIN.value
   ]
 
+def benchmark_extractors(config: FullConfig, args: argparse.Namespace) -> None:
+  database_manager = DatabaseManager(config.system.database)
+  HtmlTextExtractorBenchmark(database_manager).run(args.limit, args.repeat)
+  sys.exit(0)
+
+def benchmark_pay_parser(config: FullConfig, args: argparse.Namespace) -> None:
+  database_manager = DatabaseManager(config.system.database)
+  passed = PayParserBenchmark(database_manager).run(args.limit, args.repeat)
+  sys.exit(0 if passed else 1)
+
+def reevaluate(config: FullConfig, args: argparse.Namespace) -> None:
+  database_manager = DatabaseManager(config.system.database)
+  JobListingReevaluator(database_manager, LanguageParser()).run(
+    config.quick_settings,
+    config.universal,
+    config.profiles,
+    args.chunk_size
+  )
+  sys.exit(0)
+
+def archive(config: FullConfig, args: argparse.Namespace) -> None:
+  database_manager = DatabaseManager(config.system.database)
+  JobListingArchiver(database_manager).run(args.days, config.system.database.archive_directory)
+  sys.exit(0)
+
+def export(config: FullConfig, args: argparse.Namespace) -> None:
+  database_manager = DatabaseManager(config.system.database)
+  since = args.since
+  if since and not since.tzinfo:
+    since = since.replace(tzinfo=timezone.utc)
+  JobListingExporter(database_manager).run(args.output, ExportFormat(args.format), args.chunk_size, since)
+  sys.exit(0)
+
+def search(config: FullConfig, args: argparse.Namespace) -> None:
+  database_manager = DatabaseManager(config.system.database)
+  try:
+    job_listings = database_manager.search_job_listings(args.query, max(args.page, 1), args.page_size)
+  except InvalidSearchQueryException as e:
+    logging.error("%s", e)
+    sys.exit(1)
+  logging.info("Page %s of results for: %s", max(args.page, 1), args.query)
+  for job_listing in job_listings:
+    logging.info(
+      "%.3f\t%s\t%s\t%s\t%s",
+      job_listing["rank"],
+      job_listing["job_title"],
+      job_listing["company"],
+      job_listing["location"],
+      job_listing["url"]
+    )
+  if not job_listings:
+    logging.info("No matching job listings.")
+  sys.exit(0)
+
 def configure_logger():
   def custom_time(record):
     t = time.localtime(record.created)
@@ -201,12 +313,11 @@ def __get_max_age_from_timedelta(time_since_last_scrape: timedelta) -> MaxAge:
   return new_max_age
 
 
-while True:
-  try:
-    start()
-    break
-  except MemoryOverloadException:
-    print("\nCurrent memory usage is too high. Please clean up existing tabs to continue safely.")
-    input("\tPress enter to proceed...")
-  except RateLimitedException as e:
-    input("Rate limiting has been logged in db. Press Enter restart the system...")
+# Guarded so description pipeline worker processes can import this module without starting a scrape
+if __name__ == "__main__":
+  while True:
+    try:
+      start()
+      break
+    except RateLimitedException as e:
+      input("Rate limiting has been logged in db. Press Enter restart the system...")
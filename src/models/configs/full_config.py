@@ -1,7 +1,10 @@
 from dataclasses import dataclass, field
+from typing import List
+from exceptions.invalid_profile_name_exception import InvalidProfileNameException
 from models.configs.glassdoor_config import GlassdoorConfig
 from models.configs.indeed_config import IndeedConfig
 from models.configs.linkedin_config import LinkedinConfig
+from models.configs.profile_config import DEFAULT_PROFILE_NAME, CriteriaProfile
 from models.configs.quick_settings import QuickSettings
 from models.configs.system_config import SystemConfig
 from models.configs.universal_config import UniversalConfig
@@ -15,3 +18,14 @@ class FullConfig:
   quick_settings: QuickSettings = field(default_factory=QuickSettings)
   system: SystemConfig = field(default_factory=SystemConfig)
   universal: UniversalConfig = field(default_factory=UniversalConfig)
+  profiles: List[CriteriaProfile] = field(default_factory=list)
+
+  # Verdicts, cached checkers and job_applications rows are all keyed by profile name
+  def __post_init__(self):
+    profile_names = set()
+    for profile in self.profiles:
+      if profile.name == DEFAULT_PROFILE_NAME:
+        raise InvalidProfileNameException(f"\"{DEFAULT_PROFILE_NAME}\" is reserved for the universal criteria")
+      if profile.name in profile_names:
+        raise InvalidProfileNameException(f"More than one profile is named: {profile.name}")
+      profile_names.add(profile.name)
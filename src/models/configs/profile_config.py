@@ -0,0 +1,15 @@
+from dataclasses import dataclass, field
+from models.configs.universal_config import JobMatchingList, SearchSalary, YearsOfExperience
+
+
+# The criteria in universal.bot_behavior are always evaluated, under this name
+DEFAULT_PROFILE_NAME = "default"
+
+
+@dataclass
+class CriteriaProfile:
+  name: str
+  ideal: JobMatchingList = field(default_factory=JobMatchingList)
+  ignore: JobMatchingList = field(default_factory=JobMatchingList)
+  salary: SearchSalary = field(default_factory=SearchSalary)
+  years_of_experience: YearsOfExperience = field(default_factory=YearsOfExperience)
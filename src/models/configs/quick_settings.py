@@ -18,11 +18,20 @@ class JobListingCriteria:
   is_in_ideal: bool = False
   max_age: MaxAge = field(default_factory=MaxAge)
 
+@dataclass
+class FilterPipelineSettings:
+  adaptive: bool = True
+  reorder_every: int = 100
+  stage_order: list = field(default_factory=list)
+
 @dataclass
 class BotBehavior:
   fallback_to_brief_on_load_issues: bool = True
   full_scrape: bool = False
+  prune_processed_listings: bool = False
+  session_job_cache_size: int | None = None
   job_listing_criteria: JobListingCriteria = field(default_factory=JobListingCriteria)
+  filter_pipeline: FilterPipelineSettings = field(default_factory=FilterPipelineSettings)
   default_page_load_timeout: int = 30
   platform_order: list = field(default_factory=list)
 
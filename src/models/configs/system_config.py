@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import Dict, List
 
 
 @dataclass
@@ -10,18 +10,39 @@ class DatabaseConfig:
   host: str = ""
   port: int = 3306
   name: str = ""
+  compress_descriptions: bool = False
+  company_aliases: Dict[str, List[str]] = field(default_factory=dict)
+  retention_days: int = 0
+  archive_directory: str = "archive"
 
 @dataclass
 class BrowserConfig:
   path: str = ""
+  keep_standby_driver: bool = True
+  tab_recycle_growth_mb: int = 1024
+  restart_memory_mb: int = 4096
+  memory_check_interval_seconds: float = 5.0
 
 @dataclass
 class ProxyConfig:
   host: str
   port: int
 
+@dataclass
+class ProxyHealthConfig:
+  enabled: bool = True
+  probe_interval_seconds: float = 300.0
+  timeout_seconds: float = 10.0
+  target_host: str = "www.google.com"
+  target_port: int = 80
+  target_path: str = "/"
+  rate_limit_cooldown_seconds: float = 3600.0
+
 @dataclass
 class SystemConfig:
   browser: BrowserConfig = field(default_factory=BrowserConfig)
   database: DatabaseConfig = field(default_factory=DatabaseConfig)
   proxies: List[ProxyConfig] = field(default_factory=list)
+  proxy_health: ProxyHealthConfig = field(default_factory=ProxyHealthConfig)
+  description_workers: int = 2
+  description_text_extractor: str = "beautifulsoup"
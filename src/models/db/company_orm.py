@@ -0,0 +1,13 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy.orm import relationship
+from models.db.base import Base
+
+
+class CompanyORM(Base):
+  __tablename__ = 'companies'
+  id = Column(Integer, primary_key=True)
+  normalized_name = Column(String, nullable=False, unique=True)
+  display_name = Column(String)
+  timestamp = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+  job_listings = relationship("JobListingORM", back_populates="company_entry")
@@ -0,0 +1,11 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, DateTime, LargeBinary, String
+from models.db.base import Base
+
+
+class DescriptionORM(Base):
+  __tablename__ = 'descriptions'
+  hash = Column(String(64), primary_key=True)
+  content = Column(LargeBinary, nullable=False)
+  compression = Column(String, nullable=True)
+  timestamp = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
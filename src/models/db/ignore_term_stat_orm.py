@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Date, Integer, String
+from models.db.base import Base
+
+
+# Daily job application counts per ignore term, kept in step with job_applications by DatabaseManager
+class IgnoreTermStatORM(Base):
+  __tablename__ = 'ignore_term_stats'
+  day = Column(Date, primary_key=True)
+  ignore_type = Column(String, primary_key=True)
+  ignore_category = Column(String, primary_key=True)
+  ignore_term = Column(String, primary_key=True)
+  count = Column(Integer, nullable=False)
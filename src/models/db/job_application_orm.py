@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
 from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
+from models.configs.profile_config import DEFAULT_PROFILE_NAME
 from models.db.base import Base
 
 
@@ -13,6 +14,7 @@ class JobApplicationORM(Base):
   ignore_type = Column(String, nullable=True)
   ignore_category = Column(String, nullable=True)
   ignore_term = Column(String, nullable=True)
+  profile = Column(String, nullable=False, default=DEFAULT_PROFILE_NAME, server_default=DEFAULT_PROFILE_NAME)
   timestamp = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
   job_listing_id = Column(Integer, ForeignKey('job_listings.id'), nullable=False)
   job_listing = relationship("JobListingORM", back_populates="applications")
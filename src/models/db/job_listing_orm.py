@@ -1,22 +1,36 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, DateTime, Float, Integer, String
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 from models.db.base import Base
 
 
 class JobListingORM(Base):
   __tablename__ = 'job_listings'
+  __table_args__ = (
+    Index("ix_job_listings_job_title_company_location_platform", "job_title", "company", "location", "platform"),
+    Index("ix_job_listings_company_id", "company_id"),
+    Index("ix_job_listings_description_hash", "description_hash"),
+    # Rows are only ever appended, so a BRIN index on postgres stays tiny while still skipping old blocks
+    Index("ix_job_listings_timestamp", "timestamp", postgresql_using="brin"),
+  )
   id = Column(Integer, primary_key=True)
   job_title = Column(String)
   company = Column(String)
+  company_id = Column(Integer, ForeignKey('companies.id'), nullable=True)
   location = Column(String)
   min_pay = Column(Float, nullable=True)
   max_pay = Column(Float, nullable=True)
+  raw_pay = Column(String, nullable=True)
   min_yoe = Column(Integer, nullable=True)
   max_yoe = Column(Integer, nullable=True)
+  # Only filled on rows from before descriptions were deduplicated -- new rows point at descriptions by hash
   description = Column(String)
+  description_hash = Column(String(64), ForeignKey('descriptions.hash'), nullable=True)
   platform = Column(String)
   url = Column(String)
   post_time = Column(DateTime(timezone=True))
+  # Hash of every column an update can change (see DatabaseManager) -- lets unchanged listings skip the write
+  content_hash = Column(String(32), nullable=True)
   timestamp = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
   applications = relationship("JobApplicationORM", back_populates="job_listing")
+  company_entry = relationship("CompanyORM", back_populates="job_listings")
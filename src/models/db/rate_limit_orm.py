@@ -1,10 +1,13 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy import Column, DateTime, Index, Integer, String
 from models.db.base import Base
 
 
 class RateLimitORM(Base):
   __tablename__ = 'rate_limits'
+  __table_args__ = (
+    Index("ix_rate_limits_ip_address_platform_timestamp", "ip_address", "platform", "timestamp"),
+  )
   id = Column(Integer, primary_key=True)
   ip_address = Column(String)
   platform = Column(String)
@@ -0,0 +1,14 @@
+from enum import Enum
+
+
+class FilterStage(Enum):
+  DATABASE = "database"
+  CRITERIA = "criteria"
+  IDEAL = "ideal"
+  LANGUAGE = "language"
+  TITLE = "title"
+  COMPANY = "company"
+  LOCATION = "location"
+  DESCRIPTION = "description"
+  PAY = "pay"
+  YOE = "yoe"
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class HtmlTextExtractorType(Enum):
+  BEAUTIFULSOUP = "beautifulsoup"
+  LXML = "lxml"
+  SELECTOLAX = "selectolax"
+  INNER_TEXT = "inner_text"
@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class PayPeriod(Enum):
+  HOURLY = "hourly"
+  DAILY = "daily"
+  WEEKLY = "weekly"
+  MONTHLY = "monthly"
+  ANNUAL = "annual"
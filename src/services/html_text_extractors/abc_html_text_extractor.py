@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+
+class HtmlTextExtractor(ABC):
+  # Output format matches BeautifulSoup's get_text(separator="\n", strip=True): every text node stripped, empty
+  # ones dropped, joined by newlines. Script, style and template contents are never text.
+  _NON_TEXT_TAGS = frozenset(("script", "style", "template"))
+
+  @abstractmethod
+  def get_text(self, raw_description: str) -> str:
+    pass
+
+  # Whether descriptions should be read from the browser as rendered text instead of as html
+  def reads_rendered_text(self) -> bool:
+    return False
+
+  @abstractmethod
+  def is_available(self) -> bool:
+    pass
@@ -0,0 +1,11 @@
+from bs4 import BeautifulSoup
+from services.html_text_extractors.abc_html_text_extractor import HtmlTextExtractor
+
+
+class BeautifulSoupHtmlTextExtractor(HtmlTextExtractor):
+  def get_text(self, raw_description: str) -> str:
+    soup = BeautifulSoup(raw_description, "html.parser")
+    return soup.get_text(separator="\n", strip=True)
+
+  def is_available(self) -> bool:
+    return True
@@ -0,0 +1,29 @@
+import logging
+from exceptions.unknown_html_text_extractor_exception import UnknownHtmlTextExtractorException
+from models.enums.html_text_extractor_type import HtmlTextExtractorType
+from services.html_text_extractors.abc_html_text_extractor import HtmlTextExtractor
+from services.html_text_extractors.beautiful_soup_html_text_extractor import BeautifulSoupHtmlTextExtractor
+from services.html_text_extractors.inner_text_html_text_extractor import InnerTextHtmlTextExtractor
+from services.html_text_extractors.lxml_html_text_extractor import LxmlHtmlTextExtractor
+from services.html_text_extractors.selectolax_html_text_extractor import SelectolaxHtmlTextExtractor
+
+
+class HtmlTextExtractorFactory:
+  def build(self, extractor_type: str) -> HtmlTextExtractor:
+    html_text_extractor = self.build_without_fallback(extractor_type)
+    if not html_text_extractor.is_available():
+      logging.warning("%s isn't installed. Falling back to beautifulsoup for job descriptions...", extractor_type)
+      return BeautifulSoupHtmlTextExtractor()
+    return html_text_extractor
+
+  def build_without_fallback(self, extractor_type: str) -> HtmlTextExtractor:
+    extractor_type = extractor_type.lower().strip()
+    if extractor_type == HtmlTextExtractorType.BEAUTIFULSOUP.value:
+      return BeautifulSoupHtmlTextExtractor()
+    elif extractor_type == HtmlTextExtractorType.LXML.value:
+      return LxmlHtmlTextExtractor()
+    elif extractor_type == HtmlTextExtractorType.SELECTOLAX.value:
+      return SelectolaxHtmlTextExtractor()
+    elif extractor_type == HtmlTextExtractorType.INNER_TEXT.value:
+      return InnerTextHtmlTextExtractor()
+    raise UnknownHtmlTextExtractorException(extractor_type)
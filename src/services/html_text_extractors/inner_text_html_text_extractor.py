@@ -0,0 +1,14 @@
+from services.html_text_extractors.abc_html_text_extractor import HtmlTextExtractor
+
+
+class InnerTextHtmlTextExtractor(HtmlTextExtractor):
+  # Receives the browser's already rendered innerText, so all that's left is normalizing lines.
+  # Inline elements aren't split onto their own lines here like they are by the html based extractors.
+  def get_text(self, raw_description: str) -> str:
+    return "\n".join(line.strip() for line in raw_description.splitlines() if line.strip())
+
+  def reads_rendered_text(self) -> bool:
+    return True
+
+  def is_available(self) -> bool:
+    return True
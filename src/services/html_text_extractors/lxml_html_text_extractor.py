@@ -0,0 +1,36 @@
+from typing import List
+from services.html_text_extractors.abc_html_text_extractor import HtmlTextExtractor
+try:
+  from lxml import etree, html as lxml_html
+  LXML_IS_INSTALLED = True
+except ImportError:
+  LXML_IS_INSTALLED = False
+
+
+class LxmlHtmlTextExtractor(HtmlTextExtractor):
+  def get_text(self, raw_description: str) -> str:
+    try:
+      root = lxml_html.document_fromstring(raw_description)
+    except etree.ParserError:
+      # Raised for documents without any elements or text, e.g. empty or comment-only
+      return ""
+    text_parts: List[str] = []
+    self.__collect_text(root, text_parts)
+    return "\n".join(text_parts)
+
+  def is_available(self) -> bool:
+    return LXML_IS_INSTALLED
+
+  def __collect_text(self, element: "etree._Element", text_parts: List[str]) -> None:
+    if isinstance(element.tag, str) and element.tag.lower() not in self._NON_TEXT_TAGS:
+      self.__add_text(element.text, text_parts)
+      for child in element:
+        self.__collect_text(child, text_parts)
+    # Tail text belongs to the parent, so it's kept even when the element itself is a comment or script
+    self.__add_text(element.tail, text_parts)
+
+  def __add_text(self, text: str | None, text_parts: List[str]) -> None:
+    if text:
+      stripped_text = text.strip()
+      if stripped_text:
+        text_parts.append(stripped_text)
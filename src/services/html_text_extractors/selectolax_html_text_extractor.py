@@ -0,0 +1,26 @@
+from typing import List
+from services.html_text_extractors.abc_html_text_extractor import HtmlTextExtractor
+try:
+  from selectolax.lexbor import LexborHTMLParser
+  SELECTOLAX_IS_INSTALLED = True
+except ImportError:
+  SELECTOLAX_IS_INSTALLED = False
+
+
+class SelectolaxHtmlTextExtractor(HtmlTextExtractor):
+  def get_text(self, raw_description: str) -> str:
+    tree = LexborHTMLParser(raw_description)
+    root = tree.root
+    if root is None:
+      return ""
+    tree.strip_tags(list(self._NON_TEXT_TAGS))
+    text_parts: List[str] = []
+    for node in root.traverse(include_text=True):
+      if node.tag == "-text":
+        stripped_text = (node.text_content or "").strip()
+        if stripped_text:
+          text_parts.append(stripped_text)
+    return "\n".join(text_parts)
+
+  def is_available(self) -> bool:
+    return SELECTOLAX_IS_INSTALLED
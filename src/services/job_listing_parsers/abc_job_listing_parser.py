@@ -0,0 +1,108 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Tuple
+from selenium.webdriver.remote.webelement import WebElement
+from entities.job_listing import JobListing
+from services.html_text_extractors.abc_html_text_extractor import HtmlTextExtractor
+from services.misc.description_parser import DescriptionParser
+from services.misc.language_parser import LanguageParser
+from services.misc.pay_parser import PayParser
+from services.misc.post_time_parser import PostTimeParser
+
+
+class JobListingParser(ABC):
+  _PAY_REQUIRES_PERIOD = False
+  _language_parser: LanguageParser
+  _html_text_extractor: HtmlTextExtractor
+  _description_parser: DescriptionParser
+  _pay_parser: PayParser
+  _post_time_parser: PostTimeParser
+  __now: datetime
+
+  def __init__(self, language_parser: LanguageParser, html_text_extractor: HtmlTextExtractor):
+    self._language_parser = language_parser
+    self._html_text_extractor = html_text_extractor
+    self._description_parser = DescriptionParser(html_text_extractor)
+    self._pay_parser = PayParser()
+    self._post_time_parser = PostTimeParser()
+    self.__now = datetime.now(timezone.utc)
+
+  # Called once per results page so every listing on it is aged against the same timestamp
+  def refresh_now(self) -> None:
+    self.__now = datetime.now(timezone.utc)
+
+  def get_missing_post_time_count(self) -> int:
+    return self._post_time_parser.get_missing_post_time_count()
+
+  def parse(
+    self,
+    url: str,
+    job_listing_li: WebElement,
+    job_details_div: WebElement | None = None,
+    job_header_div: WebElement | None = None
+  ) -> JobListing:
+    job_listing, raw_description = self.parse_without_description(url, job_listing_li, job_details_div, job_header_div)
+    return self._description_parser.parse(job_listing, raw_description)
+
+  # Leaves the description html unparsed so the caller can hand it off (see DescriptionPipeline)
+  def parse_without_description(
+    self,
+    url: str,
+    job_listing_li: WebElement,
+    job_details_div: WebElement | None = None,
+    job_header_div: WebElement | None = None
+  ) -> Tuple[JobListing, str | None]:
+    title = self._parse_title(job_listing_li)
+    company = self._parse_company(job_listing_li)
+    location = self._parse_location(job_listing_li)
+    raw_pay = self._get_raw_pay(job_listing_li)
+    if raw_pay:
+      min_pay, max_pay, pay_period = self._pay_parser.parse(raw_pay, self._PAY_REQUIRES_PERIOD)
+    else:
+      min_pay, max_pay, pay_period = (None, None, None)
+    raw_description = self._get_raw_description(job_details_div)
+    job_listing = JobListing(
+      title=title,
+      company=company,
+      location=location,
+      url=url,
+      language=self._language_parser.get_language(f"{title} {company} {location}"),
+      min_pay=min_pay,
+      max_pay=max_pay,
+      pay_period=pay_period,
+      raw_pay=raw_pay or None,
+      post_time=self._parse_post_time(job_listing_li, job_header_div)
+    )
+    return (job_listing, raw_description)
+
+  def _get_description_source(self, description_element: WebElement, html_attribute: str) -> str | None:
+    if self._html_text_extractor.reads_rendered_text():
+      return description_element.get_attribute("innerText")
+    return description_element.get_attribute(html_attribute)
+
+  def _parse_relative_post_time(self, relative_time_text: str | None) -> datetime | None:
+    return self._post_time_parser.parse(relative_time_text, self.__now)
+
+  @abstractmethod
+  def _parse_title(self, job_listing_li: WebElement) -> str:
+    pass
+
+  @abstractmethod
+  def _parse_company(self, job_listing_li: WebElement) -> str:
+    pass
+
+  @abstractmethod
+  def _parse_location(self, job_listing_li: WebElement) -> str:
+    pass
+
+  @abstractmethod
+  def _get_raw_pay(self, job_listing_li: WebElement) -> str | None:
+    pass
+
+  @abstractmethod
+  def _get_raw_description(self, job_details_div: WebElement | None) -> str | None:
+    pass
+
+  @abstractmethod
+  def _parse_post_time(self, job_listing_li: WebElement, job_header_div: WebElement | None) -> datetime | None:
+    pass
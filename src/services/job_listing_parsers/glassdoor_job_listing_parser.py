@@ -0,0 +1,70 @@
+import logging
+import time
+from datetime import datetime
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import NoSuchElementException
+from services.job_listing_parsers.abc_job_listing_parser import JobListingParser
+
+
+class GlassdoorJobListingParser(JobListingParser):
+  def _get_raw_pay(self, job_listing_li: WebElement) -> str | None:
+    try:
+      job_salary_div_class = "JobCard_salaryEstimate__QpbTW"
+      job_salary_div = job_listing_li.find_element(By.CLASS_NAME, job_salary_div_class)
+      return job_salary_div.text
+    except NoSuchElementException:
+      return None
+
+  def _parse_title(self, job_listing_li: WebElement) -> str:
+    job_title_anchor_class = "JobCard_jobTitle__GLyJ1"
+    job_title_anchor = job_listing_li.find_element(By.CLASS_NAME, job_title_anchor_class)
+    return job_title_anchor.text.strip()
+
+  def _parse_company(self, job_listing_li: WebElement) -> str:
+    company_span_class = "EmployerProfile_compactEmployerName__9MGcV"
+    company_span = job_listing_li.find_element(By.CLASS_NAME, company_span_class)
+    return company_span.text.strip()
+
+  def _parse_location(self, job_listing_li: WebElement) -> str:
+    location_div_class = "JobCard_location__Ds1fM"
+    location_div = job_listing_li.find_element(By.CLASS_NAME, location_div_class)
+    return location_div.text.strip()
+
+  def _get_raw_description(self, job_details_div: WebElement | None) -> str | None:
+    if not job_details_div:
+      return None
+    description_div_selectors = [
+      ".JobDetails_jobDescription__uW_fK.JobDetails_blurDescription__vN7nh",
+      ".JobDetails_jobDescription__uW_fK.JobDetails_showHidden__C_FOA"
+    ]
+    timeout = 3.0
+    timed_out = True
+    description_div = None
+    start_time = time.time()
+    while time.time() - start_time < timeout:
+      for selector in description_div_selectors:
+        try:
+          description_div = job_details_div.find_element(By.CSS_SELECTOR, selector)
+          timed_out = False
+          break
+        except NoSuchElementException:
+          logging.debug("Waiting for job description div to load...")
+          time.sleep(0.1)
+      if description_div:
+        break
+    if timed_out or description_div is None:
+      raise TimeoutError("Timed out waiting for job description div to load.")
+    raw_description = self._get_description_source(description_div, "innerHTML")
+    if raw_description is None:
+      raw_description = ""
+    return raw_description
+
+  def _parse_post_time(self, job_listing_li: WebElement, job_header_div: WebElement | None) -> datetime | None:
+    listing_age_class = "JobCard_listingAge__jJsuc"
+    try:
+      listing_age = job_listing_li.find_element(By.CLASS_NAME, listing_age_class)
+      listing_age_text = listing_age.text
+    except NoSuchElementException:
+      listing_age_text = None
+    return self._parse_relative_post_time(listing_age_text)
@@ -0,0 +1,51 @@
+from datetime import datetime
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import NoSuchElementException
+from services.job_listing_parsers.abc_job_listing_parser import JobListingParser
+
+
+class IndeedJobListingParser(JobListingParser):
+  def _get_raw_pay(self, job_listing_li: WebElement) -> str | None:
+    pay_h2_selector = ".mosaic-provider-jobcards-4n9q2y.e1tiznh50"
+    try:
+      pay_h2 = job_listing_li.find_element(By.CSS_SELECTOR, pay_h2_selector)
+      return pay_h2.text
+    except NoSuchElementException:
+      return None
+
+  def _parse_title(self, job_listing_li: WebElement) -> str:
+    job_listing_h2 = job_listing_li.find_element(
+      By.CSS_SELECTOR,
+      "h2.jobTitle"
+    )
+    return job_listing_h2.text.strip()
+
+  def _parse_company(self, job_listing_li: WebElement) -> str:
+    job_listing_li_spans = job_listing_li.find_elements(By.TAG_NAME, "span")
+    for span in job_listing_li_spans:
+      data_test_id = span.get_attribute("data-testid")
+      if data_test_id:
+        if data_test_id == "company-name":
+          return span.text.strip()
+    raise NoSuchElementException("Failed to find a suitable company element.")
+
+  def _parse_location(self, job_listing_li: WebElement) -> str:
+    job_listing_li_divs = job_listing_li.find_elements(By.TAG_NAME, "div")
+    for div in job_listing_li_divs:
+      data_test_id = div.get_attribute("data-testid")
+      if data_test_id:
+        if data_test_id == "text-location":
+          return div.text.strip()
+    raise NoSuchElementException("Failed to find a suitable location element.")
+
+  def _get_raw_description(self, job_details_div: WebElement | None) -> str | None:
+    if job_details_div:
+      job_details_html = self._get_description_source(job_details_div, "innerHTML")
+      if job_details_html:
+        return job_details_html
+    return None
+
+  def _parse_post_time(self, job_listing_li: WebElement, job_header_div: WebElement | None) -> datetime | None:
+    # Indeed actually doesnt expose this data -- hilarious
+    return None
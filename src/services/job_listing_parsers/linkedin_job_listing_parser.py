@@ -0,0 +1,66 @@
+import logging
+import time
+from datetime import datetime
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException
+from services.job_listing_parsers.abc_job_listing_parser import JobListingParser
+
+
+class LinkedinJobListingParser(JobListingParser):
+  # Linkedin puts unrelated text (ex: "Medical, Vision") in the same spot, so only trust it with a period
+  _PAY_REQUIRES_PERIOD = True
+
+  def _get_raw_pay(self, job_listing_li: WebElement) -> str | None:
+    try:
+      relative_pay_div_xpath = "./div/a/div/div/div[2]/div[1]/div[4]/div[1]"
+      pay_div = job_listing_li.find_element(By.XPATH, relative_pay_div_xpath)
+      return pay_div.text
+    except NoSuchElementException:
+      return None
+
+  def _parse_title(self, job_listing_li: WebElement) -> str:
+    title_anchor_selector = ".disabled.ember-view.job-card-container__link.UBPTBuIxmfjtoDVYyeVDGuNHYlmQndcRg.job-card-list__title--link"    # pylint: disable=line-too-long
+    title_anchor = job_listing_li.find_element(By.CSS_SELECTOR, title_anchor_selector)
+    raw_title = title_anchor.get_attribute("aria-label")
+    if raw_title:
+      return raw_title.strip()
+    raise NoSuchElementException("Failed to find a proper title anchor.")
+
+  def _parse_company(self, job_listing_li: WebElement) -> str:
+    company_span_class = "ZJMBSaLRYmOXxgPkEPmHGeiJXycjyVeBfAos "
+    company_span = job_listing_li.find_element(By.CLASS_NAME, company_span_class)
+    return company_span.text.strip()
+
+  def _parse_location(self, job_listing_li: WebElement) -> str:
+    relative_location_li_xpath = "./div/div/div[1]/div/div[2]/div[3]/ul/li/span"
+    location_span = job_listing_li.find_element(By.XPATH, relative_location_li_xpath)
+    return location_span.text
+
+  def _get_raw_description(self, job_details_div: WebElement | None) -> str | None:
+    if job_details_div:
+      self.__wait_for_populated_description(job_details_div)
+      return self._get_description_source(job_details_div, "outerHTML") or ""
+    return None
+
+  def _parse_post_time(self, job_listing_li: WebElement, job_header_div: WebElement | None) -> datetime | None:
+    if job_header_div:
+      post_time = self._parse_relative_post_time(job_header_div.get_attribute("innerHTML"))
+      if post_time is None:
+        logging.warning("No post time available...")
+      return post_time
+    try:
+      listing_age = job_listing_li.find_element(By.TAG_NAME, "time")
+      listing_age_text = listing_age.text
+    except NoSuchElementException:
+      listing_age_text = None
+    return self._parse_relative_post_time(listing_age_text)
+
+  def __wait_for_populated_description(self, element: WebElement, timeout=5.0) -> None:
+    start = time.time()
+    while time.time() - start < timeout:
+      text = element.text.strip()
+      IS_LOADED = len(text.splitlines()) > 2 or len(text) > 100
+      if IS_LOADED:
+        return
+      time.sleep(0.1)
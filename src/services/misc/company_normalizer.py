@@ -0,0 +1,39 @@
+import re
+from typing import Dict, List
+
+
+class CompanyNormalizer:
+  __DOMAIN_REGEX = re.compile(r"\.(?:com|net|org|io|ai|co)\b")
+  __PUNCTUATION_REGEX = re.compile(r"[^\w\s&]+")
+  __WHITESPACE_REGEX = re.compile(r"\s+")
+  __LEGAL_SUFFIXES = {
+    "llc", "inc", "incorporated", "corp", "corporation", "co", "company", "ltd", "limited",
+    "plc", "gmbh", "lp", "llp", "sa", "ag", "bv", "pllc"
+  }
+  __aliases: Dict[str, str]
+  __normalized_names: Dict[str, str]
+
+  def __init__(self, company_aliases: Dict[str, List[str]]):
+    self.__aliases = {}
+    self.__normalized_names = {}
+    for canonical_name, aliases in company_aliases.items():
+      normalized_canonical_name = self.__clean(canonical_name)
+      for alias in aliases:
+        self.__aliases[self.__clean(alias)] = normalized_canonical_name
+
+  def normalize(self, company: str) -> str:
+    normalized_name = self.__normalized_names.get(company)
+    if normalized_name is None:
+      cleaned_name = self.__clean(company)
+      normalized_name = self.__aliases.get(cleaned_name, cleaned_name)
+      self.__normalized_names[company] = normalized_name
+    return normalized_name
+
+  # ex) "Amazon.com Services, LLC" -> "amazon services"
+  def __clean(self, company: str) -> str:
+    company = self.__DOMAIN_REGEX.sub("", company.lower())
+    company = self.__PUNCTUATION_REGEX.sub(" ", company)
+    words = self.__WHITESPACE_REGEX.split(company.strip())
+    while len(words) > 1 and words[-1] in self.__LEGAL_SUFFIXES:
+      words.pop()
+    return " ".join(words)
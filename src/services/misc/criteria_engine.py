@@ -0,0 +1,264 @@
+from collections import OrderedDict
+import hashlib
+import logging
+import re
+from typing import Callable, Dict, List, Tuple
+from entities.criteria_verdict import CriteriaVerdict
+from entities.job_listing import JobListing
+from models.configs.quick_settings import QuickSettings
+from models.configs.universal_config import UniversalConfig
+from models.enums.filter_stage import FilterStage
+from models.enums.ignore_category import IgnoreCategory
+from models.enums.ignore_type import IgnoreType
+from models.enums.language import Language
+
+
+PASSING_VERDICT = CriteriaVerdict()
+
+# An ideal phrase matches when all of its patterns do (a nested list in the config)
+IdealPhrase = Tuple[re.Pattern, ...]
+# A single combined pattern rules out most text in one pass, the per-term patterns then name the term that hit
+IgnoreTerms = Tuple[re.Pattern | None, List[Tuple[str, re.Pattern]]]
+
+
+class CompiledCriteria:
+  __key: bytes
+  __is_in_ideal: bool
+  __not_in_ignore: bool
+  __ideal_titles: List[IdealPhrase]
+  __ideal_companies: List[IdealPhrase]
+  __ideal_locations: List[IdealPhrase]
+  __ignore_titles: IgnoreTerms
+  __ignore_companies: IgnoreTerms
+  __ignore_locations: IgnoreTerms
+  __ignore_descriptions: IgnoreTerms
+  __min_salary: int | None
+  __max_salary: int | None
+  __min_yoe_desired: int | None
+  __max_yoe_desired: int | None
+  __checks: Dict[FilterStage, Callable[[JobListing], CriteriaVerdict | None]]
+  __company_verdicts: Dict[str, CriteriaVerdict | None]
+  __company_verdicts_size: int
+
+  def __init__(
+    self,
+    key: bytes,
+    quick_settings: QuickSettings,
+    universal_config: UniversalConfig,
+    company_verdicts_size: int = 50000
+  ):
+    self.__key = key
+    self.__company_verdicts = {}
+    self.__company_verdicts_size = company_verdicts_size
+    job_listing_criteria = quick_settings.bot_behavior.job_listing_criteria
+    self.__is_in_ideal = job_listing_criteria.is_in_ideal
+    self.__not_in_ignore = job_listing_criteria.not_in_ignore
+    ideal = universal_config.bot_behavior.ideal
+    self.__ideal_titles = self.__compile_ideal_phrases(ideal.titles)
+    self.__ideal_companies = self.__compile_ideal_phrases(ideal.companies)
+    self.__ideal_locations = self.__compile_ideal_phrases(ideal.locations)
+    ignore = universal_config.bot_behavior.ignore
+    self.__ignore_titles = self.__compile_ignore_terms(ignore.titles)
+    self.__ignore_companies = self.__compile_ignore_terms(ignore.companies)
+    self.__ignore_locations = self.__compile_ignore_terms(ignore.locations)
+    self.__ignore_descriptions = self.__compile_ignore_terms(ignore.descriptions)
+    self.__min_salary = universal_config.search.salary.min
+    self.__max_salary = universal_config.search.salary.max
+    self.__min_yoe_desired = universal_config.bot_behavior.years_of_experience.minimum
+    self.__max_yoe_desired = universal_config.bot_behavior.years_of_experience.maximum
+    self.__checks = {
+      FilterStage.IDEAL: self.__check_ideal,
+      FilterStage.LANGUAGE: self.__check_language,
+      FilterStage.TITLE: self.__check_title,
+      FilterStage.COMPANY: self.__check_company,
+      FilterStage.LOCATION: self.__check_location,
+      FilterStage.DESCRIPTION: self.__check_description,
+      FilterStage.PAY: self.__check_pay,
+      FilterStage.YOE: self.__check_yoe
+    }
+
+  def get_key(self) -> bytes:
+    return self.__key
+
+  def get_stages(self) -> List[FilterStage]:
+    return list(self.__checks)
+
+  # Returns the rejecting verdict, or None if the listing passes this stage
+  def check(self, stage: FilterStage, job_listing: JobListing) -> CriteriaVerdict | None:
+    return self.__checks[stage](job_listing)
+
+  def evaluate(self, job_listing: JobListing) -> CriteriaVerdict:
+    for check in self.__checks.values():
+      verdict = check(job_listing)
+      if verdict:
+        return verdict
+    return PASSING_VERDICT
+
+  def __check_ideal(self, job_listing: JobListing) -> CriteriaVerdict | None:
+    if not self.__is_in_ideal:
+      return None
+    if (
+      self.__matches_ideal(self.__ideal_titles, job_listing.get_title())
+      or self.__matches_ideal(self.__ideal_companies, job_listing.get_company())
+      or self.__matches_ideal(self.__ideal_locations, job_listing.get_location())
+    ):
+      return None
+    logging.info("Ignoring because listing doesn't meet defined \"ideal\" criteria.")
+    return CriteriaVerdict(IgnoreType.NOT_IN_IDEAL)
+
+  def __check_language(self, job_listing: JobListing) -> CriteriaVerdict | None:
+    # TODO: Pull language from config
+    job_listing_language = job_listing.get_language().value
+    if job_listing_language == Language.ENGLISH.value:
+      return None
+    logging.info("Ignoring because listing language is: %s", job_listing_language)
+    return CriteriaVerdict(IgnoreType.LANGUAGE, IgnoreCategory.LANGUAGE, job_listing_language)
+
+  def __check_title(self, job_listing: JobListing) -> CriteriaVerdict | None:
+    return self.__check_ignore_terms(self.__ignore_titles, job_listing.get_title(), IgnoreCategory.TITLE)
+
+  # The same handful of companies post most listings, so each one is only matched against the ignore terms once
+  def __check_company(self, job_listing: JobListing) -> CriteriaVerdict | None:
+    company = job_listing.get_company().lower().strip()
+    if company in self.__company_verdicts:
+      verdict = self.__company_verdicts[company]
+      if verdict:
+        logging.info("Ignoring because %s includes: %s", IgnoreCategory.COMPANY.value.lower(), verdict.get_ignore_term())
+      return verdict
+    verdict = self.__check_ignore_terms(self.__ignore_companies, company, IgnoreCategory.COMPANY)
+    if len(self.__company_verdicts) >= self.__company_verdicts_size:
+      self.__company_verdicts.clear()
+    self.__company_verdicts[company] = verdict
+    return verdict
+
+  def __check_location(self, job_listing: JobListing) -> CriteriaVerdict | None:
+    return self.__check_ignore_terms(self.__ignore_locations, job_listing.get_location(), IgnoreCategory.LOCATION)
+
+  def __check_description(self, job_listing: JobListing) -> CriteriaVerdict | None:
+    description = job_listing.get_description()
+    if not description:
+      return None
+    return self.__check_ignore_terms(self.__ignore_descriptions, description, IgnoreCategory.DESCRIPTION)
+
+  def __check_pay(self, job_listing: JobListing) -> CriteriaVerdict | None:
+    if not self.__not_in_ignore:
+      return None
+    min_pay = job_listing.get_min_pay()
+    max_pay = job_listing.get_max_pay()
+    if self.__min_salary and max_pay and self.__min_salary > max_pay:
+      logging.info("Job pays: %s   less than our minimum: %s", self.__min_salary - max_pay, self.__min_salary)
+      return CriteriaVerdict(IgnoreType.IS_IN_IGNORE, IgnoreCategory.LOW_PAY, str(max_pay))
+    if self.__max_salary and min_pay and self.__max_salary < min_pay:
+      logging.info("Job pays: %s   more than our maximum: %s", self.__max_salary - min_pay, self.__max_salary)
+      return CriteriaVerdict(IgnoreType.IS_IN_IGNORE, IgnoreCategory.HIGH_PAY, str(min_pay))
+    return None
+
+  def __check_yoe(self, job_listing: JobListing) -> CriteriaVerdict | None:
+    if not self.__not_in_ignore:
+      return None
+    min_yoe = job_listing.get_min_yoe()
+    max_yoe = job_listing.get_max_yoe()
+    if min_yoe and self.__max_yoe_desired and self.__max_yoe_desired < min_yoe:
+      logging.info("Job requires too many Years of Experience: %s", min_yoe)
+      return CriteriaVerdict(IgnoreType.IS_IN_IGNORE, IgnoreCategory.HIGH_YOE, str(min_yoe))
+    if max_yoe and self.__min_yoe_desired and self.__min_yoe_desired < max_yoe:
+      logging.info("Job asks for too few Years of Experience: %s", max_yoe)
+      return CriteriaVerdict(IgnoreType.IS_IN_IGNORE, IgnoreCategory.LOW_YOE, str(max_yoe))
+    return None
+
+  def __check_ignore_terms(
+    self,
+    ignore_terms: IgnoreTerms,
+    text: str,
+    ignore_category: IgnoreCategory
+  ) -> CriteriaVerdict | None:
+    if not self.__not_in_ignore:
+      return None
+    any_term_pattern, term_patterns = ignore_terms
+    if any_term_pattern is None:
+      return None
+    text = text.lower().strip()
+    if not any_term_pattern.search(text):
+      return None
+    for term, term_pattern in term_patterns:
+      if term_pattern.search(text):
+        logging.info("Ignoring because %s includes: %s", ignore_category.value.lower(), term)
+        return CriteriaVerdict(IgnoreType.IS_IN_IGNORE, ignore_category, term)
+    return None
+
+  def __matches_ideal(self, ideal_phrases: List[IdealPhrase], text: str) -> bool:
+    text = text.lower().strip()
+    for ideal_phrase in ideal_phrases:
+      if all(pattern.search(text) for pattern in ideal_phrase):
+        return True
+    return False
+
+  def __compile_ideal_phrases(self, phrases: List[str | list] | None) -> List[IdealPhrase]:
+    return [
+      tuple(re.compile(self.__build_term_pattern(term)) for term in self.__flatten_phrase(phrase))
+      for phrase in phrases or []
+    ]
+
+  # Nested lists only ever logged a match and never ignored anything, so only plain terms are kept
+  def __compile_ignore_terms(self, terms: List[str | list] | None) -> IgnoreTerms:
+    term_patterns = [
+      (term, re.compile(self.__build_term_pattern(term)))
+      for term in terms or []
+      if isinstance(term, str)
+    ]
+    if not term_patterns:
+      return (None, [])
+    any_term_pattern = re.compile("|".join(f"(?:{term_pattern.pattern})" for _, term_pattern in term_patterns))
+    return (any_term_pattern, term_patterns)
+
+  def __flatten_phrase(self, phrase: str | list) -> List[str]:
+    if isinstance(phrase, str):
+      return [phrase]
+    terms = []
+    for item in phrase:
+      terms.extend(self.__flatten_phrase(item))
+    return terms
+
+  def __build_term_pattern(self, term: str) -> str:
+    return rf"(?<!\w)\(?{re.escape(term.lower().strip())}\)?(?!\w)"
+
+
+class CriteriaEngine:
+  __compiled_criteria: OrderedDict[bytes, CompiledCriteria]
+  __max_compiled_criteria: int
+
+  def __init__(self, max_compiled_criteria: int = 4):
+    self.__compiled_criteria = OrderedDict()
+    self.__max_compiled_criteria = max_compiled_criteria
+
+  # Compiled once per distinct set of criteria -- configs can be edited mid-run, so the key is rebuilt every call
+  def compile(self, quick_settings: QuickSettings, universal_config: UniversalConfig) -> CompiledCriteria:
+    key = self.__get_criteria_key(quick_settings, universal_config)
+    compiled_criteria = self.__compiled_criteria.get(key)
+    if compiled_criteria is None:
+      compiled_criteria = CompiledCriteria(key, quick_settings, universal_config)
+      self.__compiled_criteria[key] = compiled_criteria
+      if len(self.__compiled_criteria) > self.__max_compiled_criteria:
+        self.__compiled_criteria.popitem(last=False)
+    else:
+      self.__compiled_criteria.move_to_end(key)
+    return compiled_criteria
+
+  def evaluate(
+    self,
+    quick_settings: QuickSettings,
+    universal_config: UniversalConfig,
+    job_listing: JobListing
+  ) -> CriteriaVerdict:
+    return self.compile(quick_settings, universal_config).evaluate(job_listing)
+
+  def __get_criteria_key(self, quick_settings: QuickSettings, universal_config: UniversalConfig) -> bytes:
+    criteria = repr((
+      quick_settings.bot_behavior.job_listing_criteria.not_in_ignore,
+      quick_settings.bot_behavior.job_listing_criteria.is_in_ideal,
+      universal_config.bot_behavior.ideal,
+      universal_config.bot_behavior.ignore,
+      universal_config.bot_behavior.years_of_experience,
+      universal_config.search.salary
+    ))
+    return hashlib.blake2b(criteria.encode(), digest_size=16).digest()
@@ -1,35 +1,52 @@
 
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+import hashlib
 import logging
-from typing import List, Tuple
+from typing import Any, Dict, Iterator, List, Tuple
 from urllib.parse import quote_plus
-from sqlalchemy import create_engine, desc, func, or_
+from sqlalchemy import create_engine, delete, desc, event, func, insert, inspect, or_, select, text, update
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
-from entities.job_listings.abc_job_listing import JobListing
+from entities.criteria_verdict import CriteriaVerdict
+from entities.job_listing import JobListing
 from models.configs.system_config import DatabaseConfig
 from models.db.job_application_orm import JobApplicationORM
 from models.db.base import Base
+from models.db.company_orm import CompanyORM
+from models.db.description_orm import DescriptionORM
+from models.db.ignore_term_stat_orm import IgnoreTermStatORM
 from models.db.job_listing_orm import JobListingORM
 from models.db.rate_limit_orm import RateLimitORM
 from models.db.system_record_orm import SystemRecordORM
 from models.enums.platform import Platform
+from services.misc.company_normalizer import CompanyNormalizer
+from services.misc.description_search_index import DescriptionSearchIndex
+from services.misc.description_store import DescriptionStore
+
+
+SQLITE_ENGINE = "sqlite"
 
 
 class DatabaseManager:
   __engine: Engine
   __session_factory: sessionmaker
+  __description_store: DescriptionStore
+  __description_search_index: DescriptionSearchIndex
+  __company_normalizer: CompanyNormalizer
+  __company_ids: Dict[str, int]
+  __ignore_term_stats_checked: bool
 
   def __init__(self, database_config: DatabaseConfig):
-    engine = database_config.engine
-    username = database_config.username
-    password = quote_plus(database_config.password)
-    host = database_config.host
-    port = database_config.port
-    name = database_config.name
-    self.__engine = create_engine(f"{engine}://{username}:{password}@{host}:{port}/{name}")
+    self.__engine = self.__build_engine(database_config)
     Base.metadata.create_all(self.__engine)
+    self.__add_missing_columns()
+    self.__create_missing_indexes()
     self.__session_factory = sessionmaker(bind=self.__engine)
+    self.__ignore_term_stats_checked = False
+    self.__description_store = DescriptionStore(database_config.compress_descriptions)
+    self.__description_search_index = DescriptionSearchIndex(self.__engine)
+    self.__company_normalizer = CompanyNormalizer(database_config.company_aliases)
+    self.__company_ids = {}
 
   def get_session(self) -> Session:
     return self.__session_factory()
@@ -44,9 +61,11 @@ class DatabaseManager:
       estimated_post_time = job_listing_post_time
     else:
       estimated_post_time = datetime.now(timezone.utc)
+    # Only entries posted within a day either side count, so older rows never leave the database
+    db_estimated_post_time = func.coalesce(JobListingORM.post_time, JobListingORM.timestamp)
     with self.get_session() as session:
-      job_listing_entries: List[JobListingORM] = (
-        session.query(JobListingORM)
+      job_listing_entry = session.execute(
+        select(JobListingORM.id)
         .filter(
           JobListingORM.job_title == job_listing.get_title(),
           JobListingORM.company == job_listing.get_company(),
@@ -54,78 +73,340 @@ class DatabaseManager:
           or_(
             JobListingORM.platform == platform.value,
             JobListingORM.platform == Platform.COMPANY_WEBSITE.value,
-          )
+          ),
+          db_estimated_post_time > estimated_post_time - timedelta(days=1),
+          db_estimated_post_time < estimated_post_time + timedelta(days=1)
         )
-        .all()
-      )
-    for db_job_listing in job_listing_entries:
-      if db_job_listing.post_time:
-        db_estimated_post_time = db_job_listing.post_time
-      else:
-        db_estimated_post_time = db_job_listing.timestamp
-      time_diff = estimated_post_time - db_estimated_post_time
-      assert isinstance(time_diff, timedelta)
-      if time_diff.total_seconds() > -86400 and time_diff.total_seconds() < 86400:
-        return True
-    return False
+        .limit(1)
+      ).first()
+    return job_listing_entry is not None
 
   def create_new_job_listing(
     self,
     job_listing: JobListing,
     platform: Platform
-  ) -> None:
+  ) -> int | None:
     if self.job_listing_is_in_db(job_listing, platform):
-      return
-    job_listing_orm = self.__build_job_listing_orm(job_listing, platform)
+      return None
+    description = job_listing.get_description()
+    description_hash = self.__description_store.get_hash(description) if description is not None else None
     with self.get_session() as session:
-      job_listing_entry = session.query(JobListingORM).filter_by(
-        job_title=job_listing_orm.job_title,
-        company=job_listing_orm.company,
-        location=job_listing_orm.location,
-        platform=platform.value,
+      job_listing_entry = session.execute(
+        select(JobListingORM.id, JobListingORM.description_hash, JobListingORM.content_hash)
+        .filter_by(
+          job_title=job_listing.get_title(),
+          company=job_listing.get_company(),
+          location=job_listing.get_location(),
+          platform=platform.value
+        )
+        .limit(1)
       ).first()
       if job_listing_entry:
-        if job_listing_entry.min_pay != job_listing.get_min_pay():
-          job_listing_entry.min_pay = job_listing.get_min_pay()
-        if job_listing_entry.max_pay != job_listing.get_max_pay():
-          job_listing_entry.max_pay = job_listing.get_max_pay()
-        if job_listing_entry.min_yoe != job_listing.get_min_yoe():
-          job_listing_entry.min_yoe = job_listing.get_min_yoe()
-        if job_listing_entry.max_yoe != job_listing.get_max_yoe():
-          job_listing_entry.max_yoe = job_listing.get_max_yoe()
-        if job_listing_entry.description != job_listing.get_description():
-          job_listing_entry.description = job_listing.get_description()
-        if job_listing_entry.url != job_listing.get_url():
-          job_listing_entry.url = job_listing.get_url()
-        if job_listing_entry.post_time != job_listing.get_post_time():
-          job_listing_entry.post_time = job_listing.get_post_time()
-        session.commit()
-      else:
-        session.add(job_listing_orm)
+        job_listing_id, stored_description_hash, stored_content_hash = job_listing_entry
+        # A listing without a description (ex: brief scrapes) never blanks out one we already have
+        description_hash = description_hash or stored_description_hash
+        content_hash = self.__get_content_hash(job_listing, description_hash)
+        if content_hash == stored_content_hash:
+          return job_listing_id
+        if description_hash and description_hash != stored_description_hash:
+          self.__add_description_if_missing(session, description_hash, description)
+        session.execute(
+          update(JobListingORM)
+          .where(JobListingORM.id == job_listing_id)
+          .values(
+            company_id=self.__get_company_id(session, job_listing.get_company()),
+            **self.__build_mutable_values(job_listing, description_hash, content_hash)
+          )
+        )
         session.commit()
+        return job_listing_id
+      if description_hash:
+        self.__add_description_if_missing(session, description_hash, description)
+      job_listing_orm = self.__build_job_listing_orm(job_listing, platform, description_hash)
+      job_listing_orm.company_id = self.__get_company_id(session, job_listing.get_company())
+      session.add(job_listing_orm)
+      session.flush()
+      job_listing_id = job_listing_orm.id
+      session.commit()
+      return job_listing_id
 
-  def get_highest_job_listing_ignore_keywords(self, limit=10) -> List[Tuple[str, str, str, int]]:
+  # Reads the daily rollup rather than job_applications. since/until are inclusive days (UTC)
+  def get_highest_job_listing_ignore_keywords(
+    self,
+    limit=10,
+    since: date | None = None,
+    until: date | None = None
+  ) -> List[Tuple[str, str, str, int]]:
+    self.__ensure_ignore_term_stats()
     with self.get_session() as session:
-      top_ignore_terms_query = (
-        session.query(
-          JobApplicationORM.ignore_type,
-          JobApplicationORM.ignore_category,
-          JobApplicationORM.ignore_term,
-          func.count(JobApplicationORM.id).label("count")    # pylint: disable=not-callable
-        )
-        .filter(JobApplicationORM.ignore_type.isnot(None))
-        .filter(JobApplicationORM.ignore_category.isnot(None))
-        .filter(JobApplicationORM.ignore_term.isnot(None))
+      top_ignore_terms_query = session.query(
+        IgnoreTermStatORM.ignore_type,
+        IgnoreTermStatORM.ignore_category,
+        IgnoreTermStatORM.ignore_term,
+        func.sum(IgnoreTermStatORM.count).label("count")    # pylint: disable=not-callable
+      )
+      if since:
+        top_ignore_terms_query = top_ignore_terms_query.filter(IgnoreTermStatORM.day >= since)
+      if until:
+        top_ignore_terms_query = top_ignore_terms_query.filter(IgnoreTermStatORM.day <= until)
+      top_ignore_terms = (
+        top_ignore_terms_query
         .group_by(
+          IgnoreTermStatORM.ignore_type,
+          IgnoreTermStatORM.ignore_category,
+          IgnoreTermStatORM.ignore_term
+        )
+        .order_by(func.sum(IgnoreTermStatORM.count).desc())    # pylint: disable=not-callable
+        .limit(limit)
+        .all()
+      )
+      return [tuple(top_ignore_term) for top_ignore_term in top_ignore_terms]
+
+  def get_job_listing_descriptions(self, limit: int) -> List[str]:
+    with self.get_session() as session:
+      descriptions = (
+        session.query(JobListingORM.description, DescriptionORM.content, DescriptionORM.compression)
+        .outerjoin(DescriptionORM, JobListingORM.description_hash == DescriptionORM.hash)
+        .filter(or_(JobListingORM.description_hash.isnot(None), JobListingORM.description.isnot(None)))
+        .order_by(JobListingORM.id.desc())
+        .limit(limit)
+        .all()
+      )
+    descriptions = [
+      self.__resolve_description(legacy_description, content, compression)
+      for legacy_description, content, compression in descriptions
+    ]
+    return [description for description in descriptions if description]
+
+  # Distinct pay texts as the platforms showed them, newest first
+  def get_raw_pays(self, limit: int) -> List[str]:
+    with self.get_session() as session:
+      raw_pays = session.execute(
+        select(JobListingORM.raw_pay)
+        .filter(JobListingORM.raw_pay.isnot(None))
+        .group_by(JobListingORM.raw_pay)
+        .order_by(func.max(JobListingORM.id).desc())    # pylint: disable=not-callable
+        .limit(limit)
+      ).scalars().all()
+    return list(raw_pays)
+
+  # Streams through a server-side cursor so the whole table never sits in memory at once.
+  # since only yields listings first stored after it, for incremental exports
+  def iterate_job_listing_chunks(
+    self,
+    chunk_size: int,
+    since: datetime | None = None
+  ) -> Iterator[List[Dict[str, Any]]]:
+    job_listings_query = (
+      select(
+        JobListingORM.__table__,
+        DescriptionORM.content.label("description_content"),
+        DescriptionORM.compression.label("description_compression")
+      )
+      .outerjoin(DescriptionORM, JobListingORM.description_hash == DescriptionORM.hash)
+    )
+    if since:
+      job_listings_query = job_listings_query.filter(JobListingORM.timestamp > since)
+    with self.get_session() as session:
+      result = session.execute(
+        job_listings_query
+        .order_by(JobListingORM.id)
+        .execution_options(yield_per=chunk_size)
+      )
+      for chunk in result.mappings().partitions():
+        rows = []
+        for row in chunk:
+          row = dict(row)
+          row["description"] = self.__resolve_description(
+            row["description"],
+            row.pop("description_content"),
+            row.pop("description_compression")
+          )
+          rows.append(row)
+        yield rows
+
+  # Oldest first. Each row carries its resolved description and its job applications, ready to be archived
+  def get_job_listings_before(self, cutoff: datetime, limit: int) -> List[Dict[str, Any]]:
+    with self.get_session() as session:
+      job_listing_rows = session.execute(
+        select(
+          JobListingORM.__table__,
+          DescriptionORM.content.label("description_content"),
+          DescriptionORM.compression.label("description_compression")
+        )
+        .outerjoin(DescriptionORM, JobListingORM.description_hash == DescriptionORM.hash)
+        .filter(JobListingORM.timestamp < cutoff)
+        .order_by(JobListingORM.id)
+        .limit(limit)
+      ).mappings().all()
+      job_listings = {}
+      for row in job_listing_rows:
+        row = dict(row)
+        row["description"] = self.__resolve_description(
+          row["description"],
+          row.pop("description_content"),
+          row.pop("description_compression")
+        )
+        row["applications"] = []
+        job_listings[row["id"]] = row
+      if not job_listings:
+        return []
+      job_application_rows = session.execute(
+        select(JobApplicationORM.__table__)
+        .filter(JobApplicationORM.job_listing_id.in_(job_listings))
+        .order_by(JobApplicationORM.id)
+      ).mappings().all()
+    for row in job_application_rows:
+      job_listings[row["job_listing_id"]]["applications"].append(dict(row))
+    return list(job_listings.values())
+
+  # Also drops any descriptions that only these listings pointed at. Returns how many listings were deleted
+  def delete_job_listings(self, job_listing_ids: List[int]) -> int:
+    if not job_listing_ids:
+      return 0
+    self.__ensure_ignore_term_stats()
+    with self.get_session() as session:
+      description_hashes = set(session.execute(
+        select(JobListingORM.description_hash)
+        .filter(JobListingORM.id.in_(job_listing_ids))
+        .filter(JobListingORM.description_hash.isnot(None))
+      ).scalars())
+      ignore_term_deltas: Dict[Tuple[date, str, str, str], int] = {}
+      for timestamp, ignore_type, ignore_category, ignore_term in session.execute(
+        select(
+          JobApplicationORM.timestamp,
           JobApplicationORM.ignore_type,
           JobApplicationORM.ignore_category,
           JobApplicationORM.ignore_term
         )
-        .order_by(func.count(JobApplicationORM.id).desc())   # pylint: disable=not-callable
-        .limit(limit)
+        .filter(JobApplicationORM.job_listing_id.in_(job_listing_ids))
+      ):
+        self.__add_ignore_term_delta(ignore_term_deltas, timestamp, ignore_type, ignore_category, ignore_term, -1)
+      session.execute(delete(JobApplicationORM).where(JobApplicationORM.job_listing_id.in_(job_listing_ids)))
+      self.__apply_ignore_term_deltas(session, ignore_term_deltas)
+      deleted_count = session.execute(
+        delete(JobListingORM).where(JobListingORM.id.in_(job_listing_ids))
+      ).rowcount
+      if description_hashes:
+        still_referenced_hashes = select(JobListingORM.description_hash).filter(
+          JobListingORM.description_hash.in_(description_hashes)
+        )
+        session.execute(
+          delete(DescriptionORM)
+          .where(DescriptionORM.hash.in_(description_hashes))
+          .where(DescriptionORM.hash.not_in(still_referenced_hashes))
+        )
+        self.__description_search_index.remove_orphans(session, list(description_hashes))
+      session.commit()
+    return deleted_count
+
+  # Ranked best match first. Raises InvalidSearchQueryException for queries the backend can't run
+  def search_job_listings(self, query: str, page: int, page_size: int) -> List[Dict[str, Any]]:
+    if not self.__description_search_index.is_available():
+      return []
+    with self.get_session() as session:
+      return self.__description_search_index.search(session, query, page_size, (page - 1) * page_size)
+
+  # Indexes descriptions stored before the search index existed. Returns how many were added
+  def index_missing_descriptions(self, chunk_size: int) -> int:
+    if not self.__description_search_index.is_available():
+      return 0
+    indexed_count = 0
+    with self.get_session() as read_session, self.get_session() as write_session:
+      result = read_session.execute(
+        select(DescriptionORM.hash, DescriptionORM.content, DescriptionORM.compression)
+        .filter(DescriptionORM.hash.not_in(self.__description_search_index.get_indexed_hashes()))
+        .execution_options(yield_per=chunk_size)
       )
-      top_ignore_terms = top_ignore_terms_query.all()
-      return top_ignore_terms
+      for chunk in result.partitions():
+        for description_hash, content, compression in chunk:
+          description = self.__description_store.decode(content, compression)
+          self.__description_search_index.add(write_session, description_hash, description)
+        write_session.commit()
+        indexed_count += len(chunk)
+        logging.info("Indexed %s stored descriptions for search...", f"{indexed_count:,}")
+    return indexed_count
+
+  # Keyed by (job listing id, profile name). Returns how many job applications were inserted or changed
+  def write_job_application_verdicts(
+    self,
+    verdicts: Dict[Tuple[int, str], CriteriaVerdict]
+  ) -> int:
+    if not verdicts:
+      return 0
+    self.__ensure_ignore_term_stats()
+    with self.get_session() as session:
+      existing_job_applications = session.execute(
+        select(
+          JobApplicationORM.id,
+          JobApplicationORM.job_listing_id,
+          JobApplicationORM.profile,
+          JobApplicationORM.ignore_type,
+          JobApplicationORM.ignore_category,
+          JobApplicationORM.ignore_term,
+          JobApplicationORM.timestamp
+        )
+        .filter(JobApplicationORM.job_listing_id.in_({job_listing_id for job_listing_id, _ in verdicts}))
+        .filter(JobApplicationORM.profile.in_({profile_name for _, profile_name in verdicts}))
+      ).all()
+      judged_applications = set()
+      updates = []
+      ignore_term_deltas: Dict[Tuple[date, str, str, str], int] = {}
+      for (
+        job_application_id,
+        job_listing_id,
+        profile_name,
+        ignore_type,
+        ignore_category,
+        ignore_term,
+        timestamp
+      ) in existing_job_applications:
+        if (job_listing_id, profile_name) not in verdicts:
+          continue
+        judged_applications.add((job_listing_id, profile_name))
+        new_values = self.__build_verdict_values(verdicts[(job_listing_id, profile_name)])
+        if (ignore_type, ignore_category, ignore_term) != (
+          new_values["ignore_type"],
+          new_values["ignore_category"],
+          new_values["ignore_term"]
+        ):
+          updates.append({"id": job_application_id, **new_values})
+          self.__add_ignore_term_delta(ignore_term_deltas, timestamp, ignore_type, ignore_category, ignore_term, -1)
+          self.__add_ignore_term_delta(
+            ignore_term_deltas,
+            timestamp,
+            new_values["ignore_type"],
+            new_values["ignore_category"],
+            new_values["ignore_term"],
+            1
+          )
+      now = datetime.now(timezone.utc)
+      inserts = [
+        {
+          "job_listing_id": job_listing_id,
+          "profile": profile_name,
+          "timestamp": now,
+          **self.__build_verdict_values(verdict)
+        }
+        for (job_listing_id, profile_name), verdict in verdicts.items()
+        if (job_listing_id, profile_name) not in judged_applications
+      ]
+      for insert_values in inserts:
+        self.__add_ignore_term_delta(
+          ignore_term_deltas,
+          now,
+          insert_values["ignore_type"],
+          insert_values["ignore_category"],
+          insert_values["ignore_term"],
+          1
+        )
+      if updates:
+        session.execute(update(JobApplicationORM), updates)
+      if inserts:
+        session.execute(insert(JobApplicationORM), inserts)
+      self.__apply_ignore_term_deltas(session, ignore_term_deltas)
+      session.commit()
+    return len(updates) + len(inserts)
 
   def log_rate_limit_block(self, ip_address: str, platform: Platform) -> None:
     logging.warning("Rate limited by %s on address: %s", platform.value, ip_address)
@@ -137,31 +418,18 @@ class DatabaseManager:
       session.add(rate_limit_orm)
       session.commit()
 
-  def get_rate_limit_time_delta(self, ip_address: str, platform: Platform | None = None) -> timedelta:
+  def get_last_rate_limit_times(self) -> List[Tuple[str, str, datetime]]:
     with self.get_session() as session:
-      if platform:
-        last_rate_limit_from_host = (
-          session.query(RateLimitORM)
-            .filter(RateLimitORM.ip_address == ip_address)
-            .filter(RateLimitORM.platform == platform.value)
-            .order_by(desc(RateLimitORM.timestamp))
-            .first()
-        )
-      else:
-        last_rate_limit_from_host = (
-          session.query(RateLimitORM)
-            .filter(RateLimitORM.ip_address == ip_address)
-            .order_by(desc(RateLimitORM.timestamp))
-            .first()
+      last_rate_limit_times = (
+        session.query(
+          RateLimitORM.ip_address,
+          RateLimitORM.platform,
+          func.max(RateLimitORM.timestamp)    # pylint: disable=not-callable
         )
-    if last_rate_limit_from_host is None:
-      return timedelta.max
-    assert isinstance(last_rate_limit_from_host, RateLimitORM)
-    last_logged_rate_limit_timestamp = last_rate_limit_from_host.timestamp
-    assert isinstance(last_logged_rate_limit_timestamp, datetime)
-    now = datetime.now(timezone.utc)
-    time_delta = now - last_logged_rate_limit_timestamp
-    return time_delta
+        .group_by(RateLimitORM.ip_address, RateLimitORM.platform)
+        .all()
+      )
+    return [(ip_address, platform, timestamp) for ip_address, platform, timestamp in last_rate_limit_times]
 
   def log_system_record(
     self,
@@ -193,18 +461,246 @@ class DatabaseManager:
       )
     return last_system_record_orm
 
-  def __build_job_listing_orm(self, job_listing: JobListing, platform: Platform) -> JobListingORM:
+  def __build_engine(self, database_config: DatabaseConfig) -> Engine:
+    engine = database_config.engine
+    name = database_config.name
+    if engine == SQLITE_ENGINE:
+      return self.__build_sqlite_engine(name)
+    username = database_config.username
+    password = quote_plus(database_config.password)
+    host = database_config.host
+    port = database_config.port
+    return create_engine(f"{engine}://{username}:{password}@{host}:{port}/{name}")
+
+  # WAL lets a long streaming read (ex: reevaluate) run while the same process keeps writing
+  def __build_sqlite_engine(self, path: str) -> Engine:
+    sqlite_engine = create_engine(f"{SQLITE_ENGINE}:///{path}")
+    @event.listens_for(sqlite_engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record) -> None:    # pylint: disable=unused-argument
+      cursor = dbapi_connection.cursor()
+      cursor.execute("PRAGMA journal_mode=WAL")
+      cursor.execute("PRAGMA synchronous=NORMAL")
+      cursor.execute("PRAGMA foreign_keys=ON")
+      cursor.execute("PRAGMA busy_timeout=10000")
+      cursor.execute("PRAGMA temp_store=MEMORY")
+      cursor.execute("PRAGMA cache_size=-65536")
+      cursor.execute("PRAGMA mmap_size=268435456")
+      cursor.close()
+    return sqlite_engine
+
+  # create_all() never alters tables that already exist, so columns added to the models since get added here
+  def __add_missing_columns(self) -> None:
+    inspector = inspect(self.__engine)
+    existing_table_names = set(inspector.get_table_names())
+    with self.__engine.begin() as connection:
+      for table in Base.metadata.sorted_tables:
+        if table.name not in existing_table_names:
+          continue
+        existing_column_names = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+          if column.name in existing_column_names:
+            continue
+          logging.info("Adding missing column: %s.%s", table.name, column.name)
+          column_type = column.type.compile(dialect=self.__engine.dialect)
+          column_definition = f"{column.name} {column_type}"
+          if column.server_default is not None:
+            column_definition += f" DEFAULT '{column.server_default.arg}'"
+          connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column_definition}"))
+
+  def __create_missing_indexes(self) -> None:
+    # create_all() only builds indexes alongside brand new tables
+    for table in Base.metadata.sorted_tables:
+      for index in table.indexes:
+        index.create(self.__engine, checkfirst=True)
+
+  # Deltas applied to an empty rollup would stop it from ever being backfilled, so everything that reads or
+  # changes it checks first. Only the first call per run touches the database
+  def __ensure_ignore_term_stats(self) -> None:
+    if self.__ignore_term_stats_checked:
+      return
+    self.__backfill_ignore_term_stats()
+    self.__ignore_term_stats_checked = True
+
+  # Tables from before the rollup existed get it built once from job_applications
+  def __backfill_ignore_term_stats(self, chunk_size: int = 10000) -> None:
+    with self.get_session() as session:
+      if session.execute(select(IgnoreTermStatORM.day).limit(1)).first() is not None:
+        return
+      ignore_term_deltas: Dict[Tuple[date, str, str, str], int] = {}
+      for timestamp, ignore_type, ignore_category, ignore_term in session.execute(
+        select(
+          JobApplicationORM.timestamp,
+          JobApplicationORM.ignore_type,
+          JobApplicationORM.ignore_category,
+          JobApplicationORM.ignore_term
+        )
+        .filter(JobApplicationORM.ignore_term.isnot(None))
+        .execution_options(yield_per=chunk_size)
+      ):
+        self.__add_ignore_term_delta(ignore_term_deltas, timestamp, ignore_type, ignore_category, ignore_term, 1)
+      if not ignore_term_deltas:
+        return
+      logging.info("Building ignore term stats from %s job applications...", f"{sum(ignore_term_deltas.values()):,}")
+      self.__apply_ignore_term_deltas(session, ignore_term_deltas)
+      session.commit()
+
+  # Counted the same way the old GROUP BY over job_applications did: only fully filled in ignore verdicts
+  def __add_ignore_term_delta(
+    self,
+    ignore_term_deltas: Dict[Tuple[date, str, str, str], int],
+    timestamp: datetime | None,
+    ignore_type: str | None,
+    ignore_category: str | None,
+    ignore_term: str | None,
+    delta: int
+  ) -> None:
+    if timestamp is None or ignore_type is None or ignore_category is None or ignore_term is None:
+      return
+    if timestamp.tzinfo:
+      timestamp = timestamp.astimezone(timezone.utc)
+    key = (timestamp.date(), ignore_type, ignore_category, ignore_term)
+    ignore_term_deltas[key] = ignore_term_deltas.get(key, 0) + delta
+
+  def __apply_ignore_term_deltas(
+    self,
+    session: Session,
+    ignore_term_deltas: Dict[Tuple[date, str, str, str], int]
+  ) -> None:
+    ignore_term_deltas = {key: delta for key, delta in ignore_term_deltas.items() if delta}
+    if not ignore_term_deltas:
+      return
+    days = {day for day, _, _, _ in ignore_term_deltas}
+    ignore_terms = {ignore_term for _, _, _, ignore_term in ignore_term_deltas}
+    existing_counts = {
+      (day, ignore_type, ignore_category, ignore_term): count
+      for day, ignore_type, ignore_category, ignore_term, count in session.execute(
+        select(
+          IgnoreTermStatORM.day,
+          IgnoreTermStatORM.ignore_type,
+          IgnoreTermStatORM.ignore_category,
+          IgnoreTermStatORM.ignore_term,
+          IgnoreTermStatORM.count
+        )
+        .filter(IgnoreTermStatORM.day.in_(days))
+        .filter(IgnoreTermStatORM.ignore_term.in_(ignore_terms))
+        .with_for_update()
+      )
+    }
+    updates = []
+    inserts = []
+    for (day, ignore_type, ignore_category, ignore_term), delta in ignore_term_deltas.items():
+      values = {"day": day, "ignore_type": ignore_type, "ignore_category": ignore_category, "ignore_term": ignore_term}
+      existing_count = existing_counts.get((day, ignore_type, ignore_category, ignore_term))
+      if existing_count is None:
+        inserts.append({**values, "count": delta})
+      else:
+        updates.append({**values, "count": existing_count + delta})
+    if updates:
+      session.execute(update(IgnoreTermStatORM), updates)
+    if inserts:
+      session.execute(insert(IgnoreTermStatORM), inserts)
+    session.execute(
+      delete(IgnoreTermStatORM)
+      .where(IgnoreTermStatORM.day.in_(days))
+      .where(IgnoreTermStatORM.count <= 0)
+    )
+
+  def __build_verdict_values(self, verdict: CriteriaVerdict) -> Dict[str, str | bool | None]:
+    ignore_type = verdict.get_ignore_type()
+    ignore_category = verdict.get_ignore_category()
+    ignore_term = verdict.get_ignore_term()
+    return {
+      "applied": verdict.passes(),
+      "ignore_type": ignore_type.value if ignore_type else None,
+      "ignore_category": ignore_category.value if ignore_category else None,
+      "ignore_term": ignore_term
+    }
+
+  # Companies are only ever added, so ids are remembered for the life of the process
+  def __get_company_id(self, session: Session, company: str) -> int:
+    normalized_name = self.__company_normalizer.normalize(company)
+    company_id = self.__company_ids.get(normalized_name)
+    if company_id is not None:
+      return company_id
+    company_id = session.execute(
+      select(CompanyORM.id).filter(CompanyORM.normalized_name == normalized_name)
+    ).scalar()
+    if company_id is None:
+      company_orm = CompanyORM(normalized_name=normalized_name, display_name=company)
+      session.add(company_orm)
+      session.flush()
+      company_id = company_orm.id
+    self.__company_ids[normalized_name] = company_id
+    return company_id
+
+  def __add_description_if_missing(self, session: Session, description_hash: str, description: str) -> None:
+    if session.get(DescriptionORM, description_hash) is not None:
+      return
+    content, compression = self.__description_store.encode(description)
+    session.add(DescriptionORM(hash=description_hash, content=content, compression=compression))
+    self.__description_search_index.add(session, description_hash, description)
+
+  def __resolve_description(
+    self,
+    legacy_description: str | None,
+    content: bytes | None,
+    compression: str | None
+  ) -> str | None:
+    if content is not None:
+      return self.__description_store.decode(content, compression)
+    return legacy_description
+
+  # Covers every column an update can change, so an equal hash means there's nothing to write
+  def __get_content_hash(self, job_listing: JobListing, description_hash: str | None) -> str:
+    mutable_fields = repr((
+      job_listing.get_min_pay(),
+      job_listing.get_max_pay(),
+      job_listing.get_raw_pay(),
+      job_listing.get_min_yoe(),
+      job_listing.get_max_yoe(),
+      description_hash,
+      job_listing.get_url(),
+      job_listing.get_post_time().isoformat() if job_listing.get_post_time() else None
+    ))
+    return hashlib.blake2b(mutable_fields.encode(), digest_size=16).hexdigest()
+
+  def __build_mutable_values(
+    self,
+    job_listing: JobListing,
+    description_hash: str | None,
+    content_hash: str
+  ) -> Dict[str, Any]:
+    mutable_values = {
+      "min_pay": job_listing.get_min_pay(),
+      "max_pay": job_listing.get_max_pay(),
+      "raw_pay": job_listing.get_raw_pay(),
+      "min_yoe": job_listing.get_min_yoe(),
+      "max_yoe": job_listing.get_max_yoe(),
+      "description_hash": description_hash,
+      "url": job_listing.get_url(),
+      "post_time": job_listing.get_post_time(),
+      "content_hash": content_hash
+    }
+    if description_hash:
+      # The text now lives in descriptions, so a pre-dedup inline copy would only go stale
+      mutable_values["description"] = None
+    return mutable_values
+
+  def __build_job_listing_orm(
+    self,
+    job_listing: JobListing,
+    platform: Platform,
+    description_hash: str | None
+  ) -> JobListingORM:
     job_listing_orm = JobListingORM(
       job_title=job_listing.get_title(),
       company=job_listing.get_company(),
       location=job_listing.get_location(),
-      min_pay=job_listing.get_min_pay(),
-      max_pay=job_listing.get_max_pay(),
-      min_yoe=job_listing.get_min_yoe(),
-      max_yoe=job_listing.get_max_yoe(),
-      description=job_listing.get_description(),
       platform=platform.value,
-      url=job_listing.get_url(),
-      post_time=job_listing.get_post_time()
+      **self.__build_mutable_values(
+        job_listing,
+        description_hash,
+        self.__get_content_hash(job_listing, description_hash)
+      )
     )
     return job_listing_orm
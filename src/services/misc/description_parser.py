@@ -0,0 +1,23 @@
+from dataclasses import replace
+from entities.job_listing import JobListing
+from services.html_text_extractors.abc_html_text_extractor import HtmlTextExtractor
+from services.misc.yoe_parser import YoeParser
+
+
+class DescriptionParser:
+  __html_text_extractor: HtmlTextExtractor
+  __yoe_parser: YoeParser
+
+  def __init__(self, html_text_extractor: HtmlTextExtractor):
+    self.__html_text_extractor = html_text_extractor
+    self.__yoe_parser = YoeParser()
+
+  def parse(self, job_listing: JobListing, raw_description: str | None) -> JobListing:
+    if raw_description is None:
+      return replace(job_listing, description=None, min_yoe=None, max_yoe=None)
+    description = self.__html_text_extractor.get_text(raw_description)
+    if description:
+      min_yoe, max_yoe = self.__yoe_parser.parse(description)
+    else:
+      min_yoe, max_yoe = (None, None)
+    return replace(job_listing, description=description, min_yoe=min_yoe, max_yoe=max_yoe)
@@ -0,0 +1,144 @@
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+import logging
+import multiprocessing
+from typing import Deque, Dict, List, Tuple
+from entities.criteria_verdict import CriteriaVerdict
+from entities.job_listing import JobListing
+from models.configs.profile_config import CriteriaProfile
+from models.configs.quick_settings import QuickSettings
+from models.configs.universal_config import UniversalConfig
+from models.enums.platform import Platform
+from services.html_text_extractors.abc_html_text_extractor import HtmlTextExtractor
+from services.html_text_extractors.html_text_extractor_factory import HtmlTextExtractorFactory
+from services.misc.description_parser import DescriptionParser
+from services.misc.profile_criteria_checker import ProfileCriteriaChecker
+
+
+class DescriptionWorker:
+  __description_parser: DescriptionParser
+  __criteria_checker: ProfileCriteriaChecker
+  __quick_settings: QuickSettings
+  __universal_config: UniversalConfig
+  __criteria_profiles: List[CriteriaProfile]
+
+  def __init__(
+    self,
+    html_text_extractor: HtmlTextExtractor,
+    quick_settings: QuickSettings,
+    universal_config: UniversalConfig,
+    criteria_profiles: List[CriteriaProfile]
+  ):
+    self.__description_parser = DescriptionParser(html_text_extractor)
+    self.__criteria_checker = ProfileCriteriaChecker()
+    self.__quick_settings = quick_settings
+    self.__universal_config = universal_config
+    self.__criteria_profiles = criteria_profiles
+
+  def process(
+    self,
+    job_listing: JobListing,
+    raw_description: str | None
+  ) -> Tuple[JobListing, Dict[str, CriteriaVerdict]]:
+    job_listing = self.__description_parser.parse(job_listing, raw_description)
+    criteria_verdicts = self.__criteria_checker.evaluate(
+      self.__quick_settings,
+      self.__universal_config,
+      self.__criteria_profiles,
+      job_listing
+    )
+    return (job_listing, criteria_verdicts)
+
+
+_process_worker: DescriptionWorker | None = None
+
+# Runs once per worker process, so the configs are pickled once per worker instead of once per listing
+def _init_process_worker(
+  html_text_extractor_type: str,
+  quick_settings: QuickSettings,
+  universal_config: UniversalConfig,
+  criteria_profiles: List[CriteriaProfile]
+) -> None:
+  global _process_worker    # pylint: disable=global-statement
+  _process_worker = DescriptionWorker(
+    HtmlTextExtractorFactory().build(html_text_extractor_type),
+    quick_settings,
+    universal_config,
+    criteria_profiles
+  )
+
+def _process_in_worker(
+  job_listing: JobListing,
+  raw_description: str | None
+) -> Tuple[JobListing, Dict[str, CriteriaVerdict]]:
+  return _process_worker.process(job_listing, raw_description)
+
+
+class DescriptionPipeline:
+  __executor: ProcessPoolExecutor | None
+  __html_text_extractor: HtmlTextExtractor
+  __inline_worker: DescriptionWorker
+  __pending: Dict[Platform, Deque[Future]]
+
+  def __init__(
+    self,
+    worker_count: int,
+    html_text_extractor_type: str,
+    quick_settings: QuickSettings,
+    universal_config: UniversalConfig,
+    criteria_profiles: List[CriteriaProfile]
+  ):
+    if worker_count > 0:
+      # Spawned rather than forked -- the parent is full of browser/proxy threads that shouldn't be copied
+      self.__executor = ProcessPoolExecutor(
+        max_workers=worker_count,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_process_worker,
+        initargs=(html_text_extractor_type, quick_settings, universal_config, criteria_profiles)
+      )
+    else:
+      self.__executor = None
+    self.__html_text_extractor = HtmlTextExtractorFactory().build(html_text_extractor_type)
+    self.__inline_worker = DescriptionWorker(
+      self.__html_text_extractor,
+      quick_settings,
+      universal_config,
+      criteria_profiles
+    )
+    self.__pending = {}
+
+  def submit(self, platform: Platform, job_listing: JobListing, raw_description: str | None) -> None:
+    pending = self.__pending.setdefault(platform, deque())
+    if self.__executor is None:
+      future = Future()
+      future.set_result(self.__inline_worker.process(job_listing, raw_description))
+    else:
+      future = self.__executor.submit(_process_in_worker, job_listing, raw_description)
+    pending.append(future)
+
+  def get_completed(self, platform: Platform, block: bool = False) -> List[Tuple[JobListing, Dict[str, CriteriaVerdict]]]:
+    pending = self.__pending.get(platform)
+    if not pending:
+      return []
+    if block:
+      wait(pending)
+    completed = []
+    # Results are handed back in submission order, so stop at the first one still running
+    while pending and pending[0].done():
+      future = pending.popleft()
+      try:
+        completed.append(future.result())
+      except Exception:
+        logging.exception("Failed to post-process job description. Dropping job listing...")
+    return completed
+
+  def get_html_text_extractor(self) -> HtmlTextExtractor:
+    return self.__html_text_extractor
+
+  def get_pending_count(self) -> int:
+    return sum(len(pending) for pending in self.__pending.values())
+
+  def shutdown(self) -> None:
+    if self.__executor:
+      self.__executor.shutdown(wait=True, cancel_futures=False)
+      self.__executor = None
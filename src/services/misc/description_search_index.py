@@ -0,0 +1,116 @@
+import logging
+from typing import Any, Dict, List
+from sqlalchemy import Select, column, delete, select, table, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from models.db.description_orm import DescriptionORM
+from services.misc.search_query_parser import SearchQueryParser
+
+
+# One row per distinct description (see DescriptionStore), keyed by the same hash. Descriptions may be stored
+# compressed, so documents are built from the text at write time rather than by the database from the column
+class DescriptionSearchIndex:
+  POSTGRESQL_DIALECT = "postgresql"
+  SQLITE_DIALECT = "sqlite"
+  __TABLE_NAME = "description_search"
+  __TABLE = table(__TABLE_NAME, column("hash"))
+  __dialect: str
+  __is_available: bool
+  __search_query_parser: SearchQueryParser
+
+  def __init__(self, engine: Engine):
+    self.__dialect = engine.dialect.name
+    self.__search_query_parser = SearchQueryParser()
+    self.__is_available = self.__create_if_missing(engine)
+
+  def is_available(self) -> bool:
+    return self.__is_available
+
+  # Only called for descriptions that were just stored, or that get_indexed_hashes() doesn't cover yet
+  def add(self, session: Session, description_hash: str, description: str) -> None:
+    if not self.__is_available:
+      return
+    if self.__dialect == self.POSTGRESQL_DIALECT:
+      session.execute(
+        text(
+          f"INSERT INTO {self.__TABLE_NAME} (hash, document) VALUES (:hash, to_tsvector('english', :description)) "
+          "ON CONFLICT (hash) DO NOTHING"
+        ),
+        {"hash": description_hash, "description": description}
+      )
+    else:
+      # FTS5 can't index hash for a uniqueness check, so this relies on the callers above
+      session.execute(
+        text(f"INSERT INTO {self.__TABLE_NAME} (hash, document) VALUES (:hash, :description)"),
+        {"hash": description_hash, "description": description}
+      )
+
+  # Drops entries whose description no longer exists
+  def remove_orphans(self, session: Session, description_hashes: List[str]) -> None:
+    if not self.__is_available or not description_hashes:
+      return
+    session.execute(
+      delete(self.__TABLE)
+      .where(self.__TABLE.c.hash.in_(description_hashes))
+      .where(self.__TABLE.c.hash.not_in(select(DescriptionORM.hash)))
+    )
+
+  def get_indexed_hashes(self) -> Select:
+    return select(self.__TABLE.c.hash)
+
+  # Best match first. Every listing sharing a matching description is returned
+  def search(self, session: Session, query: str, limit: int, offset: int) -> List[Dict[str, Any]]:
+    clauses = self.__search_query_parser.parse(query)
+    if self.__dialect == self.POSTGRESQL_DIALECT:
+      search_query = text(
+        "SELECT job_listings.id, job_listings.job_title, job_listings.company, job_listings.location, "
+        "job_listings.platform, job_listings.url, job_listings.timestamp, "
+        f"ts_rank_cd({self.__TABLE_NAME}.document, search_query) AS rank "
+        f"FROM {self.__TABLE_NAME} CROSS JOIN to_tsquery('english', :search_query) AS search_query "
+        f"JOIN job_listings ON job_listings.description_hash = {self.__TABLE_NAME}.hash "
+        f"WHERE {self.__TABLE_NAME}.document @@ search_query "
+        "ORDER BY rank DESC, job_listings.id DESC LIMIT :limit OFFSET :offset"
+      )
+      search_query_text = self.__search_query_parser.to_tsquery(clauses)
+    else:
+      # bm25() scores better matches lower
+      search_query = text(
+        "SELECT job_listings.id, job_listings.job_title, job_listings.company, job_listings.location, "
+        "job_listings.platform, job_listings.url, job_listings.timestamp, "
+        f"-bm25({self.__TABLE_NAME}) AS rank "
+        f"FROM {self.__TABLE_NAME} "
+        f"JOIN job_listings ON job_listings.description_hash = {self.__TABLE_NAME}.hash "
+        f"WHERE {self.__TABLE_NAME} MATCH :search_query "
+        "ORDER BY rank DESC, job_listings.id DESC LIMIT :limit OFFSET :offset"
+      )
+      search_query_text = self.__search_query_parser.to_fts5(clauses)
+    results = session.execute(
+      search_query,
+      {"search_query": search_query_text, "limit": limit, "offset": offset}
+    ).mappings().all()
+    return [dict(result) for result in results]
+
+  def __create_if_missing(self, engine: Engine) -> bool:
+    if self.__dialect == self.POSTGRESQL_DIALECT:
+      with engine.begin() as connection:
+        connection.execute(text(
+          f"CREATE TABLE IF NOT EXISTS {self.__TABLE_NAME} (hash VARCHAR(64) PRIMARY KEY, document TSVECTOR NOT NULL)"
+        ))
+        connection.execute(text(
+          f"CREATE INDEX IF NOT EXISTS ix_{self.__TABLE_NAME}_document ON {self.__TABLE_NAME} USING GIN (document)"
+        ))
+      return True
+    if self.__dialect == self.SQLITE_DIALECT:
+      try:
+        with engine.begin() as connection:
+          connection.execute(text(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.__TABLE_NAME} "
+            "USING fts5(hash UNINDEXED, document, tokenize='porter unicode61')"
+          ))
+        return True
+      except OperationalError:
+        logging.warning("This sqlite build has no FTS5. Description search is disabled...")
+        return False
+    logging.warning("Description search isn't supported on %s. Description search is disabled...", self.__dialect)
+    return False
@@ -0,0 +1,39 @@
+import hashlib
+import logging
+from typing import Tuple
+from exceptions.compressed_description_unreadable_exception import CompressedDescriptionUnreadableException
+try:
+  import zstandard
+  ZSTANDARD_IS_INSTALLED = True
+except ImportError:
+  ZSTANDARD_IS_INSTALLED = False
+
+
+class DescriptionStore:
+  ZSTD_COMPRESSION = "zstd"
+  __compress: bool
+  __compressor: "zstandard.ZstdCompressor | None"
+
+  def __init__(self, compress: bool):
+    if compress and not ZSTANDARD_IS_INSTALLED:
+      logging.warning("zstandard isn't installed. Storing job descriptions uncompressed...")
+      compress = False
+    self.__compress = compress
+    self.__compressor = zstandard.ZstdCompressor(level=10) if compress else None
+
+  def get_hash(self, description: str) -> str:
+    return hashlib.blake2b(description.encode(), digest_size=32).hexdigest()
+
+  def encode(self, description: str) -> Tuple[bytes, str | None]:
+    raw_description = description.encode()
+    if self.__compressor is None:
+      return (raw_description, None)
+    return (self.__compressor.compress(raw_description), self.ZSTD_COMPRESSION)
+
+  # Rows written with compression on still have to be readable after it gets switched off
+  def decode(self, content: bytes, compression: str | None) -> str:
+    if compression == self.ZSTD_COMPRESSION:
+      if not ZSTANDARD_IS_INSTALLED:
+        raise CompressedDescriptionUnreadableException("Stored job description is zstd compressed, but zstandard isn't installed.")
+      return zstandard.ZstdDecompressor().decompress(content).decode()
+    return content.decode()
@@ -0,0 +1,111 @@
+import logging
+import math
+import time
+from typing import Callable, Dict, List
+from models.configs.quick_settings import FilterPipelineSettings
+from models.enums.filter_stage import FilterStage
+
+
+class FilterStageStats:
+  __runs: int
+  __rejections: int
+  __total_seconds: float
+
+  def __init__(self):
+    self.__runs = 0
+    self.__rejections = 0
+    self.__total_seconds = 0.0
+
+  def record(self, seconds: float, passed: bool) -> None:
+    self.__runs += 1
+    self.__total_seconds += seconds
+    if not passed:
+      self.__rejections += 1
+
+  def get_runs(self) -> int:
+    return self.__runs
+
+  def get_rejections(self) -> int:
+    return self.__rejections
+
+  def get_rejection_rate(self) -> float:
+    if self.__runs == 0:
+      return 0.0
+    return self.__rejections / self.__runs
+
+  def get_average_seconds(self) -> float:
+    if self.__runs == 0:
+      return 0.0
+    return self.__total_seconds / self.__runs
+
+  # Expected time spent per listing rejected -- the lowest goes first
+  def get_rank(self) -> float:
+    if self.__runs == 0:
+      return 0.0
+    if self.__rejections == 0:
+      return math.inf
+    return self.__total_seconds / self.__rejections
+
+
+class FilterPipeline:
+  __checks: Dict[FilterStage, Callable[..., bool]]
+  __stages: List[FilterStage]
+  __stats: Dict[FilterStage, FilterStageStats]
+  __adaptive: bool
+  __reorder_every: int
+  __runs_since_reorder: int
+
+  def __init__(self, checks: Dict[FilterStage, Callable[..., bool]], settings: FilterPipelineSettings):
+    self.__checks = checks
+    known_stage_names = {stage.value for stage in checks}
+    configured_stages = [
+      FilterStage(stage_name)
+      for stage_name in settings.stage_order
+      if stage_name in known_stage_names
+    ]
+    self.__stages = configured_stages + [stage for stage in checks if stage not in configured_stages]
+    self.__stats = {stage: FilterStageStats() for stage in checks}
+    self.__adaptive = settings.adaptive
+    self.__reorder_every = max(settings.reorder_every, 1)
+    self.__runs_since_reorder = 0
+
+  # Returns the stage that rejected, or None if every stage passed
+  def run(self, *args) -> FilterStage | None:
+    rejected_by = None
+    for stage in self.__stages:
+      start_time = time.perf_counter()
+      passed = self.__checks[stage](*args)
+      self.__stats[stage].record(time.perf_counter() - start_time, passed)
+      if not passed:
+        rejected_by = stage
+        break
+    self.__runs_since_reorder += 1
+    if self.__adaptive and self.__runs_since_reorder >= self.__reorder_every:
+      self.__reorder()
+    return rejected_by
+
+  def get_stages(self) -> List[FilterStage]:
+    return list(self.__stages)
+
+  def get_stats(self) -> Dict[FilterStage, FilterStageStats]:
+    return self.__stats
+
+  def log_stats(self, name: str) -> None:
+    logging.info("%s filter stages (in current order):", name)
+    for stage in self.__stages:
+      stats = self.__stats[stage]
+      logging.info(
+        "\t%s:\t%s runs\t%s rejected (%.1f%%)\t%.3fms avg",
+        stage.value,
+        f"{stats.get_runs():,}",
+        f"{stats.get_rejections():,}",
+        stats.get_rejection_rate() * 100,
+        stats.get_average_seconds() * 1000
+      )
+
+  def __reorder(self) -> None:
+    self.__runs_since_reorder = 0
+    reordered_stages = sorted(self.__stages, key=lambda stage: self.__stats[stage].get_rank())
+    if reordered_stages != self.__stages:
+      logging.debug("Reordering filter stages: %s", [stage.value for stage in reordered_stages])
+      self.__stages = reordered_stages
@@ -0,0 +1,77 @@
+import html
+import logging
+import time
+from typing import List, Tuple
+from models.enums.html_text_extractor_type import HtmlTextExtractorType
+from services.html_text_extractors.abc_html_text_extractor import HtmlTextExtractor
+from services.html_text_extractors.html_text_extractor_factory import HtmlTextExtractorFactory
+from services.misc.database_manager import DatabaseManager
+
+
+class HtmlTextExtractorBenchmark:
+  __database_manager: DatabaseManager
+  __html_text_extractor_factory: HtmlTextExtractorFactory
+
+  def __init__(self, database_manager: DatabaseManager):
+    self.__database_manager = database_manager
+    self.__html_text_extractor_factory = HtmlTextExtractorFactory()
+
+  def run(self, limit: int, repeat: int) -> None:
+    descriptions = self.__database_manager.get_job_listing_descriptions(limit)
+    if not descriptions:
+      logging.warning("No stored job descriptions to benchmark against.")
+      return
+    # Only parsed text is stored, so every line goes back into its own element -- the baseline must reproduce it
+    raw_descriptions = [self.__rebuild_html(description) for description in descriptions]
+    baseline_extractor = self.__html_text_extractor_factory.build(HtmlTextExtractorType.BEAUTIFULSOUP.value)
+    expected_texts = [baseline_extractor.get_text(raw_description) for raw_description in raw_descriptions]
+    baseline_mismatch_count = len([
+      expected_text for expected_text, description in zip(expected_texts, descriptions)
+      if expected_text != "\n".join(line.strip() for line in description.splitlines() if line.strip())
+    ])
+    logging.info(
+      "Benchmarking html text extractors over %s stored descriptions (%s rounds). Baseline round trip mismatches: %s",
+      len(raw_descriptions),
+      repeat,
+      baseline_mismatch_count
+    )
+    baseline_seconds = None
+    for extractor_type in HtmlTextExtractorType:
+      html_text_extractor = self.__html_text_extractor_factory.build_without_fallback(extractor_type.value)
+      if html_text_extractor.reads_rendered_text():
+        logging.info("%s:\tskipped -- reads rendered text from the browser", extractor_type.value)
+        continue
+      if not html_text_extractor.is_available():
+        logging.info("%s:\tskipped -- not installed", extractor_type.value)
+        continue
+      seconds, mismatch_count = self.__time_extractor(html_text_extractor, raw_descriptions, expected_texts, repeat)
+      if baseline_seconds is None:
+        baseline_seconds = seconds
+      logging.info(
+        "%s:\t%.1f descriptions/s\t%.2fx baseline\t%s mismatches",
+        extractor_type.value,
+        (len(raw_descriptions) * repeat) / seconds if seconds else float("inf"),
+        baseline_seconds / seconds if seconds else float("inf"),
+        mismatch_count
+      )
+
+  def __time_extractor(
+    self,
+    html_text_extractor: HtmlTextExtractor,
+    raw_descriptions: List[str],
+    expected_texts: List[str],
+    repeat: int
+  ) -> Tuple[float, int]:
+    texts = []
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+      texts = [html_text_extractor.get_text(raw_description) for raw_description in raw_descriptions]
+    seconds = time.perf_counter() - start_time
+    mismatch_count = len([
+      text for text, expected_text in zip(texts, expected_texts) if text != expected_text
+    ])
+    return (seconds, mismatch_count)
+
+  def __rebuild_html(self, description: str) -> str:
+    paragraphs = "".join(f"<p>{html.escape(line)}</p>" for line in description.splitlines())
+    return f"<div>{paragraphs}</div>"
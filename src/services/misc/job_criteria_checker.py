@@ -1,209 +1,137 @@
+from collections import OrderedDict
+import hashlib
 import logging
-import re
-from typing import List
-from entities.job_listings.abc_job_listing import JobListing
+from typing import Callable, Dict, List, Tuple
+from entities.criteria_verdict import CriteriaVerdict
+from entities.job_listing import JobListing
 from models.configs.quick_settings import QuickSettings
-from models.configs.universal_config import SearchSalary, UniversalConfig, YearsOfExperience
-from models.enums.language import Language
+from models.configs.universal_config import UniversalConfig
+from models.enums.filter_stage import FilterStage
 from models.enums.ignore_category import IgnoreCategory
 from models.enums.ignore_type import IgnoreType
+from services.misc.criteria_engine import PASSING_VERDICT, CompiledCriteria, CriteriaEngine
+from services.misc.filter_pipeline import FilterPipeline
 
 
 class JobCriteriaChecker():
-  __passes: bool
-  __job_listing: JobListing | None
-  __ignore_type: IgnoreType | None
-  __ignore_category: IgnoreCategory | None
-  __ignore_term: str | None
-
-  def __init__(self):
-    self.__passes = False
-    self.__job_listing = None
-    self.__ignore_type = None
-    self.__ignore_category = None
-    self.__ignore_term = None
-
-  def passes(self, quick_settings: QuickSettings, universal_config: UniversalConfig, job_listing: JobListing):
-    self.__passes = False
-    self.__job_listing = job_listing
-    self.__ignore_type = None
-    self.__ignore_category = None
-    self.__ignore_term = None
-    self.__handle_ideal_criteria(quick_settings, universal_config)
-    if not self.__ignore_type and not self.__ignore_category and not self.__ignore_term:
-      self.__handle_language_ignore(universal_config)
-    if not self.__ignore_type and not self.__ignore_category and not self.__ignore_term:
-      self.__handle_ignore_criteria(quick_settings, universal_config)
-    self.__passes = (
-      self.__ignore_type is None
-      and self.__ignore_category is None
-      and self.__ignore_term is None
-    )
-    return self.__passes
-
-  def __handle_ideal_criteria(self, quick_settings: QuickSettings, universal_config: UniversalConfig) -> None:
-    assert self.__job_listing
-    if not quick_settings.bot_behavior.job_listing_criteria.is_in_ideal:
-      return
-    title = self.__job_listing.get_title().lower().strip()
-    for ideal_title in universal_config.bot_behavior.ideal.titles:
-      if self.__phrase_is_in_phrase(ideal_title, title):
-        return
-    company = self.__job_listing.get_company().lower().strip()
-    for ideal_company in universal_config.bot_behavior.ideal.companies:
-      if self.__phrase_is_in_phrase(ideal_company, company):
-        return
-    location = self.__job_listing.get_location().lower().strip()
-    for ideal_location in universal_config.bot_behavior.ideal.locations:
-      if self.__phrase_is_in_phrase(ideal_location, location):
-        return
-    logging.info("Ignoring because listing doesn't meet defined \"ideal\" criteria.")
-    self.__ignore_type = IgnoreType.NOT_IN_IDEAL
-
-  def __handle_language_ignore(self, universal_config: UniversalConfig) -> None:
-    assert self.__job_listing
-    # TODO: Pull language from config
-    job_listing_language = self.__job_listing.get_language().value
-    if job_listing_language == Language.ENGLISH.value:
-      return
-    logging.info("Ignoring because listing language is: %s", job_listing_language)
-    self.__ignore_type = IgnoreType.LANGUAGE
-    self.__ignore_category = IgnoreCategory.LANGUAGE
-    self.__ignore_term = job_listing_language
-
-  def __handle_ignore_criteria(self, quick_settings: QuickSettings, universal_config: UniversalConfig):
-    if not quick_settings.bot_behavior.job_listing_criteria.not_in_ignore:
-      return
-    if not self.__ignore_type and not self.__ignore_category and not self.__ignore_term:
-      self.__handle_potential_title_ignore(universal_config.bot_behavior.ignore.titles)
-    if not self.__ignore_type and not self.__ignore_category and not self.__ignore_term:
-      self.__handle_potential_company_ignore(universal_config.bot_behavior.ignore.companies)
-    if not self.__ignore_type and not self.__ignore_category and not self.__ignore_term:
-      self.__handle_potential_location_ignore(universal_config.bot_behavior.ignore.locations)
-    if not self.__ignore_type and not self.__ignore_category and not self.__ignore_term:
-      self.__handle_potential_description_ignore(universal_config.bot_behavior.ignore.descriptions)
-    if not self.__ignore_type and not self.__ignore_category and not self.__ignore_term:
-      self.__handle_potential_pay_ignore(universal_config.search.salary)
-    if not self.__ignore_type and not self.__ignore_category and not self.__ignore_term:
-      self.__handle_potential_yoe_ignore(universal_config.bot_behavior.years_of_experience)
-
-  def __handle_potential_title_ignore(self, ignore_titles: List | None) -> None:
-    assert self.__job_listing
-    if not ignore_titles:
-      return
-    title = self.__job_listing.get_title().lower().strip()
-    for title_to_ignore in ignore_titles:
-      if self.__phrase_is_in_phrase(title_to_ignore, title):
-        logging.info("Ignoring because title includes: %s", title_to_ignore)
-        if isinstance(title_to_ignore, str):
-          self.__ignore_type = IgnoreType.IS_IN_IGNORE
-          self.__ignore_category = IgnoreCategory.TITLE
-          self.__ignore_term = title_to_ignore
-          return
-    return
-
-  def __handle_potential_company_ignore(self, ignore_companies: List | None) -> None:
-    assert self.__job_listing
-    if not ignore_companies:
-      return
-    company = self.__job_listing.get_company().lower().strip()
-    for company_to_ignore in ignore_companies:
-      if self.__phrase_is_in_phrase(company_to_ignore, company):
-        logging.info("Ignoring because company includes: %s", company_to_ignore)
-        if isinstance(company_to_ignore, str):
-          self.__ignore_type = IgnoreType.IS_IN_IGNORE
-          self.__ignore_category = IgnoreCategory.COMPANY
-          self.__ignore_term = company_to_ignore
-          return
-
-  def __handle_potential_location_ignore(self, ignore_locations: List | None) -> None:
-    assert self.__job_listing
-    if not ignore_locations:
-      return
-    location = self.__job_listing.get_location().lower().strip()
-    for location_to_ignore in ignore_locations:
-      if self.__phrase_is_in_phrase(location_to_ignore, location):
-        logging.info("Ignoring because location includes: %s", location_to_ignore)
-        if isinstance(location_to_ignore, str):
-          self.__ignore_type = IgnoreType.IS_IN_IGNORE
-          self.__ignore_category = IgnoreCategory.LOCATION
-          self.__ignore_term = location_to_ignore
-          return
-
-  def __handle_potential_description_ignore(self, ignore_descriptions: List | None) -> None:
-    assert self.__job_listing
-    if not ignore_descriptions:
-      return
-    description = self.__job_listing.get_description()
-    if description:
-      description = description.lower().strip()
-      for description_to_ignore in ignore_descriptions:
-        if self.__phrase_is_in_phrase(description_to_ignore, description):
-          logging.info("Ignoring because description includes: %s", description_to_ignore)
-          if isinstance(description_to_ignore, str):
-            self.__ignore_type = IgnoreType.IS_IN_IGNORE
-            self.__ignore_category = IgnoreCategory.DESCRIPTION
-            self.__ignore_term = description_to_ignore
-            return
-
-  def __handle_potential_pay_ignore(self, expected_salary: SearchSalary) -> None:
-    assert self.__job_listing
-    min_pay = self.__job_listing.get_min_pay()
-    max_pay = self.__job_listing.get_max_pay()
-    if expected_salary.min and max_pay and expected_salary.min > max_pay:
-      logging.info(
-        "Job pays: %s   less than our minimum: %s",
-        expected_salary.min - max_pay,
-        expected_salary.min
-      )
-      self.__ignore_type = IgnoreType.IS_IN_IGNORE
-      self.__ignore_category = IgnoreCategory.LOW_PAY
-      self.__ignore_term = str(max_pay)
-      return
-    elif expected_salary.max and min_pay and expected_salary.max < min_pay:
-      logging.info(
-        "Job pays: %s   more than our maximum: %s",
-        expected_salary.max - min_pay,
-        expected_salary.max
+  __criteria_engine: CriteriaEngine
+  __verdict: CriteriaVerdict
+  __verdict_cache: OrderedDict[Tuple[bytes, bytes], CriteriaVerdict]
+  __verdict_cache_size: int
+  __verdict_cache_hits: int
+  __filter_pipeline: FilterPipeline | None
+
+  def __init__(self, verdict_cache_size: int = 4096):
+    self.__criteria_engine = CriteriaEngine()
+    self.__verdict = PASSING_VERDICT
+    self.__verdict_cache = OrderedDict()
+    self.__verdict_cache_size = verdict_cache_size
+    self.__verdict_cache_hits = 0
+    self.__filter_pipeline = None
+
+  def passes(self, quick_settings: QuickSettings, universal_config: UniversalConfig, job_listing: JobListing) -> bool:
+    return self.evaluate(quick_settings, universal_config, job_listing).passes()
+
+  def evaluate(
+    self,
+    quick_settings: QuickSettings,
+    universal_config: UniversalConfig,
+    job_listing: JobListing
+  ) -> CriteriaVerdict:
+    compiled_criteria = self.__criteria_engine.compile(quick_settings, universal_config)
+    cache_key = (self.__get_job_listing_key(job_listing), compiled_criteria.get_key())
+    cached_verdict = self.__verdict_cache.get(cache_key)
+    if cached_verdict is not None:
+      self.__verdict_cache.move_to_end(cache_key)
+      self.__verdict_cache_hits += 1
+      if not cached_verdict.passes():
+        logging.info("Ignoring because of a previous verdict for this listing: %s", cached_verdict.get_ignore_term())
+      self.__verdict = cached_verdict
+      return cached_verdict
+    if self.__filter_pipeline is None:
+      self.__filter_pipeline = FilterPipeline(
+        self.__build_filter_stages(compiled_criteria),
+        quick_settings.bot_behavior.filter_pipeline
       )
-      self.__ignore_type = IgnoreType.IS_IN_IGNORE
-      self.__ignore_category = IgnoreCategory.HIGH_PAY
-      self.__ignore_term = str(min_pay)
-      return
-
-  def __handle_potential_yoe_ignore(self, years_of_experience: YearsOfExperience) -> None:
-    assert self.__job_listing
-    min_yoe = self.__job_listing.get_min_yoe()
-    max_yoe = self.__job_listing.get_max_yoe()
-    min_yoe_desired = years_of_experience.minimum
-    max_yoe_desired = years_of_experience.maximum
-    if min_yoe and max_yoe_desired and max_yoe_desired < min_yoe:
-      logging.info("Job requires too many Years of Experience: %s", min_yoe)
-      self.__ignore_type = IgnoreType.IS_IN_IGNORE
-      self.__ignore_category = IgnoreCategory.HIGH_YOE
-      self.__ignore_term = str(min_yoe)
-      return
-    if max_yoe and min_yoe_desired and min_yoe_desired < max_yoe:
-      logging.info("Job asks for too few Years of Experience: %s", max_yoe)
-      self.__ignore_type = IgnoreType.IS_IN_IGNORE
-      self.__ignore_category = IgnoreCategory.LOW_YOE
-      self.__ignore_term = str(max_yoe)
-      return
-
-  def __phrase_is_in_phrase(self, phrase_one: str | List, phrase_two: str) -> bool:
-    if isinstance(phrase_one, str):
-      phrase_one = phrase_one.lower().strip()
-      phrase_two = phrase_two.lower().strip()
-      return self.__matches_pattern(phrase_one, phrase_two)
-    elif isinstance(phrase_one, List):
-      for item in phrase_one:
-        if not self.__phrase_is_in_phrase(item, phrase_two):
-          return False
-      return True
-
-  def __matches_pattern(self, phrase_to_ignore: str, phrase: str) -> bool:
-    pattern = rf"(?<!\w)\(?{re.escape(phrase_to_ignore)}\)?(?!\w)"
-    return (
-      re.search(pattern, phrase) is not None
-      or phrase_to_ignore == phrase
-    )
+    rejections: List[CriteriaVerdict] = []
+    rejected_by = self.__filter_pipeline.run(compiled_criteria, job_listing, rejections)
+    if rejected_by is None:
+      self.__verdict = PASSING_VERDICT
+    else:
+      self.__verdict = self.__get_recorded_verdict(compiled_criteria, job_listing, rejected_by, rejections[0])
+    self.__verdict_cache[cache_key] = self.__verdict
+    if len(self.__verdict_cache) > self.__verdict_cache_size:
+      self.__verdict_cache.popitem(last=False)
+    return self.__verdict
+
+  def get_verdict(self) -> CriteriaVerdict:
+    return self.__verdict
+
+  def get_ignore_type(self) -> IgnoreType | None:
+    return self.__verdict.get_ignore_type()
+
+  def get_ignore_category(self) -> IgnoreCategory | None:
+    return self.__verdict.get_ignore_category()
+
+  def get_ignore_term(self) -> str | None:
+    return self.__verdict.get_ignore_term()
+
+  def get_verdict_cache_hits(self) -> int:
+    return self.__verdict_cache_hits
+
+  def clear_verdict_cache(self) -> None:
+    self.__verdict_cache.clear()
+
+  def get_filter_pipeline(self) -> FilterPipeline | None:
+    return self.__filter_pipeline
+
+  def __build_filter_stages(
+    self,
+    compiled_criteria: CompiledCriteria
+  ) -> Dict[FilterStage, Callable[[CompiledCriteria, JobListing, List[CriteriaVerdict]], bool]]:
+    return {stage: self.__build_stage_check(stage) for stage in compiled_criteria.get_stages()}
+
+  # The rejecting verdict goes into a list owned by the caller, so nothing about a listing is kept here
+  def __build_stage_check(
+    self,
+    stage: FilterStage
+  ) -> Callable[[CompiledCriteria, JobListing, List[CriteriaVerdict]], bool]:
+    def check(compiled_criteria: CompiledCriteria, job_listing: JobListing, rejections: List[CriteriaVerdict]) -> bool:
+      verdict = compiled_criteria.check(stage, job_listing)
+      if verdict is None:
+        return True
+      rejections.append(verdict)
+      return False
+    return check
+
+  # The pipeline's order adapts to runtime stats, so it only decides whether a listing is rejected. The verdict that
+  # gets recorded is always the first failing stage in the fixed order, so it doesn't depend on the run
+  def __get_recorded_verdict(
+    self,
+    compiled_criteria: CompiledCriteria,
+    job_listing: JobListing,
+    rejected_by: FilterStage,
+    rejection: CriteriaVerdict
+  ) -> CriteriaVerdict:
+    for stage in compiled_criteria.get_stages():
+      if stage == rejected_by:
+        break
+      verdict = compiled_criteria.check(stage, job_listing)
+      if verdict:
+        return verdict
+    return rejection
+
+  # Only the fields the rules actually read -- url and post time differ between duplicate cards
+  def __get_job_listing_key(self, job_listing: JobListing) -> bytes:
+    evaluated_fields = "\x1f".join(str(field) for field in (
+      job_listing.get_title(),
+      job_listing.get_company(),
+      job_listing.get_location(),
+      job_listing.get_language().value,
+      job_listing.get_min_pay(),
+      job_listing.get_max_pay(),
+      job_listing.get_min_yoe(),
+      job_listing.get_max_yoe(),
+      job_listing.get_description()
+    ))
+    return hashlib.blake2b(evaluated_fields.encode(), digest_size=16).digest()
@@ -0,0 +1,100 @@
+from array import array
+from hashlib import blake2b
+from typing import Tuple
+from entities.job_listing import JobListing
+from models.enums.platform import Platform
+
+
+class JobFingerprintSet:
+  # Open addressing over a flat array of 64-bit fingerprints, 0 marks an empty slot
+  __EMPTY_SLOT = 0
+  __MIN_CAPACITY = 1024
+  __max_size: int | None
+  __current_slots: array
+  __current_count: int
+  __previous_slots: array | None
+
+  def __init__(self, max_size: int | None = None):
+    assert max_size is None or max_size > 1
+    self.__max_size = max_size
+    self.__current_slots = self.__build_slots(self.__get_generation_size() or self.__MIN_CAPACITY // 2)
+    self.__current_count = 0
+    self.__previous_slots = None
+
+  def __len__(self) -> int:
+    return self.__current_count + (self.__count_slots(self.__previous_slots) if self.__previous_slots else 0)
+
+  def contains(self, job_listing: JobListing, platform: Platform) -> bool:
+    fingerprint = self.__get_fingerprint(job_listing, platform)
+    if self.__find_slot(self.__current_slots, fingerprint)[1]:
+      return True
+    return bool(self.__previous_slots) and self.__find_slot(self.__previous_slots, fingerprint)[1]
+
+  def add(self, job_listing: JobListing, platform: Platform) -> bool:
+    fingerprint = self.__get_fingerprint(job_listing, platform)
+    slot_index, is_present = self.__find_slot(self.__current_slots, fingerprint)
+    if is_present:
+      return False
+    if self.__previous_slots and self.__find_slot(self.__previous_slots, fingerprint)[1]:
+      return False
+    self.__current_slots[slot_index] = fingerprint
+    self.__current_count += 1
+    self.__handle_potential_growth()
+    return True
+
+  def clear(self) -> None:
+    self.__current_slots = self.__build_slots(self.__get_generation_size() or self.__MIN_CAPACITY // 2)
+    self.__current_count = 0
+    self.__previous_slots = None
+
+  def __handle_potential_growth(self) -> None:
+    generation_size = self.__get_generation_size()
+    if generation_size:
+      # Capped sets keep two generations and drop the oldest one wholesale, so memory stays fixed
+      if self.__current_count >= generation_size:
+        self.__previous_slots = self.__current_slots
+        self.__current_slots = self.__build_slots(generation_size)
+        self.__current_count = 0
+    elif self.__current_count * 2 > len(self.__current_slots):
+      old_slots = self.__current_slots
+      self.__current_slots = self.__build_slots(len(old_slots))
+      for fingerprint in old_slots:
+        if fingerprint != self.__EMPTY_SLOT:
+          slot_index, _ = self.__find_slot(self.__current_slots, fingerprint)
+          self.__current_slots[slot_index] = fingerprint
+
+  def __get_generation_size(self) -> int | None:
+    if self.__max_size is None:
+      return None
+    return self.__max_size // 2
+
+  def __find_slot(self, slots: array, fingerprint: int) -> Tuple[int, bool]:
+    mask = len(slots) - 1
+    slot_index = fingerprint & mask
+    while True:
+      slot = slots[slot_index]
+      if slot == fingerprint:
+        return (slot_index, True)
+      if slot == self.__EMPTY_SLOT:
+        return (slot_index, False)
+      slot_index = (slot_index + 1) & mask
+
+  def __build_slots(self, entry_count: int) -> array:
+    # Power of two capacity at or under half load
+    capacity = self.__MIN_CAPACITY
+    while capacity < entry_count * 2:
+      capacity *= 2
+    return array("Q", bytes(capacity * 8))
+
+  def __count_slots(self, slots: array) -> int:
+    return len(slots) - slots.count(self.__EMPTY_SLOT)
+
+  def __get_fingerprint(self, job_listing: JobListing, platform: Platform) -> int:
+    key = "\x1f".join((
+      platform.value,
+      job_listing.get_title() or "",
+      job_listing.get_company() or "",
+      job_listing.get_location() or ""
+    ))
+    fingerprint = int.from_bytes(blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+    return fingerprint or 1
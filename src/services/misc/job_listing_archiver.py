@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta, timezone
+import gzip
+import json
+import logging
+import os
+from typing import Any, Dict, List
+from services.misc.database_manager import DatabaseManager
+
+
+class JobListingArchiver:
+  __database_manager: DatabaseManager
+
+  def __init__(self, database_manager: DatabaseManager):
+    self.__database_manager = database_manager
+
+  # Files are written before rows are deleted, so an interrupted run can only ever archive a listing twice
+  def run(self, retention_days: int, archive_directory: str, chunk_size: int = 2000) -> int:
+    if retention_days <= 0:
+      return 0
+    cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+    os.makedirs(archive_directory, exist_ok=True)
+    archived_count = 0
+    while True:
+      job_listings = self.__database_manager.get_job_listings_before(cutoff, chunk_size)
+      if not job_listings:
+        break
+      for month, monthly_job_listings in self.__group_by_month(job_listings).items():
+        self.__append_to_archive(os.path.join(archive_directory, f"job_listings_{month}.jsonl.gz"), monthly_job_listings)
+      archived_count += self.__database_manager.delete_job_listings([job_listing["id"] for job_listing in job_listings])
+      logging.info("Archived %s job listings older than %s days...", f"{archived_count:,}", retention_days)
+    if archived_count:
+      logging.info("Finished archiving %s job listings to: %s", f"{archived_count:,}", archive_directory)
+    return archived_count
+
+  def __group_by_month(self, job_listings: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    monthly_job_listings: Dict[str, List[Dict[str, Any]]] = {}
+    for job_listing in job_listings:
+      month = job_listing["timestamp"].strftime("%Y_%m")
+      monthly_job_listings.setdefault(month, []).append(job_listing)
+    return monthly_job_listings
+
+  # Appending adds another gzip member, which gzip readers treat as one continuous file
+  def __append_to_archive(self, archive_path: str, job_listings: List[Dict[str, Any]]) -> None:
+    with gzip.open(archive_path, "at", encoding="utf-8") as archive_file:
+      for job_listing in job_listings:
+        archive_file.write(json.dumps(job_listing, default=self.__to_json) + "\n")
+
+  def __to_json(self, value: Any) -> str:
+    if isinstance(value, datetime):
+      return value.isoformat()
+    raise TypeError(f"Can't archive value of type: {type(value).__name__}")
@@ -0,0 +1,103 @@
+from datetime import datetime, timezone
+import json
+import logging
+import time
+from typing import Any, Dict, List, TextIO, Tuple
+from sqlalchemy import DateTime, Float, Integer
+from models.db.job_listing_orm import JobListingORM
+from models.enums.export_format import ExportFormat
+from services.misc.database_manager import DatabaseManager
+try:
+  import pyarrow
+  import pyarrow.parquet
+  PYARROW_IS_INSTALLED = True
+except ImportError:
+  PYARROW_IS_INSTALLED = False
+
+
+class JobListingExporter:
+  __database_manager: DatabaseManager
+
+  def __init__(self, database_manager: DatabaseManager):
+    self.__database_manager = database_manager
+
+  # Only one chunk is ever held at a time. Returns the newest timestamp written, to pass as since next time
+  def run(
+    self,
+    output_path: str,
+    export_format: ExportFormat,
+    chunk_size: int,
+    since: datetime | None = None
+  ) -> datetime | None:
+    if export_format == ExportFormat.PARQUET and not PYARROW_IS_INSTALLED:
+      logging.error("pyarrow isn't installed. Install it (pip install pyarrow) or export to %s instead.", ExportFormat.JSONL.value)
+      return None
+    exported_count = 0
+    watermark = since
+    start_time = time.perf_counter()
+    chunks = self.__database_manager.iterate_job_listing_chunks(chunk_size, since)
+    if export_format == ExportFormat.PARQUET:
+      parquet_writer = pyarrow.parquet.ParquetWriter(output_path, self.__build_parquet_schema(), compression="zstd")
+      try:
+        for chunk in chunks:
+          # One row group per chunk
+          parquet_writer.write_table(pyarrow.Table.from_pylist(chunk, schema=parquet_writer.schema))
+          exported_count, watermark = self.__log_progress(chunk, exported_count, watermark, start_time)
+      finally:
+        parquet_writer.close()
+    else:
+      with open(output_path, "w", encoding="utf-8") as output_file:
+        for chunk in chunks:
+          self.__write_jsonl(output_file, chunk)
+          exported_count, watermark = self.__log_progress(chunk, exported_count, watermark, start_time)
+    logging.info("Finished exporting %s job listings to: %s", f"{exported_count:,}", output_path)
+    if watermark:
+      logging.info("Export only newer listings next time with: --since %s", watermark.isoformat())
+    return watermark
+
+  def __log_progress(
+    self,
+    chunk: List[Dict[str, Any]],
+    exported_count: int,
+    watermark: datetime | None,
+    start_time: float
+  ) -> Tuple[int, datetime | None]:
+    exported_count += len(chunk)
+    for row in chunk:
+      timestamp = row["timestamp"]
+      if timestamp is None:
+        continue
+      # Timestamps are stored in UTC, but some drivers hand them back without a timezone
+      if not timestamp.tzinfo:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+      if watermark is None or timestamp > watermark:
+        watermark = timestamp
+    logging.info(
+      "Exported %s job listings -- %.0f listings/s",
+      f"{exported_count:,}",
+      exported_count / (time.perf_counter() - start_time)
+    )
+    return (exported_count, watermark)
+
+  def __write_jsonl(self, output_file: TextIO, chunk: List[Dict[str, Any]]) -> None:
+    output_file.write("".join(json.dumps(row, default=self.__to_json) + "\n" for row in chunk))
+
+  def __to_json(self, value: Any) -> str:
+    if isinstance(value, datetime):
+      return value.isoformat()
+    raise TypeError(f"Can't export value of type: {type(value).__name__}")
+
+  # Built from the table rather than inferred, so a chunk that happens to be all NULL in a column still matches
+  def __build_parquet_schema(self) -> "pyarrow.Schema":
+    fields = []
+    for column in JobListingORM.__table__.columns:
+      if isinstance(column.type, Integer):
+        field_type = pyarrow.int64()
+      elif isinstance(column.type, Float):
+        field_type = pyarrow.float64()
+      elif isinstance(column.type, DateTime):
+        field_type = pyarrow.timestamp("us", tz="UTC")
+      else:
+        field_type = pyarrow.string()
+      fields.append(pyarrow.field(column.name, field_type))
+    return pyarrow.schema(fields)
@@ -0,0 +1,74 @@
+import logging
+import time
+from typing import Any, Dict, List, Tuple
+from entities.criteria_verdict import CriteriaVerdict
+from entities.job_listing import JobListing
+from models.configs.profile_config import CriteriaProfile
+from models.configs.quick_settings import QuickSettings
+from models.configs.universal_config import UniversalConfig
+from services.misc.database_manager import DatabaseManager
+from services.misc.language_parser import LanguageParser
+from services.misc.profile_criteria_checker import ProfileCriteriaChecker
+
+
+class JobListingReevaluator:
+  __database_manager: DatabaseManager
+  __language_parser: LanguageParser
+  __criteria_checker: ProfileCriteriaChecker
+
+  def __init__(self, database_manager: DatabaseManager, language_parser: LanguageParser):
+    self.__database_manager = database_manager
+    self.__language_parser = language_parser
+    self.__criteria_checker = ProfileCriteriaChecker()
+
+  def run(
+    self,
+    quick_settings: QuickSettings,
+    universal_config: UniversalConfig,
+    criteria_profiles: List[CriteriaProfile],
+    chunk_size: int
+  ) -> None:
+    evaluated_count = 0
+    changed_count = 0
+    start_time = time.perf_counter()
+    for chunk in self.__database_manager.iterate_job_listing_chunks(chunk_size):
+      verdicts: Dict[Tuple[int, str], CriteriaVerdict] = {}
+      for row in chunk:
+        job_listing = self.__build_job_listing(row)
+        profile_verdicts = self.__criteria_checker.evaluate(
+          quick_settings,
+          universal_config,
+          criteria_profiles,
+          job_listing
+        )
+        for profile_name, criteria_verdict in profile_verdicts.items():
+          verdicts[(row["id"], profile_name)] = criteria_verdict
+      changed_count += self.__database_manager.write_job_application_verdicts(verdicts)
+      evaluated_count += len(chunk)
+      logging.info(
+        "Re-evaluated %s job listings (%s verdicts changed) -- %.0f listings/s",
+        f"{evaluated_count:,}",
+        f"{changed_count:,}",
+        evaluated_count / (time.perf_counter() - start_time)
+      )
+    logging.info("Finished re-evaluating %s job listings. %s verdicts changed.", f"{evaluated_count:,}", f"{changed_count:,}")
+    for profile_name, filter_pipeline in self.__criteria_checker.get_filter_pipelines().items():
+      filter_pipeline.log_stats(f"Re-evaluation criteria ({profile_name})")
+
+  def __build_job_listing(self, row: Dict[str, Any]) -> JobListing:
+    title = row["job_title"] or ""
+    company = row["company"] or ""
+    location = row["location"] or ""
+    # The language isn't stored, so it's detected the same way the parsers do it
+    return JobListing(
+      title=title,
+      company=company,
+      location=location,
+      url=row["url"] or "",
+      language=self.__language_parser.get_language(f"{title} {company} {location}"),
+      min_yoe=row["min_yoe"],
+      max_yoe=row["max_yoe"],
+      min_pay=row["min_pay"],
+      max_pay=row["max_pay"],
+      description=row["description"]
+    )
@@ -0,0 +1,119 @@
+import re
+from typing import Dict, List, Tuple
+from models.enums.pay_period import PayPeriod
+
+
+class PayParser:
+  # One scan over the text picks up every dollar amount, range separator, pay period marker and "up to" qualifier
+  __PAY_TOKEN_REGEX = re.compile(
+    r"\$\s?(?P<amount>[0-9][0-9,]*(?:\.[0-9]+)?)\s?(?P<thousands>[kK])?"
+    r"|(?P<hourly>/\s?hr\b|\bhour(?:ly)?\b)"
+    r"|(?P<daily>/\s?day\b|\bdaily\b|\b(?:a|per) day\b)"
+    r"|(?P<weekly>/\s?wk\b|\bweek(?:ly)?\b)"
+    r"|(?P<monthly>/\s?mo\b|\bmonth(?:ly)?\b)"
+    r"|(?P<annual>/\s?yr\b|\byear(?:ly)?\b|\bannual(?:ly)?\b)"
+    r"|(?P<up_to>\bup to\b)"
+    r"|(?P<range>[-\u2013\u2014]|\bto\b)",
+    re.IGNORECASE
+  )
+  # What may sit between an amount and the period marker that belongs to it (ex: "$20 an hour", "$25 Per Hour")
+  __PERIOD_GAP_REGEX = re.compile(r"\s*(?:(?:a|an|per)\s+)?", re.IGNORECASE)
+  __PERIOD_GROUPS = {"hourly", "daily", "weekly", "monthly", "annual"}
+  __ANNUAL_MULTIPLIERS: Dict[PayPeriod, float] = {
+    PayPeriod.HOURLY: 2080,
+    PayPeriod.DAILY: 260,
+    PayPeriod.WEEKLY: 52,
+    PayPeriod.MONTHLY: 12,
+    PayPeriod.ANNUAL: 1
+  }
+  # Without an explicit period, anything under this is assumed to be hourly (ex: "$25 - $30")
+  __MIN_UNLABELED_ANNUAL_AMOUNT = 1000
+
+  def parse(
+    self,
+    raw_pay: str,
+    require_period: bool = False
+  ) -> Tuple[float | None, float | None, PayPeriod | None]:
+    tokens = [
+      (match.lastgroup if match.lastgroup != "thousands" else "amount", match)
+      for match in self.__PAY_TOKEN_REGEX.finditer(raw_pay)
+    ]
+    pay_candidates = self.__find_pay_candidates(raw_pay, tokens)
+    if not pay_candidates:
+      return (None, None, None)
+    # A stated period marks the actual pay, anything else (ex: "$10,000 bonus") only comes after it
+    min_amount, max_amount, pay_period, is_up_to = max(
+      pay_candidates,
+      key=lambda pay_candidate: (pay_candidate[2] is not None, pay_candidate[1] is not None)
+    )
+    if pay_period is None:
+      pay_period = next((PayPeriod(kind) for kind, _ in tokens if kind in self.__PERIOD_GROUPS), None)
+    if pay_period is None:
+      if require_period:
+        return (None, None, None)
+      if max(min_amount, max_amount or 0) >= self.__MIN_UNLABELED_ANNUAL_AMOUNT:
+        pay_period = PayPeriod.ANNUAL
+      else:
+        pay_period = PayPeriod.HOURLY
+    multiplier = self.__ANNUAL_MULTIPLIERS[pay_period]
+    if max_amount is not None:
+      low_amount, high_amount = sorted((min_amount, max_amount))
+      return (low_amount * multiplier, high_amount * multiplier, pay_period)
+    if is_up_to:
+      return (None, min_amount * multiplier, pay_period)
+    return (min_amount * multiplier, min_amount * multiplier, pay_period)
+
+  # Each candidate is a single amount or two amounts joined by a range separator, with the period written
+  # right after it (if any) and whether "up to" came right before it
+  def __find_pay_candidates(
+    self,
+    raw_pay: str,
+    tokens: List[Tuple[str, re.Match]]
+  ) -> List[Tuple[float, float | None, PayPeriod | None, bool]]:
+    pay_candidates = []
+    index = 0
+    while index < len(tokens):
+      kind, match = tokens[index]
+      if kind != "amount":
+        index += 1
+        continue
+      is_up_to = index > 0 and tokens[index - 1][0] == "up_to" and self.__is_adjacent(raw_pay, tokens[index - 1][1], match)
+      min_amount = self.__get_amount(match)
+      max_amount = None
+      pay_period, index = self.__take_period(raw_pay, tokens, index)
+      if (
+        index + 2 < len(tokens)
+        and tokens[index + 1][0] == "range"
+        and tokens[index + 2][0] == "amount"
+        and self.__is_adjacent(raw_pay, tokens[index][1], tokens[index + 1][1])
+        and self.__is_adjacent(raw_pay, tokens[index + 1][1], tokens[index + 2][1])
+      ):
+        index += 2
+        max_amount = self.__get_amount(tokens[index][1])
+        range_pay_period, index = self.__take_period(raw_pay, tokens, index)
+        pay_period = pay_period or range_pay_period
+      pay_candidates.append((min_amount, max_amount, pay_period, is_up_to))
+      index += 1
+    return pay_candidates
+
+  # Returns the period written right after tokens[index] and the index of the last token used
+  def __take_period(
+    self,
+    raw_pay: str,
+    tokens: List[Tuple[str, re.Match]],
+    index: int
+  ) -> Tuple[PayPeriod | None, int]:
+    if index + 1 < len(tokens) and tokens[index + 1][0] in self.__PERIOD_GROUPS:
+      gap = raw_pay[tokens[index][1].end():tokens[index + 1][1].start()]
+      if self.__PERIOD_GAP_REGEX.fullmatch(gap):
+        return (PayPeriod(tokens[index + 1][0]), index + 1)
+    return (None, index)
+
+  def __is_adjacent(self, raw_pay: str, first_match: re.Match, second_match: re.Match) -> bool:
+    return not raw_pay[first_match.end():second_match.start()].strip()
+
+  def __get_amount(self, match: re.Match) -> float:
+    amount = float(match.group("amount").replace(",", ""))
+    if match.group("thousands"):
+      amount *= 1000
+    return amount
@@ -0,0 +1,46 @@
+import logging
+import time
+from services.misc.database_manager import DatabaseManager
+from services.misc.pay_parser import PayParser
+
+
+class PayParserBenchmark:
+  __database_manager: DatabaseManager
+  __pay_parser: PayParser
+
+  def __init__(self, database_manager: DatabaseManager):
+    self.__database_manager = database_manager
+    self.__pay_parser = PayParser()
+
+  # Expected values live in tests/test_pay_parser.py -- real pay texts have no answer key, so this times them
+  # and flags anything that can't be right (no pay found, or a minimum above the maximum)
+  def run(self, limit: int, repeat: int) -> bool:
+    raw_pays = self.__database_manager.get_raw_pays(limit)
+    if not raw_pays:
+      logging.warning("No stored pay texts to benchmark against.")
+      return True
+    unparsed_count = 0
+    inverted_count = 0
+    for raw_pay in raw_pays:
+      min_pay, max_pay, _ = self.__pay_parser.parse(raw_pay)
+      if min_pay is None and max_pay is None:
+        unparsed_count += 1
+        logging.debug("No pay found in: %r", raw_pay)
+      elif min_pay is not None and max_pay is not None and min_pay > max_pay:
+        inverted_count += 1
+        logging.error("Minimum pay above maximum for %r: %s > %s", raw_pay, min_pay, max_pay)
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+      for raw_pay in raw_pays:
+        self.__pay_parser.parse(raw_pay)
+    seconds = time.perf_counter() - start_time
+    parse_count = repeat * len(raw_pays)
+    logging.info(
+      "Pay parser: %s stored pay texts, %s without a pay, %s inverted ranges, %.0f parses/s over %s parses",
+      len(raw_pays),
+      unparsed_count,
+      inverted_count,
+      parse_count / seconds if seconds else float("inf"),
+      parse_count
+    )
+    return inverted_count == 0
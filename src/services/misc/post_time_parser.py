@@ -0,0 +1,54 @@
+import re
+from datetime import datetime, timedelta
+from typing import Dict
+
+
+class PostTimeParser:
+  # Covers "3 minutes ago", "Reposted 2 weeks ago", "30+ days ago", "an hour ago", Glassdoor's "24h"/"30d+"
+  # and "Just posted". Spelled out amounts only pair with whole unit words, so stray letters can't match
+  __RELATIVE_TIME_REGEX = re.compile(
+    r"(?P<just_posted>\bjust (?:now|posted)\b|\btoday\b)"
+    r"|\b(?P<article>an?)\s+(?P<article_unit>minute|min|hour|hr|day|week|wk|month|mo|year|yr)\b"
+    r"|\b(?P<amount>[0-9]+)\+?\s?(?P<unit>minutes?|mins?|hours?|hrs?|days?|weeks?|wks?|months?|mos?|years?|yrs?|h|d|w|m|y)"
+    r"(?:\b|\+)",
+    re.IGNORECASE
+  )
+  __UNIT_DELTAS: Dict[str, timedelta] = {
+    "min": timedelta(minutes=1),
+    "h": timedelta(hours=1),
+    "d": timedelta(days=1),
+    "w": timedelta(weeks=1),
+    "mo": timedelta(weeks=4.345),
+    "m": timedelta(weeks=4.345),
+    "y": timedelta(weeks=52)
+  }
+  __missing_post_time_count: int
+
+  def __init__(self):
+    self.__missing_post_time_count = 0
+
+  def parse(self, relative_time_text: str | None, now: datetime) -> datetime | None:
+    if relative_time_text:
+      match = self.__RELATIVE_TIME_REGEX.search(relative_time_text)
+      if match:
+        if match.group("just_posted"):
+          return now
+        if match.group("article"):
+          return now - self.__get_unit_delta(match.group("article_unit"))
+        return now - int(match.group("amount")) * self.__get_unit_delta(match.group("unit"))
+    self.__missing_post_time_count += 1
+    return None
+
+  def get_missing_post_time_count(self) -> int:
+    return self.__missing_post_time_count
+
+  def reset_missing_post_time_count(self) -> None:
+    self.__missing_post_time_count = 0
+
+  def __get_unit_delta(self, unit: str) -> timedelta:
+    unit = unit.lower()
+    if unit.startswith("min"):
+      return self.__UNIT_DELTAS["min"]
+    if unit.startswith("mo"):
+      return self.__UNIT_DELTAS["mo"]
+    return self.__UNIT_DELTAS[unit[0]]
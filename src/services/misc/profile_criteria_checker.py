@@ -0,0 +1,80 @@
+from dataclasses import replace
+from typing import Dict, List
+from entities.criteria_verdict import CriteriaVerdict
+from entities.job_listing import JobListing
+from models.configs.profile_config import DEFAULT_PROFILE_NAME, CriteriaProfile
+from models.configs.quick_settings import QuickSettings
+from models.configs.universal_config import UniversalConfig
+from services.misc.filter_pipeline import FilterPipeline
+from services.misc.job_criteria_checker import JobCriteriaChecker
+
+
+class ProfileCriteriaChecker:
+  __criteria_checkers: Dict[str, JobCriteriaChecker]
+
+  def __init__(self):
+    self.__criteria_checkers = {}
+
+  def evaluate(
+    self,
+    quick_settings: QuickSettings,
+    universal_config: UniversalConfig,
+    criteria_profiles: List[CriteriaProfile],
+    job_listing: JobListing
+  ) -> Dict[str, CriteriaVerdict]:
+    verdicts = {
+      DEFAULT_PROFILE_NAME: self.__get_criteria_checker(DEFAULT_PROFILE_NAME).evaluate(
+        quick_settings,
+        universal_config,
+        job_listing
+      )
+    }
+    for criteria_profile in criteria_profiles:
+      verdicts[criteria_profile.name] = self.__get_criteria_checker(criteria_profile.name).evaluate(
+        quick_settings,
+        self.__build_profile_universal_config(universal_config, criteria_profile),
+        job_listing
+      )
+    return verdicts
+
+  def passes_any(
+    self,
+    quick_settings: QuickSettings,
+    universal_config: UniversalConfig,
+    criteria_profiles: List[CriteriaProfile],
+    job_listing: JobListing
+  ) -> bool:
+    verdicts = self.evaluate(quick_settings, universal_config, criteria_profiles, job_listing)
+    return any(verdict.passes() for verdict in verdicts.values())
+
+  def get_filter_pipelines(self) -> Dict[str, FilterPipeline]:
+    filter_pipelines = {}
+    for profile_name, criteria_checker in self.__criteria_checkers.items():
+      filter_pipeline = criteria_checker.get_filter_pipeline()
+      if filter_pipeline:
+        filter_pipelines[profile_name] = filter_pipeline
+    return filter_pipelines
+
+  def __get_criteria_checker(self, profile_name: str) -> JobCriteriaChecker:
+    criteria_checker = self.__criteria_checkers.get(profile_name)
+    if criteria_checker is None:
+      criteria_checker = JobCriteriaChecker()
+      self.__criteria_checkers[profile_name] = criteria_checker
+    return criteria_checker
+
+  # Everything a profile doesn't cover (search terms, location, etc.) is shared with the universal config
+  def __build_profile_universal_config(
+    self,
+    universal_config: UniversalConfig,
+    criteria_profile: CriteriaProfile
+  ) -> UniversalConfig:
+    return replace(
+      universal_config,
+      bot_behavior=replace(
+        universal_config.bot_behavior,
+        ideal=criteria_profile.ideal,
+        ignore=criteria_profile.ignore,
+        years_of_experience=criteria_profile.years_of_experience
+      ),
+      search=replace(universal_config.search, salary=criteria_profile.salary)
+    )
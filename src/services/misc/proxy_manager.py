@@ -1,34 +1,178 @@
-from typing import List
-from models.configs.system_config import ProxyConfig
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+import logging
+import threading
+import time
+from typing import Dict, List, Tuple
+from entities.proxy_health import ProxyHealth
+from models.configs.system_config import ProxyConfig, ProxyHealthConfig
 from models.enums.platform import Platform
 from services.misc.database_manager import DatabaseManager
+from services.misc.proxy_prober import ProxyProber
 
 
 class ProxyManager:
   __database_manager: DatabaseManager
-  __current_proxy: ProxyConfig
+  __proxy_health_config: ProxyHealthConfig
+  __proxy_prober: ProxyProber
+  __current_proxy: ProxyConfig | None
   __potential_proxies: List[ProxyConfig]
+  __last_rate_limit_times: Dict[str | None, Dict[str, datetime]]
+  __proxy_healths: Dict[Tuple[str, int], ProxyHealth]
+  __proxy_rankings: Dict[str | None, OrderedDict[Tuple[str, int], ProxyConfig]]
+  __rankings_expire_at: Dict[str | None, datetime | None]
+  __rankings_lock: threading.Lock
 
-  def __init__(self, proxies: List[ProxyConfig], database_manager: DatabaseManager):
+  def __init__(
+    self,
+    proxies: List[ProxyConfig],
+    database_manager: DatabaseManager,
+    proxy_health_config: ProxyHealthConfig
+  ):
     self.__database_manager = database_manager
+    self.__proxy_health_config = proxy_health_config
+    self.__proxy_prober = ProxyProber(proxy_health_config)
     self.__potential_proxies = proxies
+    self.__current_proxy = None
+    self.__proxy_healths = {}
+    self.__proxy_rankings = {}
+    self.__rankings_expire_at = {}
+    self.__rankings_lock = threading.Lock()
+    self.__load_last_rate_limit_times()
+    self.__rank_all_proxies()
+    if self.__potential_proxies and self.__proxy_health_config.enabled:
+      self.probe_proxies()
+      threading.Thread(target=self.__probe_proxies_periodically, daemon=True).start()
 
   def log_rate_limit_block(self, platform: Platform) -> None:
+    if self.__current_proxy is None:
+      return
     self.__database_manager.log_rate_limit_block(self.__current_proxy.host, platform)
+    now = datetime.now(timezone.utc)
+    with self.__rankings_lock:
+      for platform_key in (platform.value, None):
+        self.__last_rate_limit_times.setdefault(platform_key, {})[self.__current_proxy.host] = now
+        self.__rank_proxies(platform_key)
+
+  def probe_proxies(self) -> None:
+    logging.debug("Probing %s proxies...", len(self.__potential_proxies))
+    proxy_healths = self.__proxy_prober.probe_all(self.__potential_proxies)
+    unhealthy_count = len([proxy_health for proxy_health in proxy_healths.values() if not proxy_health.healthy])
+    if unhealthy_count:
+      logging.warning("%s of %s proxies failed their health probe.", unhealthy_count, len(proxy_healths))
+    with self.__rankings_lock:
+      self.__proxy_healths = proxy_healths
+      self.__rank_all_proxies()
+
+  def get_current_proxy(self) -> ProxyConfig | None:
+    return self.__current_proxy
+
+  def can_rotate(self) -> bool:
+    return len(self.__potential_proxies) > 1
+
+  def get_proxy_count(self) -> int:
+    return len(self.__potential_proxies)
+
+  # False once every proxy is either unhealthy or still inside its rate limit cooldown for this platform
+  def has_fresh_proxy(self, platform: Platform | None = None) -> bool:
+    return any(self.is_fresh_proxy(proxy, platform) for proxy in self.__potential_proxies)
+
+  def is_fresh_proxy(self, proxy: ProxyConfig, platform: Platform | None = None) -> bool:
+    platform_key = platform.value if platform else None
+    last_rate_limit_time = self.__last_rate_limit_times.get(platform_key, {}).get(proxy.host)
+    with self.__rankings_lock:
+      return self.__get_proxy_rank(proxy, last_rate_limit_time, datetime.now(timezone.utc))[0] == 0
+
+  def set_current_proxy(self, proxy: ProxyConfig | None) -> None:
+    self.__current_proxy = proxy
 
   def get_best_proxy(self, platform: Platform | None = None) -> ProxyConfig | None:
-    greatest_time_delta = {}
-    for i, proxy in enumerate(self.__potential_proxies):
-      if i == 0:
-        time_delta = self.__database_manager.get_rate_limit_time_delta(proxy.host, platform)
-        greatest_time_delta = {
-          "time_delta": time_delta,
-          "proxy_config": proxy
-        }
-        continue
-      time_delta = self.__database_manager.get_rate_limit_time_delta(proxy.host, platform)
-      if greatest_time_delta["time_delta"] < time_delta:
-        greatest_time_delta["time_delta"] = time_delta
-        greatest_time_delta["proxy_config"] = proxy
-    self.__current_proxy = greatest_time_delta["proxy_config"]
-    return greatest_time_delta["proxy_config"]
+    self.__current_proxy = self.__find_best_proxy(platform)
+    return self.__current_proxy
+
+  def get_standby_proxy(self, platform: Platform | None = None) -> ProxyConfig | None:
+    if self.can_rotate():
+      return self.__find_best_proxy(platform, self.__current_proxy)
+    return self.__find_best_proxy(platform)
+
+  def __find_best_proxy(
+    self,
+    platform: Platform | None = None,
+    excluded_proxy: ProxyConfig | None = None
+  ) -> ProxyConfig | None:
+    platform_key = platform.value if platform else None
+    with self.__rankings_lock:
+      expire_at = self.__rankings_expire_at.get(platform_key)
+      if platform_key not in self.__proxy_rankings or (expire_at and datetime.now(timezone.utc) >= expire_at):
+        self.__rank_proxies(platform_key)
+      # Rankings are rebuilt whenever health or rate limits change, or a cooldown runs out, so this only ever looks
+      # at the head
+      for proxy in self.__proxy_rankings[platform_key].values():
+        if excluded_proxy and proxy == excluded_proxy:
+          continue
+        return proxy
+    return None
+
+  def __probe_proxies_periodically(self) -> None:
+    while True:
+      time.sleep(self.__proxy_health_config.probe_interval_seconds)
+      try:
+        self.probe_proxies()
+      except Exception:
+        logging.warning("Failed to probe proxies. Keeping previous health data...")
+
+  def __load_last_rate_limit_times(self) -> None:
+    self.__last_rate_limit_times = {None: {}}
+    for ip_address, platform_value, timestamp in self.__database_manager.get_last_rate_limit_times():
+      if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+      self.__last_rate_limit_times.setdefault(platform_value, {})[ip_address] = timestamp
+      any_platform_times = self.__last_rate_limit_times[None]
+      if ip_address not in any_platform_times or any_platform_times[ip_address] < timestamp:
+        any_platform_times[ip_address] = timestamp
+
+  def __rank_all_proxies(self) -> None:
+    for platform_key in [None] + [platform.value for platform in Platform]:
+      self.__rank_proxies(platform_key)
+
+  def __rank_proxies(self, platform_key: str | None) -> None:
+    last_rate_limit_times = self.__last_rate_limit_times.get(platform_key, {})
+    now = datetime.now(timezone.utc)
+    ranked_proxies = sorted(
+      self.__potential_proxies,
+      key=lambda proxy: self.__get_proxy_rank(proxy, last_rate_limit_times.get(proxy.host), now)
+    )
+    self.__proxy_rankings[platform_key] = OrderedDict(((proxy.host, proxy.port), proxy) for proxy in ranked_proxies)
+    # A proxy leaving its cooldown moves up a tier, so the rankings are only good until the first one does
+    cooldown = timedelta(seconds=self.__proxy_health_config.rate_limit_cooldown_seconds)
+    cooldown_ends = [
+      last_rate_limit_times[proxy.host] + cooldown
+      for proxy in ranked_proxies
+      if proxy.host in last_rate_limit_times and last_rate_limit_times[proxy.host] + cooldown > now
+    ]
+    self.__rankings_expire_at[platform_key] = min(cooldown_ends, default=None)
+
+  def __get_proxy_rank(
+    self,
+    proxy: ProxyConfig,
+    last_rate_limit_time: datetime | None,
+    now: datetime
+  ) -> Tuple[int, float, float, float]:
+    # Healthy proxies outside the rate limit cooldown come first (fastest first), then recently rate
+    # limited ones (least recent first), then proxies that failed their last probe
+    proxy_health = self.__proxy_healths.get((proxy.host, proxy.port))
+    if last_rate_limit_time:
+      seconds_since_rate_limit = (now - last_rate_limit_time).total_seconds()
+    else:
+      seconds_since_rate_limit = float("inf")
+    if proxy_health and not proxy_health.healthy:
+      return (2, -seconds_since_rate_limit, 0.0, 0.0)
+    if seconds_since_rate_limit < self.__proxy_health_config.rate_limit_cooldown_seconds:
+      return (1, -seconds_since_rate_limit, 0.0, 0.0)
+    if proxy_health and proxy_health.connect_latency is not None:
+      connect_latency = proxy_health.connect_latency
+      throughput = proxy_health.throughput or 0.0
+    else:
+      connect_latency = float("inf")
+      throughput = 0.0
+    return (0, connect_latency, -seconds_since_rate_limit, -throughput)
@@ -0,0 +1,106 @@
+import asyncio
+from datetime import datetime, timezone
+import logging
+import time
+from typing import Dict, List, Tuple
+from entities.proxy_health import ProxyHealth
+from models.configs.system_config import ProxyConfig, ProxyHealthConfig
+
+
+class ProxyProber:
+  __proxy_health_config: ProxyHealthConfig
+  __max_response_bytes: int
+
+  def __init__(self, proxy_health_config: ProxyHealthConfig, max_response_bytes=262144):
+    self.__proxy_health_config = proxy_health_config
+    self.__max_response_bytes = max_response_bytes
+
+  def probe_all(self, proxies: List[ProxyConfig]) -> Dict[Tuple[str, int], ProxyHealth]:
+    return asyncio.run(self.probe_all_async(proxies))
+
+  async def probe_all_async(self, proxies: List[ProxyConfig]) -> Dict[Tuple[str, int], ProxyHealth]:
+    results = await asyncio.gather(*(self.probe(proxy) for proxy in proxies))
+    return {(proxy_health.host, proxy_health.port): proxy_health for proxy_health in results}
+
+  async def probe(self, proxy: ProxyConfig) -> ProxyHealth:
+    try:
+      connect_latency, throughput = await asyncio.wait_for(
+        self.__measure(proxy),
+        self.__proxy_health_config.timeout_seconds
+      )
+    except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError) as e:
+      logging.debug("Proxy %s:%s failed its health probe: %s", proxy.host, proxy.port, repr(e))
+      return ProxyHealth(proxy.host, proxy.port, False, datetime.now(timezone.utc))
+    logging.debug(
+      "Proxy %s:%s connected in %.3fs at %.0f B/s",
+      proxy.host,
+      proxy.port,
+      connect_latency,
+      throughput
+    )
+    return ProxyHealth(proxy.host, proxy.port, True, datetime.now(timezone.utc), connect_latency, throughput)
+
+  async def __measure(self, proxy: ProxyConfig) -> Tuple[float, float]:
+    start_time = time.perf_counter()
+    reader, writer = await asyncio.open_connection(proxy.host, proxy.port)
+    try:
+      await self.__socks5_connect(reader, writer)
+      connect_latency = time.perf_counter() - start_time
+      transfer_start_time = time.perf_counter()
+      received_bytes = await self.__fetch_target(reader, writer)
+      transfer_time = max(time.perf_counter() - transfer_start_time, 1e-6)
+      return connect_latency, received_bytes / transfer_time
+    finally:
+      writer.close()
+      try:
+        await writer.wait_closed()
+      except (OSError, ConnectionError):
+        pass
+
+  async def __socks5_connect(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    # No-auth greeting, then CONNECT by domain name (RFC 1928)
+    writer.write(b"\x05\x01\x00")
+    await writer.drain()
+    greeting_reply = await reader.readexactly(2)
+    if greeting_reply != b"\x05\x00":
+      raise ConnectionError(f"Unexpected SOCKS5 greeting reply: {greeting_reply!r}")
+    target_host = self.__proxy_health_config.target_host.encode("idna")
+    target_port = self.__proxy_health_config.target_port
+    writer.write(
+      b"\x05\x01\x00\x03"
+      + bytes([len(target_host)])
+      + target_host
+      + target_port.to_bytes(2, "big")
+    )
+    await writer.drain()
+    connect_reply = await reader.readexactly(4)
+    if connect_reply[1] != 0:
+      raise ConnectionError(f"SOCKS5 CONNECT failed with code: {connect_reply[1]}")
+    address_type = connect_reply[3]
+    if address_type == 1:
+      await reader.readexactly(4 + 2)
+    elif address_type == 3:
+      address_length = (await reader.readexactly(1))[0]
+      await reader.readexactly(address_length + 2)
+    elif address_type == 4:
+      await reader.readexactly(16 + 2)
+    else:
+      raise ConnectionError(f"Unknown SOCKS5 address type: {address_type}")
+
+  async def __fetch_target(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> int:
+    request = (
+      f"GET {self.__proxy_health_config.target_path} HTTP/1.1\r\n"
+      f"Host: {self.__proxy_health_config.target_host}\r\n"
+      "Connection: close\r\n\r\n"
+    )
+    writer.write(request.encode("ascii"))
+    await writer.drain()
+    received_bytes = 0
+    while received_bytes < self.__max_response_bytes:
+      chunk = await reader.read(65536)
+      if not chunk:
+        break
+      received_bytes += len(chunk)
+    if received_bytes == 0:
+      raise ConnectionError("Proxy returned an empty response.")
+    return received_bytes
@@ -0,0 +1,69 @@
+import re
+from typing import List, Tuple
+from exceptions.invalid_search_query_exception import InvalidSearchQueryException
+
+
+# (joined to the previous clause with OR, negated, words -- more than one word is a phrase)
+SearchClause = Tuple[bool, bool, List[str]]
+
+
+# Understands: plain terms (implicitly ANDed), "quoted phrases", AND, OR, NOT and -term
+class SearchQueryParser:
+  __TOKEN_REGEX = re.compile(r'(-?)"([^"]*)"|(\S+)')
+  __WORD_REGEX = re.compile(r"\w+")
+
+  def parse(self, query: str) -> List[SearchClause]:
+    clauses: List[SearchClause] = []
+    is_or = False
+    is_negated = False
+    for match in self.__TOKEN_REGEX.finditer(query):
+      minus, phrase, token = match.groups()
+      if token in ("AND", "OR", "NOT"):
+        if token == "OR":
+          is_or = True
+        elif token == "NOT":
+          is_negated = True
+        continue
+      if token is None:
+        words = self.__WORD_REGEX.findall(phrase.lower())
+      else:
+        if token.startswith("-"):
+          minus = "-"
+        words = self.__WORD_REGEX.findall(token.lower())
+      if not words:
+        continue
+      clauses.append((is_or and bool(clauses), is_negated or bool(minus), words))
+      is_or = False
+      is_negated = False
+    if not any(not is_negated for _, is_negated, _ in clauses):
+      raise InvalidSearchQueryException(f"Search query has nothing to look for: {query}")
+    return clauses
+
+  # Words are reduced to \w+ above, so they're safe to drop into to_tsquery() unescaped
+  def to_tsquery(self, clauses: List[SearchClause]) -> str:
+    tsquery = ""
+    for index, (is_or, is_negated, words) in enumerate(clauses):
+      clause = " <-> ".join(f"'{word}'" for word in words)
+      if len(words) > 1:
+        clause = f"({clause})"
+      if is_negated:
+        clause = f"!{clause}"
+      if index:
+        tsquery += " | " if is_or else " & "
+      tsquery += clause
+    return tsquery
+
+  # FTS5's NOT is binary (a NOT b), so negated clauses have to follow something to subtract from
+  def to_fts5(self, clauses: List[SearchClause]) -> str:
+    fts5_query = ""
+    for index, (is_or, is_negated, words) in enumerate(clauses):
+      clause = '"' + " ".join(words) + '"'
+      if is_negated:
+        if not index or is_or:
+          raise InvalidSearchQueryException("NOT can only follow another term on sqlite, ex: \"go NOT clearance\"")
+        fts5_query += f" NOT {clause}"
+      elif index:
+        fts5_query += f" {'OR' if is_or else 'AND'} {clause}"
+      else:
+        fts5_query = clause
+    return fts5_query
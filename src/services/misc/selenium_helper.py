@@ -1,12 +1,18 @@
 import logging
+import threading
+import time
+from typing import Callable, List, Tuple
+import psutil
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.common.exceptions import NoSuchElementException
 from selenium.common.exceptions import StaleElementReferenceException
-from models.configs.system_config import SystemConfig
+from selenium.common.exceptions import TimeoutException
+from models.configs.system_config import ProxyConfig, SystemConfig
 from models.enums.element_type import ElementType
+from models.enums.platform import Platform
 from services.misc.proxy_manager import ProxyManager
 
 
@@ -15,6 +21,12 @@ class SeleniumHelper:
   __system_config: SystemConfig
   __default_page_load_timeout: int
   __proxy_manager: ProxyManager
+  __standby_driver: uc.Chrome | None
+  __standby_proxy: ProxyConfig | None
+  __standby_thread: threading.Thread | None
+  __memory_baseline: int | None
+  __last_memory_check_time: float
+  __driver_listeners: List[Callable[[uc.Chrome], None]]
 
   def __init__(
     self,
@@ -25,28 +37,115 @@ class SeleniumHelper:
     self.__system_config = system_config
     self.__default_page_load_timeout = default_page_load_timeout
     self.__proxy_manager = proxy_manager
+    self.__standby_driver = None
+    self.__standby_proxy = None
+    self.__standby_thread = None
+    self.__memory_baseline = None
+    self.__last_memory_check_time = time.monotonic()
+    self.__driver_listeners = []
     self.__driver = self.get_new_driver()
     self.__driver.set_page_load_timeout(default_page_load_timeout)
+    self.__start_warming_standby_driver(None)
 
   def get_driver(self) -> uc.Chrome:
     return self.__driver
 
-  def get_new_driver(self) -> uc.Chrome:
-    logging.debug("Getting a new driver...")
-    options = uc.ChromeOptions()
-    options.binary_location = self.__system_config.browser.path
-    options.add_argument("--no-first-run")
-    options.add_argument("--no-default-browser-check")
-    options.add_argument("--disable-extensions")
-    options.add_argument("--start-maximized")
-    options.add_argument("--disable-popup-blocking")
-    options.add_argument("--force-dark-mode")
-    self.__handle_proxy_configuration(options)
-    driver = uc.Chrome(options=options)
-    driver.delete_all_cookies()
-    driver.execute_script("window.localStorage.clear();")
-    driver.execute_script("window.sessionStorage.clear();")
-    return driver
+  # Every engine and page shares one browser, so all of them have to hear about a replacement -- not just the caller
+  def add_driver_listener(self, driver_listener: Callable[[uc.Chrome], None]) -> None:
+    self.__driver_listeners.append(driver_listener)
+
+  def get_new_driver(self, platform: Platform | None = None) -> uc.Chrome:
+    proxy_config = self.__proxy_manager.get_best_proxy(platform)
+    return self.__build_driver(proxy_config)
+
+  # Restarts that aren't rotations (rotate_proxy=False) keep the current proxy, and only take the standby if it
+  # happens to be on that same proxy
+  def replace_driver(self, platform: Platform | None = None, rotate_proxy: bool = True) -> uc.Chrome:
+    logging.info("Replacing driver...")
+    if rotate_proxy:
+      proxy_config = self.__proxy_manager.get_standby_proxy(platform)
+    else:
+      proxy_config = self.__get_kept_proxy(platform)
+    standby = None
+    if rotate_proxy or proxy_config == self.__standby_proxy:
+      standby = self.__take_standby_driver(proxy_config, platform)
+    if standby:
+      new_driver, proxy_config = standby
+    else:
+      new_driver = self.__build_driver(proxy_config)
+    self.__proxy_manager.set_current_proxy(proxy_config)
+    new_driver.set_page_load_timeout(self.__default_page_load_timeout)
+    old_driver = self.__driver
+    self.__driver = new_driver
+    self.__memory_baseline = None
+    try:
+      old_driver.quit()
+    except Exception:
+      logging.warning("Failed to cleanly quit old driver. Continuing...")
+    for driver_listener in self.__driver_listeners:
+      driver_listener(new_driver)
+    if self.__standby_thread is None:
+      self.__start_warming_standby_driver(platform)
+    return new_driver
+
+  def shutdown(self) -> None:
+    if self.__standby_thread is not None:
+      self.__standby_thread.join()
+      self.__standby_thread = None
+    if self.__standby_driver is not None:
+      try:
+        self.__standby_driver.quit()
+      except Exception:
+        logging.warning("Failed to cleanly quit standby driver. Continuing...")
+      self.__standby_driver = None
+
+  def memory_check_is_due(self) -> bool:
+    now = time.monotonic()
+    if now - self.__last_memory_check_time < self.__system_config.browser.memory_check_interval_seconds:
+      return False
+    self.__last_memory_check_time = now
+    return True
+
+  def get_driver_memory_usage(self) -> int:
+    try:
+      browser_process = psutil.Process(self.__driver.browser_pid)
+      browser_processes = [browser_process] + browser_process.children(recursive=True)
+    except (AttributeError, psutil.Error):
+      return 0
+    memory_usage = 0
+    for process in browser_processes:
+      try:
+        memory_usage += process.memory_info().rss
+      except psutil.Error:
+        continue
+    return memory_usage
+
+  def driver_needs_restart(self, memory_usage: int) -> bool:
+    memory_usage_mb = memory_usage / 1048576
+    logging.debug("Current browser memory usage: %.0fMB", memory_usage_mb)
+    return memory_usage_mb > self.__system_config.browser.restart_memory_mb
+
+  def tab_needs_recycle(self, memory_usage: int) -> bool:
+    if self.__memory_baseline is None:
+      self.__memory_baseline = memory_usage
+      return False
+    memory_growth_mb = (memory_usage - self.__memory_baseline) / 1048576
+    return memory_growth_mb > self.__system_config.browser.tab_recycle_growth_mb
+
+  def recycle_tab(self) -> None:
+    logging.info("Recycling browser tab to release memory...")
+    current_url = self.__driver.current_url
+    old_window_handle = self.__driver.current_window_handle
+    self.open_new_tab()
+    new_window_handle = self.__driver.current_window_handle
+    self.__driver.switch_to.window(old_window_handle)
+    self.__driver.close()
+    self.__driver.switch_to.window(new_window_handle)
+    try:
+      self.__driver.get(current_url)
+    except TimeoutException:
+      pass
+    self.__memory_baseline = None
 
   def set_driver_timeout_to_default(self) -> None:
     self.__driver.set_page_load_timeout(self.__default_page_load_timeout)
@@ -211,8 +310,86 @@ class SeleniumHelper:
     self.__driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
     self.scroll_down(element)
 
-  def __handle_proxy_configuration(self, options: uc.ChromeOptions) -> uc.ChromeOptions:
-    proxy_config = self.__proxy_manager.get_best_proxy()
+  def __build_driver(self, proxy_config: ProxyConfig | None) -> uc.Chrome:
+    logging.debug("Getting a new driver...")
+    options = uc.ChromeOptions()
+    options.binary_location = self.__system_config.browser.path
+    options.add_argument("--no-first-run")
+    options.add_argument("--no-default-browser-check")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--start-maximized")
+    options.add_argument("--disable-popup-blocking")
+    options.add_argument("--force-dark-mode")
+    self.__handle_proxy_configuration(options, proxy_config)
+    driver = uc.Chrome(options=options)
+    driver.delete_all_cookies()
+    driver.execute_script("window.localStorage.clear();")
+    driver.execute_script("window.sessionStorage.clear();")
+    return driver
+
+  # Only swapped out if this platform has rate limited it or it failed its last probe since it was picked
+  def __get_kept_proxy(self, platform: Platform | None) -> ProxyConfig | None:
+    current_proxy = self.__proxy_manager.get_current_proxy()
+    if current_proxy is None or self.__proxy_manager.is_fresh_proxy(current_proxy, platform):
+      return current_proxy
+    return self.__proxy_manager.get_best_proxy(platform)
+
+  # Warmed for the platform being scraped, since that's the platform the next rate limit will rotate for
+  def __start_warming_standby_driver(self, platform: Platform | None) -> None:
+    if not self.__system_config.browser.keep_standby_driver:
+      return
+    self.__standby_driver = None
+    self.__standby_proxy = self.__proxy_manager.get_standby_proxy(platform)
+    self.__standby_thread = threading.Thread(
+      target=self.__warm_standby_driver,
+      args=(self.__standby_proxy,),
+      daemon=True
+    )
+    self.__standby_thread.start()
+
+  def __warm_standby_driver(self, proxy_config: ProxyConfig | None) -> None:
+    try:
+      standby_driver = self.__build_driver(proxy_config)
+      standby_driver.minimize_window()
+      self.__standby_driver = standby_driver
+      logging.debug("Standby driver is ready.")
+    except Exception:
+      logging.warning("Failed to warm standby driver. Falling back to on-demand drivers...")
+
+  # A standby warmed with another proxy is still used as long as that proxy is fresh and isn't the one being replaced
+  def __take_standby_driver(
+    self,
+    proxy_config: ProxyConfig | None,
+    platform: Platform | None
+  ) -> Tuple[uc.Chrome, ProxyConfig | None] | None:
+    if self.__standby_thread is None:
+      return None
+    self.__standby_thread.join()
+    self.__standby_thread = None
+    standby_driver = self.__standby_driver
+    self.__standby_driver = None
+    if standby_driver is None:
+      return None
+    standby_proxy = self.__standby_proxy
+    if standby_proxy != proxy_config and (
+      standby_proxy is None
+      or standby_proxy == self.__proxy_manager.get_current_proxy()
+      or not self.__proxy_manager.is_fresh_proxy(standby_proxy, platform)
+    ):
+      logging.debug("Standby driver was warmed with a proxy that can't be used now. Discarding it...")
+      try:
+        standby_driver.quit()
+      except Exception:
+        logging.warning("Failed to cleanly quit standby driver. Continuing...")
+      return None
+    standby_driver.maximize_window()
+    return (standby_driver, standby_proxy)
+
+  def __handle_proxy_configuration(
+    self,
+    options: uc.ChromeOptions,
+    proxy_config: ProxyConfig | None
+  ) -> uc.ChromeOptions:
     if proxy_config:
       logging.info("Using proxy: %s", proxy_config.host)
       options.add_argument(f"--proxy-server=socks5://{proxy_config.host}:{proxy_config.port}")
@@ -3,10 +3,13 @@ import logging
 import time
 import undetected_chromedriver as uc
 from selenium.common.exceptions import JavascriptException, TimeoutException
+from exceptions.memory_overload_exception import MemoryOverloadException
 from exceptions.not_logged_in_exception import NotLoggedInException
+from exceptions.rate_limited_exception import RateLimitedException
 from exceptions.service_is_down_exception import ServiceIsDownException
 from models.configs.quick_settings import QuickSettings
 from models.configs.universal_config import UniversalConfig
+from services.misc.proxy_manager import ProxyManager
 from services.misc.selenium_helper import SeleniumHelper
 from services.pages.job_listing_pages.abc_job_listings_page import JobListingsPage
 from services.query_url_builders.abc_query_url_builder import QueryUrlBuilder
@@ -15,6 +18,7 @@ from services.query_url_builders.abc_query_url_builder import QueryUrlBuilder
 class OrchestrationEngine(ABC):
   _driver: uc.Chrome
   _selenium_helper: SeleniumHelper
+  _proxy_manager: ProxyManager
   _universal_config: UniversalConfig
   _quick_settings: QuickSettings
   _query_url_builder: QueryUrlBuilder
@@ -24,13 +28,16 @@ class OrchestrationEngine(ABC):
     self,
     driver: uc.Chrome,
     selenium_helper: SeleniumHelper,
+    proxy_manager: ProxyManager,
     universal_config: UniversalConfig,
     quick_settings: QuickSettings
   ):
     self._driver = driver
     self._selenium_helper = selenium_helper
+    self._proxy_manager = proxy_manager
     self._universal_config = universal_config
     self._quick_settings = quick_settings
+    self._selenium_helper.add_driver_listener(self.set_driver)
     # self._query_url_builder = SomeQueryUrlBuilder(...)
     # self._job_listings_page = SomeJobListingsPage(...)
 
@@ -39,6 +46,7 @@ class OrchestrationEngine(ABC):
     for search_term in search_terms:
       timeout = 60.0
       start_time = time.time()
+      rotation_count = 0
       while True:
         try:
           while time.time() - start_time < timeout:
@@ -50,12 +58,20 @@ class OrchestrationEngine(ABC):
                 logging.info("Waiting for user to solve security checkpoint...")
               self._wait_for_query_url_resolution(query_url)
               self._job_listings_page.scrape_current_query()
+              self._job_listings_page.flush_description_pipeline()
               break
             except TimeoutException:
               logging.warning("Timed out waiting for query url. Trying again...")
               time.sleep(0.1)
             except NotLoggedInException:
               self.login()
+            except RateLimitedException as e:
+              self._rotate_proxy(e, rotation_count)
+              rotation_count += 1
+              start_time = time.time()
+            except MemoryOverloadException as e:
+              self._restart_driver(e)
+              start_time = time.time()
             except ServiceIsDownException:
               logging.error("Glassdoor service appears to be down. Skipping all Glassdoor queries...")
               return
@@ -63,6 +79,34 @@ class OrchestrationEngine(ABC):
         except JavascriptException:
           logging.error("Glassdoor \"Show More Jobs\" button isn't functioning. Trying again...")
           continue
+    self._job_listings_page.log_filter_stats()
+    missing_post_time_count = self._job_listings_page.get_missing_post_time_count()
+    if missing_post_time_count:
+      logging.warning("%s job listings so far had no readable post time.", f"{missing_post_time_count:,}")
+
+  def set_driver(self, driver: uc.Chrome) -> None:
+    self._driver = driver
+    self._job_listings_page.set_driver(driver)
+
+  # Gives up on the query once every proxy has had a turn or none of them are outside their cooldown
+  def _rotate_proxy(self, rate_limited_exception: RateLimitedException, rotation_count: int) -> None:
+    platform = rate_limited_exception.get_platform()
+    self._proxy_manager.log_rate_limit_block(platform)
+    if not self._proxy_manager.can_rotate():
+      raise rate_limited_exception
+    if rotation_count >= self._proxy_manager.get_proxy_count() - 1:
+      logging.error("Rate limited by %s on every proxy for this query.", platform.value)
+      raise rate_limited_exception
+    if not self._proxy_manager.has_fresh_proxy(platform):
+      logging.error("Every proxy was recently rate limited by %s.", platform.value)
+      raise rate_limited_exception
+    logging.warning("Rate limited by %s. Rotating proxy and retrying current query...", platform.value)
+    self._selenium_helper.replace_driver(platform)
+
+  # SeleniumHelper hands the new driver to every engine (see set_driver), not only this one
+  def _restart_driver(self, memory_overload_exception: MemoryOverloadException) -> None:
+    logging.warning("Browser memory usage is too high. Restarting driver and retrying current query...")
+    self._selenium_helper.replace_driver(memory_overload_exception.get_platform(), rotate_proxy=False)
 
   def _go_to_query_url(self, url: str) -> None:
     logging.info("Going to query url: %s...", url)
@@ -1,12 +1,16 @@
 import logging
 import time
+from typing import List
 import undetected_chromedriver as uc
 from selenium.common.exceptions import TimeoutException
 from models.configs.glassdoor_config import GlassdoorConfig
+from models.configs.profile_config import CriteriaProfile
 from models.configs.quick_settings import QuickSettings
 from models.configs.universal_config import UniversalConfig
 from models.enums.element_type import ElementType
 from services.misc.database_manager import DatabaseManager
+from services.misc.description_pipeline import DescriptionPipeline
+from services.misc.job_fingerprint_set import JobFingerprintSet
 from services.misc.proxy_manager import ProxyManager
 from services.orchestration.abc_orchestration_engine import OrchestrationEngine
 from services.query_url_builders.glassdoor_query_url_builder import GlassdoorQueryUrlBuilder
@@ -28,9 +32,12 @@ class GlassdoorOrchestrationEngine(OrchestrationEngine):
     proxy_manager: ProxyManager,
     universal_config: UniversalConfig,
     quick_settings: QuickSettings,
-    glassdoor_config: GlassdoorConfig
+    glassdoor_config: GlassdoorConfig,
+    current_session_jobs: JobFingerprintSet,
+    description_pipeline: DescriptionPipeline,
+    criteria_profiles: List[CriteriaProfile]
   ):
-    super().__init__(driver, selenium_helper, universal_config, quick_settings)
+    super().__init__(driver, selenium_helper, proxy_manager, universal_config, quick_settings)
     self.__glassdoor_login_page = GlassdoorLoginPage(driver, selenium_helper, glassdoor_config)
     self._job_listings_page = GlassdoorJobListingsPage(
       driver,
@@ -39,7 +46,10 @@ class GlassdoorOrchestrationEngine(OrchestrationEngine):
       language_parser,
       proxy_manager,
       quick_settings,
-      universal_config
+      universal_config,
+      current_session_jobs,
+      description_pipeline,
+      criteria_profiles
     )
     self._query_url_builder = GlassdoorQueryUrlBuilder(self._universal_config, self._quick_settings)
 
@@ -56,6 +66,10 @@ class GlassdoorOrchestrationEngine(OrchestrationEngine):
         time.sleep(0.5)
     self.__glassdoor_login_page.login()
 
+  def set_driver(self, driver: uc.Chrome) -> None:
+    super().set_driver(driver)
+    self.__glassdoor_login_page.set_driver(driver)
+
   def get_jobs_parsed_count(self) -> int:
     return self._job_listings_page.get_jobs_parsed_count()
 
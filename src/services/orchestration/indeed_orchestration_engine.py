@@ -1,12 +1,16 @@
 import logging
 import time
+from typing import List
 import undetected_chromedriver as uc
 from exceptions.not_logged_in_exception import NotLoggedInException
 from models.configs.indeed_config import IndeedConfig
+from models.configs.profile_config import CriteriaProfile
 from models.configs.quick_settings import QuickSettings
 from models.configs.universal_config import UniversalConfig
 from models.enums.element_type import ElementType
 from services.misc.database_manager import DatabaseManager
+from services.misc.description_pipeline import DescriptionPipeline
+from services.misc.job_fingerprint_set import JobFingerprintSet
 from services.misc.language_parser import LanguageParser
 from services.misc.proxy_manager import ProxyManager
 from services.misc.selenium_helper import SeleniumHelper
@@ -32,9 +36,12 @@ class IndeedOrchestrationEngine(OrchestrationEngine):
     indeed_config: IndeedConfig,
     database_manager: DatabaseManager,
     language_parser: LanguageParser,
-    proxy_manager: ProxyManager
+    proxy_manager: ProxyManager,
+    current_session_jobs: JobFingerprintSet,
+    description_pipeline: DescriptionPipeline,
+    criteria_profiles: List[CriteriaProfile]
   ):
-    super().__init__(driver, selenium_helper, universal_config, quick_settings)
+    super().__init__(driver, selenium_helper, proxy_manager, universal_config, quick_settings)
     self.__indeed_home_page = IndeedHomePage(selenium_helper)
     self.__indeed_login_page = IndeedLoginPage(driver, selenium_helper, indeed_config)
     self.__indeed_one_time_code_page = IndeedOneTimeCodePage(driver, selenium_helper, indeed_config)
@@ -45,7 +52,10 @@ class IndeedOrchestrationEngine(OrchestrationEngine):
       language_parser,
       proxy_manager,
       quick_settings,
-      universal_config
+      universal_config,
+      current_session_jobs,
+      description_pipeline,
+      criteria_profiles
     )
     self._query_url_builder = IndeedQueryUrlBuilder(self._universal_config, self._quick_settings)
 
@@ -66,6 +76,11 @@ class IndeedOrchestrationEngine(OrchestrationEngine):
       self.__indeed_one_time_code_page.resolve_with_mail_dot_com()
     self.__indeed_one_time_code_page.wait_for_captcha_resolution()
 
+  def set_driver(self, driver: uc.Chrome) -> None:
+    super().set_driver(driver)
+    self.__indeed_login_page.set_driver(driver)
+    self.__indeed_one_time_code_page.set_driver(driver)
+
   def get_jobs_parsed_count(self) -> int:
     return self._job_listings_page.get_jobs_parsed_count()
 
@@ -1,10 +1,14 @@
 import logging
 import time
+from typing import List
 import undetected_chromedriver as uc
 from models.configs.linkedin_config import LinkedinConfig
+from models.configs.profile_config import CriteriaProfile
 from models.configs.quick_settings import QuickSettings
 from models.configs.universal_config import UniversalConfig
 from services.misc.database_manager import DatabaseManager
+from services.misc.description_pipeline import DescriptionPipeline
+from services.misc.job_fingerprint_set import JobFingerprintSet
 from services.misc.proxy_manager import ProxyManager
 from services.misc.selenium_helper import SeleniumHelper
 from services.orchestration.abc_orchestration_engine import OrchestrationEngine
@@ -26,9 +30,12 @@ class LinkedinOrchestrationEngine(OrchestrationEngine):
     universal_config: UniversalConfig,
     quick_settings: QuickSettings,
     linkedin_config: LinkedinConfig,
-    proxy_manager: ProxyManager
+    proxy_manager: ProxyManager,
+    current_session_jobs: JobFingerprintSet,
+    description_pipeline: DescriptionPipeline,
+    criteria_profiles: List[CriteriaProfile]
   ):
-    super().__init__(driver, selenium_helper, universal_config, quick_settings)
+    super().__init__(driver, selenium_helper, proxy_manager, universal_config, quick_settings)
     self.__linkedin_login_page = LinkedinLoginPage(
       driver,
       selenium_helper,
@@ -41,7 +48,10 @@ class LinkedinOrchestrationEngine(OrchestrationEngine):
       language_parser,
       proxy_manager,
       quick_settings,
-      universal_config
+      universal_config,
+      current_session_jobs,
+      description_pipeline,
+      criteria_profiles
     )
     self._query_url_builder = LinkedinQueryUrlBuilder(self._universal_config, self._quick_settings)
 
@@ -49,6 +59,10 @@ class LinkedinOrchestrationEngine(OrchestrationEngine):
     logging.debug("Logging into Linkedin...")
     self.__linkedin_login_page.login()
 
+  def set_driver(self, driver: uc.Chrome) -> None:
+    super().set_driver(driver)
+    self.__linkedin_login_page.set_driver(driver)
+
   def get_jobs_parsed_count(self) -> int:
     return self._job_listings_page.get_jobs_parsed_count()
 
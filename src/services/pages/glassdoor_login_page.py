@@ -24,6 +24,9 @@ class GlassdoorLoginPage:
     self.__selenium_helper = selenium_helper
     self.__glassdoor_config = glassdoor_config
 
+  def set_driver(self, driver: uc.Chrome) -> None:
+    self.__driver = driver
+
   def login(self) -> None:
     logging.debug("Logging in...")
     self.__wait_for_email_form()
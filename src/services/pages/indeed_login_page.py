@@ -15,6 +15,9 @@ class IndeedLoginPage:
     self.__selenium_helper = selenium_helper
     self.__indeed_config = indeed_config
 
+  def set_driver(self, driver: uc.Chrome) -> None:
+    self.__driver = driver
+
   def login(self) -> None:
     self.__write_email_to_vague_input()
     self.__click_continue_button()
@@ -26,6 +26,9 @@ class IndeedOneTimeCodePage:
     self.__indeed_config = indeed_config
     self.__email_handler = EmailHandler()
 
+  def set_driver(self, driver: uc.Chrome) -> None:
+    self.__driver = driver
+
   def is_present(self) -> bool:
     return self.__selenium_helper.exact_text_is_present(
       "Check your email for a code",
@@ -1,12 +1,13 @@
 from abc import ABC, abstractmethod
 import time
-from typing import Set, Tuple
+from typing import Dict, List, Tuple
 import logging
-import psutil
 import undetected_chromedriver as uc
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
-from entities.job_listings.abc_job_listing import JobListing
+from entities.criteria_verdict import CriteriaVerdict
+from entities.job_listing import JobListing
+from exceptions.browser_memory_growth_exception import BrowserMemoryGrowthException
 from exceptions.glassdoor_zero_jobs_bug_exception import GlassdoorZeroJobsBugException
 from exceptions.job_details_didnt_load_exception import JobDetailsDidntLoadException
 from exceptions.job_listing_is_advertisement_exception import JobListingIsAdvertisementException
@@ -17,11 +18,17 @@ from exceptions.no_more_job_listings_exception import NoMoreJobListingsException
 from exceptions.no_results_found_page_exception import NoResultsFoundPageException
 from exceptions.page_froze_exception import PageFrozeException
 from exceptions.something_went_wrong_page_exception import SomethingWentWrongPageException
+from models.configs.profile_config import CriteriaProfile
 from models.configs.quick_settings import QuickSettings
 from models.configs.universal_config import UniversalConfig
+from models.enums.filter_stage import FilterStage
 from models.enums.platform import Platform
+from services.job_listing_parsers.abc_job_listing_parser import JobListingParser
 from services.misc.database_manager import DatabaseManager
-from services.misc.job_criteria_checker import JobCriteriaChecker
+from services.misc.description_pipeline import DescriptionPipeline
+from services.misc.filter_pipeline import FilterPipeline
+from services.misc.job_fingerprint_set import JobFingerprintSet
+from services.misc.profile_criteria_checker import ProfileCriteriaChecker
 from services.misc.proxy_manager import ProxyManager
 from services.misc.selenium_helper import SeleniumHelper
 from services.misc.language_parser import LanguageParser
@@ -30,13 +37,17 @@ from services.misc.language_parser import LanguageParser
 class JobListingsPage(ABC):
   _driver: uc.Chrome
   _selenium_helper: SeleniumHelper
-  _criteria_checker: JobCriteriaChecker
+  _criteria_checker: ProfileCriteriaChecker
   _database_manager: DatabaseManager
   _language_parser: LanguageParser
+  _job_listing_parser: JobListingParser
   _proxy_manager: ProxyManager
   _quick_settings: QuickSettings
   _universal_config: UniversalConfig
-  _current_session_jobs: Set[str]
+  _current_session_jobs: JobFingerprintSet
+  _description_pipeline: DescriptionPipeline
+  _criteria_profiles: List[CriteriaProfile]
+  _brief_filter_pipeline: FilterPipeline
   _jobs_parsed_count: int
 
   def __init__(
@@ -47,25 +58,52 @@ class JobListingsPage(ABC):
     language_parser: LanguageParser,
     proxy_manager: ProxyManager,
     quick_settings: QuickSettings,
-    universal_config: UniversalConfig
+    universal_config: UniversalConfig,
+    current_session_jobs: JobFingerprintSet,
+    description_pipeline: DescriptionPipeline,
+    criteria_profiles: List[CriteriaProfile]
   ):
     self._driver = driver
     self._selenium_helper = selenium_helper
-    self._criteria_checker = JobCriteriaChecker()
+    self._criteria_checker = ProfileCriteriaChecker()
     self._database_manager = database_manager
     self._language_parser = language_parser
     self._proxy_manager = proxy_manager
     self._quick_settings = quick_settings
     self._universal_config = universal_config
-    self._current_session_jobs = set()
+    self._current_session_jobs = current_session_jobs
+    self._description_pipeline = description_pipeline
+    self._criteria_profiles = criteria_profiles
+    self._job_listing_parser = self._build_job_listing_parser()
+    self._brief_filter_pipeline = FilterPipeline(
+      {
+        FilterStage.DATABASE: self.__is_new_to_database,
+        FilterStage.CRITERIA: self.__meets_criteria
+      },
+      quick_settings.bot_behavior.filter_pipeline
+    )
     self._jobs_parsed_count = 0
 
+  def set_driver(self, driver: uc.Chrome) -> None:
+    self._driver = driver
+
   def get_jobs_parsed_count(self) -> int:
     return self._jobs_parsed_count
 
   def reset_jobs_parsed_count(self) -> None:
     self._jobs_parsed_count = 0
 
+  def get_missing_post_time_count(self) -> int:
+    return self._job_listing_parser.get_missing_post_time_count()
+
+  def log_filter_stats(self) -> None:
+    self._brief_filter_pipeline.log_stats("Brief job listing")
+    for profile_name, criteria_filter_pipeline in self._criteria_checker.get_filter_pipelines().items():
+      criteria_filter_pipeline.log_stats(f"Brief job listing criteria ({profile_name})")
+
+  def flush_description_pipeline(self) -> None:
+    self._add_processed_job_listings_to_db(True)
+
   def scrape_current_query(self) -> None:
     zero_results_count = 0
     while self._is_zero_results():
@@ -78,16 +116,19 @@ class JobListingsPage(ABC):
           self._driver.refresh()
         except TimeoutException:
           pass
+    self._job_listing_parser.refresh_now()
     total_jobs_tried = 0
     job_listing_li_index = 0
     while True:
       try:
+        self._handle_potential_overload()
         total_jobs_tried, job_listing_li_index = self._handle_incrementors(total_jobs_tried, job_listing_li_index)
         if not total_jobs_tried == 1:
           if self._need_next_page(job_listing_li_index):
             if self._is_next_page():
               logging.info("Going to next page...")
               self._go_to_next_page()
+              self._job_listing_parser.refresh_now()
             else:
               raise NoMoreJobListingsException()
         logging.info("Attempting Job Listing: %s...", f"{total_jobs_tried:,}")
@@ -109,18 +150,18 @@ class JobListingsPage(ABC):
           except StaleElementReferenceException:
             job_listing_li = self._get_job_listing_li(job_listing_li_index)
         brief_job_listing.print_most()
-        if brief_job_listing.to_minimal_str() in self._current_session_jobs:
-          logging.info("Ignoring Brief Job Listing because we've already applied this session. Skipping...")
-          input(f"DEBUG: {self._current_session_jobs}")
-          continue
+        # Adding to the session set is a side effect, so it stays out of the reorderable pipeline
         logging.info("Adding Brief Job Listing to Current Session Jobs...")
-        self._current_session_jobs.add(brief_job_listing.to_minimal_str())
-        if self._database_manager.job_listing_is_in_db(brief_job_listing, self._get_platform()):
-          logging.info("Ignoring Brief Job Listing because its already in the database. Skipping...")
+        if not self._current_session_jobs.add(brief_job_listing, self._get_platform()):
+          logging.info("Ignoring Brief Job Listing because we've already seen it this session. Skipping...")
           continue
         self._jobs_parsed_count += 1
-        if not self._criteria_checker.passes(self._quick_settings, self._universal_config, brief_job_listing):
-          logging.info("Ignoring Brief Job Listing because it does not meet ignore/ideal criteria.")
+        rejected_by = self._brief_filter_pipeline.run(brief_job_listing)
+        if rejected_by == FilterStage.DATABASE:
+          logging.info("Ignoring Brief Job Listing because its already in the database. Skipping...")
+          continue
+        if rejected_by == FilterStage.CRITERIA:
+          logging.info("Ignoring Brief Job Listing because it does not meet ignore/ideal criteria for any profile.")
           continue
         if not self._quick_settings.bot_behavior.full_scrape:
           logging.info("Adding Brief Job Listing to database...")
@@ -139,7 +180,7 @@ class JobListingsPage(ABC):
             job_details_div = self._get_job_details_div()
             logging.info("Building Job Listing...")
             job_listing_url = self._build_job_listing_url(job_listing_li)
-            job_listing = self._build_job_listing(job_listing_url, job_listing_li, job_details_div)
+            job_listing, raw_description = self._build_job_listing(job_listing_url, job_listing_li, job_details_div)
             break
           except JobDetailsDidntLoadException as e:
             if self._quick_settings.bot_behavior.fallback_to_brief_on_load_issues:
@@ -149,13 +190,9 @@ class JobListingsPage(ABC):
           except StaleElementReferenceException:
             logging.warning("Stale element while trying to create job listing. Trying again...")
             time.sleep(0.1)
-        job_listing.print_most()
-        if not self._criteria_checker.passes(self._quick_settings, self._universal_config, job_listing):
-          logging.info("Ignoring Job Listing because it does not meet ignore/ideal criteria.")
-          continue
-        logging.info("Adding Job Listing to Database...")
-        self._add_job_listing_to_db(job_listing)
-        self._handle_potential_overload()
+        logging.info("Handing Job Listing description off for post-processing...")
+        self._description_pipeline.submit(self._get_platform(), job_listing, raw_description)
+        self._add_processed_job_listings_to_db()
         self._anti_rate_limit_wait()
       except GlassdoorZeroJobsBugException:
         logging.info("Show more jobs button spawned zero jobs. Refreshing and trying again...")
@@ -187,11 +224,12 @@ class JobListingsPage(ABC):
           self._driver.refresh()
         self.scrape_current_query()
         return
-      except MemoryOverloadException:
-        print(psutil.virtual_memory().percent)
-        self._current_session_jobs = set()
-        print(psutil.virtual_memory().percent)
-        input("How much memory did we save???")
+      # The tab reloads the same results page (Glassdoor's "show more" is clicked again by the next page check),
+      # so the loop carries on from the card after the last one handled
+      except BrowserMemoryGrowthException:
+        logging.info("Browser memory has grown too much. Recycling tab and resuming query...")
+        self._selenium_helper.recycle_tab()
+        continue
       except NoMoreJobListingsException:
         logging.info("No Job Listings left -- Finished with query.")
         return
@@ -211,21 +249,62 @@ class JobListingsPage(ABC):
         self.scrape_current_query()
         return
 
-  def _add_job_listing_to_db(self, job_listing: JobListing) -> None:
+  def _add_job_listing_to_db(
+    self,
+    job_listing: JobListing,
+    criteria_verdicts: Dict[str, CriteriaVerdict] | None = None
+  ) -> None:
     if self._get_base_url() in job_listing.get_url():
       platform = self._get_platform()
     else:
       platform = Platform.COMPANY_WEBSITE
-    self._database_manager.create_new_job_listing(
+    job_listing_id = self._database_manager.create_new_job_listing(
       job_listing,
       platform
     )
+    if job_listing_id is None:
+      return
+    if criteria_verdicts is None:
+      # Already judged on the way in, so this comes straight out of the verdict caches
+      criteria_verdicts = self._criteria_checker.evaluate(
+        self._quick_settings,
+        self._universal_config,
+        self._criteria_profiles,
+        job_listing
+      )
+    self._database_manager.write_job_application_verdicts({
+      (job_listing_id, profile_name): criteria_verdict
+      for profile_name, criteria_verdict in criteria_verdicts.items()
+    })
+
+  def _add_processed_job_listings_to_db(self, block: bool = False) -> None:
+    for job_listing, criteria_verdicts in self._description_pipeline.get_completed(self._get_platform(), block):
+      job_listing.print_most()
+      if not any(criteria_verdict.passes() for criteria_verdict in criteria_verdicts.values()):
+        logging.info("Ignoring Job Listing because it does not meet ignore/ideal criteria for any profile.")
+        continue
+      logging.info("Adding Job Listing to Database...")
+      self._add_job_listing_to_db(job_listing, criteria_verdicts)
+
+  def __is_new_to_database(self, job_listing: JobListing) -> bool:
+    return not self._database_manager.job_listing_is_in_db(job_listing, self._get_platform())
+
+  def __meets_criteria(self, job_listing: JobListing) -> bool:
+    return self._criteria_checker.passes_any(
+      self._quick_settings,
+      self._universal_config,
+      self._criteria_profiles,
+      job_listing
+    )
 
   def _handle_potential_overload(self) -> None:
-    current_memory_usage = psutil.virtual_memory().percent
-    logging.debug("Current memory usage: %s%s", current_memory_usage, "%")
-    if current_memory_usage > 90:
-      raise MemoryOverloadException()
+    if not self._selenium_helper.memory_check_is_due():
+      return
+    memory_usage = self._selenium_helper.get_driver_memory_usage()
+    if self._selenium_helper.driver_needs_restart(memory_usage):
+      raise MemoryOverloadException(self._get_platform())
+    if self._selenium_helper.tab_needs_recycle(memory_usage):
+      raise BrowserMemoryGrowthException()
 
   @abstractmethod
   def is_present(self) -> bool:
@@ -239,6 +318,10 @@ class JobListingsPage(ABC):
   def _get_platform(self) -> Platform:
     pass
 
+  @abstractmethod
+  def _build_job_listing_parser(self) -> JobListingParser:
+    pass
+
   @abstractmethod
   def _is_zero_results(self, timeout=10.0) -> bool:
     pass
@@ -285,7 +368,7 @@ class JobListingsPage(ABC):
     job_listing_li: WebElement,
     job_details_div: WebElement,
     timeout=10.0
-  ) -> JobListing:
+  ) -> Tuple[JobListing, str | None]:
     pass
 
   @abstractmethod
@@ -1,7 +1,8 @@
 import logging
 import re
 import time
-from typing import Tuple
+from typing import List, Tuple
+import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.common.exceptions import (
@@ -12,7 +13,7 @@ from selenium.common.exceptions import (
   StaleElementReferenceException,
   TimeoutException
 )
-from entities.job_listings.glassdoor_job_listing import GlassdoorJobListing
+from entities.job_listing import JobListing
 from exceptions.glassdoor_zero_jobs_bug_exception import GlassdoorZeroJobsBugException
 from exceptions.job_details_didnt_load_exception import JobDetailsDidntLoadException
 from exceptions.job_listing_is_advertisement_exception import JobListingIsAdvertisementException
@@ -25,12 +26,53 @@ from exceptions.page_didnt_load_exception import PageDidntLoadException
 from exceptions.page_froze_exception import PageFrozeException
 from exceptions.unable_to_determine_job_count_exception import UnableToDetermineJobCountException
 from exceptions.unknown_apply_button_exception import UnknownApplyButtonException
+from models.configs.profile_config import CriteriaProfile
+from models.configs.quick_settings import QuickSettings
+from models.configs.universal_config import UniversalConfig
 from models.enums.element_type import ElementType
 from models.enums.platform import Platform
+from services.misc.database_manager import DatabaseManager
+from services.misc.description_pipeline import DescriptionPipeline
+from services.misc.job_fingerprint_set import JobFingerprintSet
+from services.misc.language_parser import LanguageParser
+from services.misc.proxy_manager import ProxyManager
+from services.misc.selenium_helper import SeleniumHelper
+from services.job_listing_parsers.glassdoor_job_listing_parser import GlassdoorJobListingParser
 from services.pages.job_listing_pages.abc_job_listings_page import JobListingsPage
 
 
 class GlassdoorJobListingsPage(JobListingsPage):
+  __cursor_li: WebElement | None
+  __cursor_index: int
+
+  def __init__(
+    self,
+    driver: uc.Chrome,
+    selenium_helper: SeleniumHelper,
+    database_manager: DatabaseManager,
+    language_parser: LanguageParser,
+    proxy_manager: ProxyManager,
+    quick_settings: QuickSettings,
+    universal_config: UniversalConfig,
+    current_session_jobs: JobFingerprintSet,
+    description_pipeline: DescriptionPipeline,
+    criteria_profiles: List[CriteriaProfile]
+  ):
+    super().__init__(
+      driver,
+      selenium_helper,
+      database_manager,
+      language_parser,
+      proxy_manager,
+      quick_settings,
+      universal_config,
+      current_session_jobs,
+      description_pipeline,
+      criteria_profiles
+    )
+    self.__cursor_li = None
+    self.__cursor_index = 0
+
   def is_present(self) -> bool:
     input("Implement me 7274")
     return True
@@ -41,6 +83,12 @@ class GlassdoorJobListingsPage(JobListingsPage):
   def _get_platform(self) -> Platform:
     return Platform.GLASSDOOR
 
+  def _build_job_listing_parser(self) -> GlassdoorJobListingParser:
+    return GlassdoorJobListingParser(
+      self._language_parser,
+      self._description_pipeline.get_html_text_extractor()
+    )
+
   def _is_zero_results(self, timeout=10.0) -> bool:
     search_results_class = "SearchResultsHeader_jobCount__eHngv"
     start_time = time.time()
@@ -70,14 +118,16 @@ class GlassdoorJobListingsPage(JobListingsPage):
     return (total_jobs_tried, job_listing_li_index)
 
   def _get_job_listing_li(self, job_listing_li_index: int, timeout=10.0) -> WebElement:
+    if self._quick_settings.bot_behavior.prune_processed_listings:
+      job_listing_li = self.__get_job_listing_li_from_cursor(job_listing_li_index)
+      if job_listing_li:
+        return self.__handle_potential_advertisement(job_listing_li, job_listing_li_index)
     job_listings_ul = self._get_job_listings_ul()
     start_time = time.time()
     while time.time() - start_time < timeout:
       try:
         job_listing_li = job_listings_ul.find_element(By.XPATH, f"./li[{job_listing_li_index}]")
-        if self.__is_advertisement(job_listing_li):
-          raise JobListingIsAdvertisementException()
-        return job_listing_li
+        return self.__handle_potential_advertisement(job_listing_li, job_listing_li_index)
       except ElementClickInterceptedException:
         logging.debug("ElementClickInterceptedException. Attempting to remove popups and trying again...")
         if self.__is_create_job_dialog():
@@ -98,14 +148,13 @@ class GlassdoorJobListingsPage(JobListingsPage):
     assert job_url
     return job_url
 
-  def _build_brief_job_listing(self, job_listing_li: WebElement, url: str, timeout=10.0) -> GlassdoorJobListing:
+  def _build_brief_job_listing(self, job_listing_li: WebElement, url: str, timeout=10.0) -> JobListing:
     last_error = None
     start_time = time.time()
     while time.time() - start_time < timeout:
       try:
         self._selenium_helper.scroll_into_view(job_listing_li)
-        brief_job_listing = GlassdoorJobListing(
-          self._language_parser,
+        brief_job_listing = self._job_listing_parser.parse(
           url,
           job_listing_li
         )
@@ -142,19 +191,18 @@ class GlassdoorJobListingsPage(JobListingsPage):
     job_listing_li: WebElement,
     job_details_div: WebElement,
     timeout=10.0
-  ) -> GlassdoorJobListing:
+  ) -> Tuple[JobListing, str | None]:
     start_time = time.time()
     while time.time() - start_time < timeout:
       try:
         self._get_job_details_div()
         self._selenium_helper.scroll_into_view(job_listing_li)
-        job_listing = GlassdoorJobListing(
-          self._language_parser,
+        job_listing, raw_description = self._job_listing_parser.parse_without_description(
           url,
           job_listing_li,
           job_details_div
         )
-        return job_listing
+        return (job_listing, raw_description)
       except StaleElementReferenceException as e:
         if not self.__job_details_div_is_present():
           if self.__page_didnt_load_is_present():
@@ -209,7 +257,7 @@ class GlassdoorJobListingsPage(JobListingsPage):
       try:
         no_jobs_regex = r"^0 .+ Jobs in .+"
         assert not re.search(no_jobs_regex, self._driver.title)
-        starting_li_count = len(self._get_job_listings_ul().find_elements(By.TAG_NAME, "li"))
+        starting_li_count = self.__get_job_listing_li_count()
         show_more_jobs_button = self.__get_show_more_jobs_button()
         show_more_jobs_button.click()
         self.__wait_for_more_job_listings(starting_li_count)
@@ -258,6 +306,37 @@ class GlassdoorJobListingsPage(JobListingsPage):
       job_listings_ul = self._selenium_helper.get_element_by_aria_label("Jobs List")
     return job_listings_ul
 
+  def __get_job_listing_li_from_cursor(self, job_listing_li_index: int) -> WebElement | None:
+    # Processed cards are blanked rather than removed, so ./li[index] lookups stay valid as a fallback
+    if self.__cursor_li is None or job_listing_li_index != self.__cursor_index + 1:
+      return None
+    try:
+      next_job_listing_li = self._driver.execute_script("""
+        const processed_li = arguments[0];
+        const next_li = processed_li.nextElementSibling;
+        processed_li.replaceChildren();
+        processed_li.setAttribute("data-scraper-processed", "true");
+        return next_li;
+      """, self.__cursor_li)
+    except StaleElementReferenceException:
+      logging.debug("Job Listing li cursor went stale. Falling back to index lookup...")
+      next_job_listing_li = None
+    self.__cursor_li = None
+    if isinstance(next_job_listing_li, WebElement):
+      return next_job_listing_li
+    return None
+
+  def __handle_potential_advertisement(self, job_listing_li: WebElement, job_listing_li_index: int) -> WebElement:
+    self.__cursor_li = job_listing_li
+    self.__cursor_index = job_listing_li_index
+    if self.__is_advertisement(job_listing_li):
+      raise JobListingIsAdvertisementException()
+    return job_listing_li
+
+  def __get_job_listing_li_count(self) -> int:
+    job_listings_ul = self._get_job_listings_ul()
+    return int(self._driver.execute_script("return arguments[0].childElementCount;", job_listings_ul))
+
   def __is_advertisement(self, job_listing_li: WebElement) -> bool:
     job_listing_li_class = job_listing_li.get_attribute("class")
     if job_listing_li_class == "ForYouNudgeCard_cardWrapper__bkg9g":
@@ -361,7 +440,7 @@ class GlassdoorJobListingsPage(JobListingsPage):
     confirm_more_job_listings_timeout = 10.0
     start_time = time.time()
     while time.time() - start_time < confirm_more_job_listings_timeout:
-      ending_li_count = len(self._get_job_listings_ul().find_elements(By.TAG_NAME, "li"))
+      ending_li_count = self.__get_job_listing_li_count()
       if starting_li_count != ending_li_count:
         break
     if starting_li_count == ending_li_count:
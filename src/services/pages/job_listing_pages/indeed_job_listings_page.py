@@ -11,13 +11,13 @@ from selenium.common.exceptions import (
 )
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from entities.job_listings.abc_job_listing import JobListing
-from entities.job_listings.indeed_job_listing import IndeedJobListing
+from entities.job_listing import JobListing
 from exceptions.job_listing_is_advertisement_exception import JobListingIsAdvertisementException
 from exceptions.job_listing_opens_in_window_exception import JobListingOpensInWindowException
 from exceptions.no_more_job_listings_exception import NoMoreJobListingsException
 from models.enums.element_type import ElementType
 from models.enums.platform import Platform
+from services.job_listing_parsers.indeed_job_listing_parser import IndeedJobListingParser
 from services.pages.job_listing_pages.abc_job_listings_page import JobListingsPage
 
 
@@ -35,6 +35,12 @@ class IndeedJobListingsPage(JobListingsPage):
   def _get_platform(self) -> Platform:
     return Platform.INDEED
 
+  def _build_job_listing_parser(self) -> IndeedJobListingParser:
+    return IndeedJobListingParser(
+      self._language_parser,
+      self._description_pipeline.get_html_text_extractor()
+    )
+
   def _is_zero_results(self, timeout=10.0) -> bool:
     return False  # TODO
 
@@ -79,11 +85,10 @@ class IndeedJobListingsPage(JobListingsPage):
     assert url
     return url
 
-  def _build_brief_job_listing(self, job_listing_li: WebElement, url: str, timeout=30.0) -> IndeedJobListing | None:
+  def _build_brief_job_listing(self, job_listing_li: WebElement, url: str, timeout=30.0) -> JobListing | None:
     try:
       self._selenium_helper.scroll_into_view(job_listing_li)
-      job_listing = IndeedJobListing(
-        self._language_parser,
+      job_listing = self._job_listing_parser.parse(
         url,
         job_listing_li
       )
@@ -91,7 +96,7 @@ class IndeedJobListingsPage(JobListingsPage):
     except NoSuchElementException as e:
       raise NoMoreJobListingsException from e
 
-  def _add_job_listing_to_db(self, job_listing: IndeedJobListing) -> None:
+  def _add_job_listing_to_db(self, job_listing: JobListing) -> None:
     self._database_manager.create_new_job_listing(
       job_listing,
       Platform.INDEED
@@ -138,17 +143,22 @@ class IndeedJobListingsPage(JobListingsPage):
     # Could maybe do better, but its really hard to not trigger botting checkpoints
     return self._build_brief_job_listing_url(job_listing_li)
 
-  def _build_job_listing(self, url: str, job_listing_li: WebElement, job_details_div: WebElement, timeout=10.0) -> JobListing:
+  def _build_job_listing(
+    self,
+    url: str,
+    job_listing_li: WebElement,
+    job_details_div: WebElement,
+    timeout=10.0
+  ) -> Tuple[JobListing, str | None]:
     start_time = time.time()
     while time.time() - start_time < timeout:
       try:
-        job_listing = IndeedJobListing(
-          self._language_parser,
+        job_listing, raw_description = self._job_listing_parser.parse_without_description(
           url,
           job_listing_li,
           job_details_div
         )
-        return job_listing
+        return (job_listing, raw_description)
       except StaleElementReferenceException as e:
         if "indeed.com/viewjob" in self._driver.current_url:
           raise JobListingOpensInWindowException() from e
@@ -13,8 +13,7 @@ from selenium.common.exceptions import (
   StaleElementReferenceException,
   TimeoutException
 )
-from entities.job_listings.abc_job_listing import JobListing
-from entities.job_listings.linkedin_job_listing import LinkedinJobListing
+from entities.job_listing import JobListing
 from exceptions.job_details_didnt_load_exception import JobDetailsDidntLoadException
 from exceptions.no_more_job_listings_exception import NoMoreJobListingsException
 from exceptions.no_results_data_exception import NoResultsDataException
@@ -23,6 +22,7 @@ from exceptions.something_went_wrong_page_exception import SomethingWentWrongPag
 from exceptions.zero_search_results_exception import ZeroSearchResultsException
 from models.enums.element_type import ElementType
 from models.enums.platform import Platform
+from services.job_listing_parsers.linkedin_job_listing_parser import LinkedinJobListingParser
 from services.pages.job_listing_pages.abc_job_listings_page import JobListingsPage
 
 
@@ -41,6 +41,12 @@ class LinkedinJobListingsPage(JobListingsPage):
   def _get_platform(self) -> Platform:
     return Platform.LINKEDIN
 
+  def _build_job_listing_parser(self) -> LinkedinJobListingParser:
+    return LinkedinJobListingParser(
+      self._language_parser,
+      self._description_pipeline.get_html_text_extractor()
+    )
+
   def _is_zero_results(self, timeout=30.0) -> bool:
     results_div_selector = ".jobs-search-results-list__subtitle"
     results_regex = r"([0-9]+)\ result"
@@ -93,13 +99,12 @@ class LinkedinJobListingsPage(JobListingsPage):
     url = f"https://www.linkedin.com/jobs/view/{job_id}"
     return url
 
-  def _build_brief_job_listing(self, job_listing_li: WebElement, url: str, timeout=4.0) -> LinkedinJobListing:
+  def _build_brief_job_listing(self, job_listing_li: WebElement, url: str, timeout=4.0) -> JobListing:
     start_time = time.time()
     while time.time() - start_time < timeout:
       try:
         self._selenium_helper.scroll_into_view(job_listing_li)
-        job_listing = LinkedinJobListing(
-          self._language_parser,
+        job_listing = self._job_listing_parser.parse(
           url,
           job_listing_li
         )
@@ -121,20 +126,19 @@ class LinkedinJobListingsPage(JobListingsPage):
     job_listing_li: WebElement,
     job_details_div: WebElement,
     timeout=10
-  ) -> LinkedinJobListing:
+  ) -> Tuple[JobListing, str | None]:
     start_time = time.time()
     while time.time() - start_time < timeout:
       try:
         self._selenium_helper.scroll_into_view(job_listing_li)
         job_header_div = self.__get_job_header_div()
-        job_listing = LinkedinJobListing(
-          self._language_parser,
+        job_listing, raw_description = self._job_listing_parser.parse_without_description(
           url,
           job_listing_li,
           job_details_div,
           job_header_div
         )
-        return job_listing
+        return (job_listing, raw_description)
       except NoSuchElementException:
         logging.warning("NoSuchElementException while trying to build job listing. Trying again...")
         time.sleep(0.1)
@@ -17,6 +17,9 @@ class LinkedinLoginPage:
     self.__selenium_helper = selenium_helper
     self.__linkedin_config = linkedin_config
 
+  def set_driver(self, driver: uc.Chrome) -> None:
+    self.__driver = driver
+
   def login(self) -> None:
     logging.debug("Logging in...")
     self.__driver.get("https://linkedin.com/login")
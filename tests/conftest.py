@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modules import each other relative to src/, the same way main.py runs them
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
@@ -0,0 +1,15 @@
+import pytest
+from dacite import from_dict
+from exceptions.invalid_profile_name_exception import InvalidProfileNameException
+from models.configs.full_config import FullConfig
+
+
+def test_profiles_load():
+  config = from_dict(data_class=FullConfig, data={"profiles": [{"name": "jane"}, {"name": "john"}]})
+  assert [profile.name for profile in config.profiles] == ["jane", "john"]
+
+
+@pytest.mark.parametrize("profile_names", [["default"], ["jane", "jane"], ["jane", "john", "default"]])
+def test_invalid_profile_names_are_rejected(profile_names):
+  with pytest.raises(InvalidProfileNameException):
+    from_dict(data_class=FullConfig, data={"profiles": [{"name": profile_name} for profile_name in profile_names]})
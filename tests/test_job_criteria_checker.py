@@ -0,0 +1,47 @@
+from entities.job_listing import JobListing
+from models.configs.quick_settings import QuickSettings
+from models.configs.universal_config import UniversalConfig
+from models.enums.ignore_category import IgnoreCategory
+from models.enums.ignore_type import IgnoreType
+from models.enums.language import Language
+from services.misc.job_criteria_checker import JobCriteriaChecker
+
+
+def build_configs(stage_order: list, reorder_every: int = 100):
+  quick_settings = QuickSettings()
+  quick_settings.bot_behavior.job_listing_criteria.is_in_ideal = True
+  quick_settings.bot_behavior.filter_pipeline.stage_order = stage_order
+  quick_settings.bot_behavior.filter_pipeline.reorder_every = reorder_every
+  universal_config = UniversalConfig()
+  universal_config.bot_behavior.ideal.titles = ["python"]
+  universal_config.bot_behavior.ignore.titles = ["senior"]
+  universal_config.search.salary.min = 100000
+  return (quick_settings, universal_config)
+
+
+def build_job_listing(title: str, max_pay: float | None = None) -> JobListing:
+  return JobListing(title, "Acme", "Remote", "https://example.test", Language.ENGLISH, max_pay=max_pay)
+
+
+def test_verdict_ignores_stage_order():
+  job_listing = build_job_listing("Senior Java Dev", 60000.0)
+  for stage_order in ([], ["pay", "yoe"], ["title", "pay"], ["yoe", "location", "company", "title"]):
+    verdict = JobCriteriaChecker().evaluate(*build_configs(stage_order), job_listing)
+    assert verdict.get_ignore_type() == IgnoreType.NOT_IN_IDEAL
+
+
+def test_verdict_survives_adaptive_reorder():
+  quick_settings, universal_config = build_configs(["pay", "yoe"], reorder_every=10)
+  criteria_checker = JobCriteriaChecker()
+  # Only the title stage rejects these, so it gets moved to the front
+  for index in range(50):
+    criteria_checker.evaluate(quick_settings, universal_config, build_job_listing(f"Senior Python Dev {index}"))
+  verdict = criteria_checker.evaluate(quick_settings, universal_config, build_job_listing("Senior Java Dev", 60000.0))
+  assert verdict.get_ignore_type() == IgnoreType.NOT_IN_IDEAL
+  verdict = criteria_checker.evaluate(quick_settings, universal_config, build_job_listing("Senior Python Dev", 60000.0))
+  assert (verdict.get_ignore_category(), verdict.get_ignore_term()) == (IgnoreCategory.TITLE, "senior")
+
+
+def test_passing_listing():
+  verdict = JobCriteriaChecker().evaluate(*build_configs([]), build_job_listing("Python Dev", 150000.0))
+  assert verdict.passes()
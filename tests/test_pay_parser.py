@@ -0,0 +1,47 @@
+import pytest
+from models.enums.pay_period import PayPeriod
+from services.misc.pay_parser import PayParser
+
+
+# (raw pay text as shown on the platform, require_period, expected (min, max, period))
+PAY_TEXT_CASES = [
+  ("$80K - $120K (Employer est.)", False, (80000.0, 120000.0, PayPeriod.ANNUAL)),
+  ("$100K (Employer est.)", False, (100000.0, 100000.0, PayPeriod.ANNUAL)),
+  ("$25.00 - $35.00 Per Hour (Employer est.)", False, (52000.0, 72800.0, PayPeriod.HOURLY)),
+  ("$30.00 Per Hour (Glassdoor est.)", False, (62400.0, 62400.0, PayPeriod.HOURLY)),
+  ("$25 - $30", False, (52000.0, 62400.0, PayPeriod.HOURLY)),
+  ("$50,000 - $70,000 a year", False, (50000.0, 70000.0, PayPeriod.ANNUAL)),
+  ("$65,000 a year", False, (65000.0, 65000.0, PayPeriod.ANNUAL)),
+  ("$20 - $25 an hour", False, (41600.0, 52000.0, PayPeriod.HOURLY)),
+  ("$20 to $25 an hour", False, (41600.0, 52000.0, PayPeriod.HOURLY)),
+  ("$20 – $25 an hour", False, (41600.0, 52000.0, PayPeriod.HOURLY)),
+  ("From $18 an hour", False, (37440.0, 37440.0, PayPeriod.HOURLY)),
+  ("Up to $40 an hour", False, (None, 83200.0, PayPeriod.HOURLY)),
+  ("$3,000 - $4,000 a month", False, (36000.0, 48000.0, PayPeriod.MONTHLY)),
+  ("$1,200 a week", False, (62400.0, 62400.0, PayPeriod.WEEKLY)),
+  ("$200 per day", False, (52000.0, 52000.0, PayPeriod.DAILY)),
+  ("$50/hr - $60/hr", True, (104000.0, 124800.0, PayPeriod.HOURLY)),
+  ("$45.50/hr", True, (94640.0, 94640.0, PayPeriod.HOURLY)),
+  ("$100K/yr - $120K/yr", True, (100000.0, 120000.0, PayPeriod.ANNUAL)),
+  ("$100K/yr - $120K/yr · 401(k), Medical", True, (100000.0, 120000.0, PayPeriod.ANNUAL)),
+  ("Up to $120K/yr", True, (None, 120000.0, PayPeriod.ANNUAL)),
+  ("$90K", True, (None, None, None)),
+  ("Medical, Vision, Dental", True, (None, None, None)),
+  ("", False, (None, None, None)),
+  # Amounts that aren't part of the pay range
+  ("Up to $80,000 a year plus $10,000 bonus", False, (None, 80000.0, PayPeriod.ANNUAL)),
+  ("$1,000 signing bonus. $90,000 - $110,000 per year", False, (90000.0, 110000.0, PayPeriod.ANNUAL)),
+  ("$95,000 - $105,000 a year, $5,000 relocation", False, (95000.0, 105000.0, PayPeriod.ANNUAL)),
+  ("$120K - $80K", False, (80000.0, 120000.0, PayPeriod.ANNUAL))
+]
+
+
+@pytest.mark.parametrize("raw_pay, require_period, expected_pay", PAY_TEXT_CASES)
+def test_parse(raw_pay, require_period, expected_pay):
+  assert PayParser().parse(raw_pay, require_period) == expected_pay
+
+
+@pytest.mark.parametrize("raw_pay, require_period, _", PAY_TEXT_CASES)
+def test_parse_never_inverts_range(raw_pay, require_period, _):
+  min_pay, max_pay, _ = PayParser().parse(raw_pay, require_period)
+  assert min_pay is None or max_pay is None or min_pay <= max_pay
@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from services.misc.post_time_parser import PostTimeParser
+
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+
+# (relative time text as shown on the platform, expected age or None when it can't be parsed)
+POST_TIME_TEXT_CASES = [
+  ("3 minutes ago", timedelta(minutes=3)),
+  ("1 min ago", timedelta(minutes=1)),
+  ("5 hours ago", timedelta(hours=5)),
+  ("Reposted 2 weeks ago", timedelta(weeks=2)),
+  ("2 months ago", timedelta(weeks=2 * 4.345)),
+  ("1 year ago", timedelta(weeks=52)),
+  ("24h", timedelta(hours=24)),
+  ("30d+", timedelta(days=30)),
+  ("Posted 30+ days ago", timedelta(days=30)),
+  ("30+ days ago", timedelta(days=30)),
+  ("an hour ago", timedelta(hours=1)),
+  ("a minute ago", timedelta(minutes=1)),
+  ("Posted a day ago", timedelta(days=1)),
+  ("Reposted a week ago", timedelta(weeks=1)),
+  ("a month ago", timedelta(weeks=4.345)),
+  ("Just posted", timedelta()),
+  ("Today", timedelta()),
+  ("Active recruiting", None),
+  ("Data analyst", None),
+  ("", None),
+  (None, None),
+]
+
+
+@pytest.mark.parametrize("relative_time_text,expected_age", POST_TIME_TEXT_CASES)
+def test_parse(relative_time_text, expected_age):
+  post_time = PostTimeParser().parse(relative_time_text, NOW)
+  if expected_age is None:
+    assert post_time is None
+  else:
+    assert post_time == NOW - expected_age
+
+
+def test_parse_counts_missing_post_times():
+  post_time_parser = PostTimeParser()
+  post_time_parser.parse("an hour ago", NOW)
+  post_time_parser.parse("Active recruiting", NOW)
+  post_time_parser.parse(None, NOW)
+  assert post_time_parser.get_missing_post_time_count() == 2
@@ -0,0 +1,180 @@
+import asyncio
+import socket
+import threading
+import time
+import pytest
+from models.configs.system_config import ProxyConfig, ProxyHealthConfig
+from models.enums.platform import Platform
+from services.misc.proxy_manager import ProxyManager
+from services.misc.proxy_prober import ProxyProber
+
+
+TARGET_HOST = "example.test"
+TARGET_PORT = 80
+RESPONSE_BODY = b"x" * 4096
+
+
+# Minimal no-auth SOCKS5 server (RFC 1928) that answers the proxied HTTP request itself instead of dialing out
+class Socks5StandIn:
+  def __init__(self, host: str, reply_delay_seconds: float = 0.0):
+    self.host = host
+    self.reply_delay_seconds = reply_delay_seconds
+    self.connect_requests = []
+    self.port = None
+    self.__loop = asyncio.new_event_loop()
+    self.__server = None
+    self.__ready = threading.Event()
+    self.__thread = threading.Thread(target=self.__run, daemon=True)
+
+  def start(self) -> "Socks5StandIn":
+    self.__thread.start()
+    self.__ready.wait(5)
+    return self
+
+  def stop(self) -> None:
+    asyncio.run_coroutine_threadsafe(self.__shutdown(), self.__loop).result(5)
+    self.__loop.call_soon_threadsafe(self.__loop.stop)
+    self.__thread.join(5)
+    self.__loop.close()
+
+  def __run(self) -> None:
+    asyncio.set_event_loop(self.__loop)
+    self.__server = self.__loop.run_until_complete(asyncio.start_server(self.__handle, self.host, 0))
+    self.port = self.__server.sockets[0].getsockname()[1]
+    self.__ready.set()
+    self.__loop.run_forever()
+
+  # Handlers still sleeping on a slow reply are cancelled so the loop closes cleanly
+  async def __shutdown(self) -> None:
+    self.__server.close()
+    handlers = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+    for handler in handlers:
+      handler.cancel()
+    await asyncio.gather(*handlers, return_exceptions=True)
+
+  async def __handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+      version, method_count = await reader.readexactly(2)
+      methods = await reader.readexactly(method_count)
+      assert version == 5 and 0 in methods
+      await asyncio.sleep(self.reply_delay_seconds)
+      writer.write(b"\x05\x00")
+      _, command, _, address_type = await reader.readexactly(4)
+      assert command == 1 and address_type == 3
+      host_length = (await reader.readexactly(1))[0]
+      host = (await reader.readexactly(host_length)).decode()
+      port = int.from_bytes(await reader.readexactly(2), "big")
+      self.connect_requests.append((host, port))
+      writer.write(b"\x05\x00\x00\x01\x7f\x00\x00\x01\x00\x50")
+      await reader.readuntil(b"\r\n\r\n")
+      writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n" % len(RESPONSE_BODY) + RESPONSE_BODY)
+      await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+      pass
+    finally:
+      writer.close()
+
+
+class FakeDatabaseManager:
+  def get_last_rate_limit_times(self):
+    return []
+
+  def log_rate_limit_block(self, ip_address, platform):
+    pass
+
+
+def build_proxy_health_config(timeout_seconds: float, rate_limit_cooldown_seconds: float = 3600.0) -> ProxyHealthConfig:
+  return ProxyHealthConfig(
+    enabled=True,
+    timeout_seconds=timeout_seconds,
+    rate_limit_cooldown_seconds=rate_limit_cooldown_seconds,
+    target_host=TARGET_HOST,
+    target_port=TARGET_PORT,
+    target_path="/"
+  )
+
+
+def get_dead_port(host: str = "127.0.0.1") -> int:
+  with socket.socket() as dead_socket:
+    dead_socket.bind((host, 0))
+    return dead_socket.getsockname()[1]
+
+
+@pytest.fixture
+def socks5_stand_in():
+  stand_ins = []
+  def start(host: str = "127.0.0.1", reply_delay_seconds: float = 0.0) -> Socks5StandIn:
+    stand_in = Socks5StandIn(host, reply_delay_seconds).start()
+    stand_ins.append(stand_in)
+    return stand_in
+  yield start
+  for stand_in in stand_ins:
+    stand_in.stop()
+
+
+def test_healthy_proxy(socks5_stand_in):
+  stand_in = socks5_stand_in()
+  proxy_health = asyncio.run(ProxyProber(build_proxy_health_config(2.0)).probe(ProxyConfig("127.0.0.1", stand_in.port)))
+  assert proxy_health.healthy
+  assert proxy_health.connect_latency is not None and proxy_health.connect_latency < 2.0
+  assert proxy_health.throughput and proxy_health.throughput > 0
+  assert stand_in.connect_requests == [(TARGET_HOST, TARGET_PORT)]
+
+
+def test_refused_proxy():
+  proxy_health = asyncio.run(ProxyProber(build_proxy_health_config(2.0)).probe(ProxyConfig("127.0.0.1", get_dead_port())))
+  assert not proxy_health.healthy
+  assert proxy_health.connect_latency is None
+
+
+def test_slow_proxy_times_out(socks5_stand_in):
+  stand_in = socks5_stand_in(reply_delay_seconds=2.0)
+  proxy_health = asyncio.run(ProxyProber(build_proxy_health_config(0.3)).probe(ProxyConfig("127.0.0.1", stand_in.port)))
+  assert not proxy_health.healthy
+
+
+def test_probe_all_covers_every_proxy(socks5_stand_in):
+  stand_in = socks5_stand_in()
+  proxies = [ProxyConfig("127.0.0.1", stand_in.port), ProxyConfig("127.0.0.1", get_dead_port())]
+  proxy_healths = ProxyProber(build_proxy_health_config(2.0)).probe_all(proxies)
+  assert {key: proxy_health.healthy for key, proxy_health in proxy_healths.items()} == {
+    ("127.0.0.1", proxies[0].port): True,
+    ("127.0.0.1", proxies[1].port): False
+  }
+
+
+# Rate limits are remembered per host, so each proxy gets its own loopback address
+def test_proxy_manager_ranks_probe_results(socks5_stand_in):
+  fast_proxy = ProxyConfig("127.0.0.2", socks5_stand_in("127.0.0.2").port)
+  slow_proxy = ProxyConfig("127.0.0.3", socks5_stand_in("127.0.0.3", reply_delay_seconds=0.3).port)
+  dead_proxy = ProxyConfig("127.0.0.4", get_dead_port("127.0.0.4"))
+  proxy_manager = ProxyManager(
+    [dead_proxy, slow_proxy, fast_proxy],
+    FakeDatabaseManager(),
+    build_proxy_health_config(2.0)
+  )
+  # Healthy proxies go fastest first, and a dead one is never picked while any other is left
+  assert proxy_manager.get_best_proxy(Platform.LINKEDIN) == fast_proxy
+  assert proxy_manager.get_standby_proxy(Platform.LINKEDIN) == slow_proxy
+  # A rate limited proxy drops behind healthy ones, but stays ahead of dead ones
+  proxy_manager.log_rate_limit_block(Platform.LINKEDIN)
+  assert proxy_manager.get_best_proxy(Platform.LINKEDIN) == slow_proxy
+  proxy_manager.log_rate_limit_block(Platform.LINKEDIN)
+  assert proxy_manager.get_best_proxy(Platform.LINKEDIN) == fast_proxy
+  assert proxy_manager.has_fresh_proxy(Platform.LINKEDIN) is False
+
+
+def test_proxy_manager_reranks_when_cooldown_ends(socks5_stand_in):
+  fast_proxy = ProxyConfig("127.0.0.2", socks5_stand_in("127.0.0.2").port)
+  slow_proxy = ProxyConfig("127.0.0.3", socks5_stand_in("127.0.0.3", reply_delay_seconds=0.3).port)
+  proxy_manager = ProxyManager(
+    [slow_proxy, fast_proxy],
+    FakeDatabaseManager(),
+    build_proxy_health_config(2.0, rate_limit_cooldown_seconds=0.5)
+  )
+  assert proxy_manager.get_best_proxy(Platform.LINKEDIN) == fast_proxy
+  proxy_manager.log_rate_limit_block(Platform.LINKEDIN)
+  assert proxy_manager.get_best_proxy(Platform.LINKEDIN) == slow_proxy
+  # Nothing probes or rate limits in between, the cooldown running out is enough
+  time.sleep(0.6)
+  assert proxy_manager.get_best_proxy(Platform.LINKEDIN) == fast_proxy